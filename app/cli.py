@@ -0,0 +1,669 @@
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from multiprocessing.util import Finalize
+from fastapi import HTTPException
+from app.core.config import settings
+from app.core.cpu import available_cpus
+from app.core.document_context import DocumentContext
+from app.core.http_client import http_client
+from app.core.rules import load_rules, rulebook
+from app.core.validation import FileValidator
+from app.models.schemas import FraudDetectionResult
+from app.services.ai_detection import AIContentDetectionService
+from app.services.contact_verification import ContactVerificationService
+from app.services.document_analysis import DocumentAnalysisService
+from app.services.document_processor import DocumentProcessor
+from app.services.fraud_scorer import RISK_LEVEL_ORDER, FraudScoringService
+
+STAGES = ["read", "extraction", "contact", "ai", "document", "scoring"]
+
+TABULAR_FIELDS = [
+    "id",
+    "path",
+    "error",
+    "overall_risk_score",
+    "risk_level",
+    "confidence",
+    "contact_risk_score",
+    "contact_confidence",
+    "ai_probability",
+    "ai_confidence",
+    "detection_method",
+    "document_risk_score",
+    "document_confidence",
+    "detected_issues",
+] + [f"{stage}_ms" for stage in STAGES]
+
+
+def iter_directory(root: str) -> Iterator[Tuple[str, str]]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().split(".")[-1] in settings.ALLOWED_FILE_TYPES:
+                path = os.path.join(dirpath, filename)
+                yield os.path.relpath(path, root), path
+
+
+def iter_manifest(manifest_path: str) -> Iterator[Tuple[str, str]]:
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            path = entry["path"]
+            if not os.path.isabs(path):
+                path = os.path.join(base_dir, path)
+            yield str(entry.get("id") or entry["path"]), path
+
+
+_runner: Optional[asyncio.Runner] = None
+
+
+def run_async(coro):
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+        Finalize(None, close_runner, exitpriority=10)
+    return _runner.run(coro)
+
+
+def close_runner() -> None:
+    global _runner
+    if _runner is not None:
+        _runner.run(http_client.aclose())
+        _runner.close()
+        _runner = None
+
+
+async def _analyze_context(
+    context: DocumentContext, timings: Dict[str, float]
+) -> FraudDetectionResult:
+    rules = rulebook.current
+    contact_service = ContactVerificationService()
+    ai_service = AIContentDetectionService()
+
+    start = time.perf_counter()
+    contact_result = await contact_service.verify_contact_info(context, rules=rules)
+    timings["contact"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    ai_result = await ai_service.detect_ai_content(context, rules)
+    timings["ai"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    document_result = DocumentAnalysisService.analyze_document_authenticity(
+        context.metadata, rules
+    )
+    timings["document"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    fraud_result = FraudScoringService.calculate_overall_risk(
+        contact_result, ai_result, document_result, rules
+    )
+    result = FraudDetectionResult(**fraud_result)
+    timings["scoring"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def score_document(task: Tuple[str, str]) -> Dict[str, Any]:
+    doc_id, path = task
+    timings: Dict[str, float] = {}
+    record: Dict[str, Any] = {"id": doc_id, "path": path, "timings": timings}
+
+    try:
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            file_content = f.read()
+        filename = os.path.basename(path)
+        FileValidator.validate_content(filename, file_content)
+        timings["read"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        document_data = DocumentProcessor.extract_sync(file_content, filename)
+        context = DocumentContext.from_document_data(document_data, file_content)
+        timings["extraction"] = (time.perf_counter() - start) * 1000
+
+        result = run_async(_analyze_context(context, timings))
+        record["content_hash"] = context.content_hash
+        record["text_fingerprint"] = context.fingerprint
+        record["result"] = result.model_dump(mode="json")
+    except HTTPException as e:
+        record["error"] = e.detail
+    except Exception as e:
+        record["error"] = f"Processing error: {str(e)}"
+
+    return record
+
+
+def flatten_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    result = record.get("result") or {}
+    contact = result.get("contact_verification") or {}
+    ai = result.get("ai_content_analysis") or {}
+    document = result.get("document_analysis") or {}
+    timings = record.get("timings", {})
+
+    row = {
+        "id": record["id"],
+        "path": record["path"],
+        "error": record.get("error"),
+        "overall_risk_score": result.get("overall_risk_score"),
+        "risk_level": result.get("risk_level"),
+        "confidence": result.get("confidence"),
+        "contact_risk_score": contact.get("risk_score"),
+        "contact_confidence": contact.get("confidence"),
+        "ai_probability": ai.get("overall_ai_probability"),
+        "ai_confidence": ai.get("confidence"),
+        "detection_method": ai.get("detection_method"),
+        "document_risk_score": document.get("risk_score"),
+        "document_confidence": document.get("confidence"),
+        "detected_issues": "; ".join(result.get("detected_issues", [])),
+    }
+    for stage in STAGES:
+        row[f"{stage}_ms"] = timings.get(stage)
+    return row
+
+
+class JsonlWriter:
+    def __init__(self, path: str):
+        self._file = open(path, "a")
+
+    def write(self, record: Dict[str, Any]) -> List[str]:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        return [record["id"]]
+
+    def close(self) -> List[str]:
+        self._file.close()
+        return []
+
+
+class CsvWriter:
+    def __init__(self, path: str):
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=TABULAR_FIELDS)
+        if is_new:
+            self._writer.writeheader()
+
+    def write(self, record: Dict[str, Any]) -> List[str]:
+        self._writer.writerow(flatten_record(record))
+        self._file.flush()
+        return [record["id"]]
+
+    def close(self) -> List[str]:
+        self._file.close()
+        return []
+
+
+class ParquetWriter:
+    ROW_GROUP_SIZE = 1000
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Parquet output requires pyarrow: pip install pyarrow")
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._path = self._next_part_path(path)
+        self._rows: List[Dict[str, Any]] = []
+        self._writer = None
+
+    @staticmethod
+    def _next_part_path(path: str) -> str:
+        if not os.path.exists(path):
+            return path
+        root, ext = os.path.splitext(path)
+        part = 1
+        while os.path.exists(f"{root}.part{part}{ext}"):
+            part += 1
+        return f"{root}.part{part}{ext}"
+
+    def write(self, record: Dict[str, Any]) -> List[str]:
+        self._rows.append(flatten_record(record))
+        if len(self._rows) >= self.ROW_GROUP_SIZE:
+            return self._flush()
+        return []
+
+    def _flush(self) -> List[str]:
+        if not self._rows:
+            return []
+        table = self._pa.Table.from_pylist(self._rows)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+        flushed_ids = [row["id"] for row in self._rows]
+        self._rows = []
+        return flushed_ids
+
+    def close(self) -> List[str]:
+        flushed_ids = self._flush()
+        if self._writer is not None:
+            self._writer.close()
+        return flushed_ids
+
+
+WRITERS = {"jsonl": JsonlWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+
+class ProgressReporter:
+    def __init__(self, interval: float, stream=sys.stderr):
+        self.interval = interval
+        self.stream = stream
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.processed = 0
+        self.errors = 0
+        self.skipped = 0
+        self.stage_totals = {stage: 0.0 for stage in STAGES}
+
+    def record(self, record: Dict[str, Any]) -> None:
+        self.processed += 1
+        if record.get("error"):
+            self.errors += 1
+        for stage, elapsed in record.get("timings", {}).items():
+            self.stage_totals[stage] += elapsed
+
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "processed": self.processed,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "elapsed_seconds": round(elapsed, 3),
+            "docs_per_second": round(self.processed / elapsed, 2) if elapsed else 0.0,
+            "mean_stage_ms": {
+                stage: round(total / self.processed, 3) if self.processed else 0.0
+                for stage, total in self.stage_totals.items()
+            },
+        }
+
+    def report(self) -> None:
+        summary = self.summary()
+        stages = " ".join(
+            f"{stage}={ms:.1f}ms" for stage, ms in summary["mean_stage_ms"].items()
+        )
+        print(
+            f"processed={summary['processed']} errors={summary['errors']} "
+            f"skipped={summary['skipped']} "
+            f"rate={summary['docs_per_second']:.1f} docs/sec {stages}",
+            file=self.stream,
+            flush=True,
+        )
+
+
+def load_checkpoint(path: str) -> set:
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def run_score(args: argparse.Namespace) -> Dict[str, Any]:
+    if os.path.isdir(args.input):
+        tasks = iter_directory(args.input)
+    else:
+        tasks = iter_manifest(args.input)
+
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint"
+    completed = load_checkpoint(checkpoint_path)
+    workers = args.workers or available_cpus()
+    window = workers * 4
+
+    reporter = ProgressReporter(args.progress_interval)
+    writer = WRITERS[args.format](args.output)
+    checkpoint = open(checkpoint_path, "a")
+
+    def pending_tasks() -> Iterator[Tuple[str, str]]:
+        for doc_id, path in tasks:
+            if doc_id in completed:
+                reporter.skipped += 1
+                continue
+            yield doc_id, path
+
+    def mark_completed(doc_ids: List[str]) -> None:
+        for doc_id in doc_ids:
+            checkpoint.write(doc_id + "\n")
+        checkpoint.flush()
+
+    def handle(record: Dict[str, Any]) -> None:
+        mark_completed(writer.write(record))
+        reporter.record(record)
+
+    try:
+        if workers == 1:
+            for task in pending_tasks():
+                handle(score_document(task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                in_flight = set()
+                for task in pending_tasks():
+                    in_flight.add(executor.submit(score_document, task))
+                    if len(in_flight) >= window:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            handle(future.result())
+                for future in wait(in_flight).done:
+                    handle(future.result())
+    finally:
+        close_runner()
+        mark_completed(writer.close())
+        checkpoint.close()
+
+    reporter.report()
+    return reporter.summary()
+
+
+def run_corpus(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.testing.corpus import generate_corpus, write_corpus
+
+    resumes = generate_corpus(
+        args.count,
+        seed=args.seed,
+        formats=args.formats.split(","),
+        sizes=args.sizes.split(","),
+        structures=args.structures.split(","),
+        fraud_rate=args.fraud_rate,
+    )
+    return write_corpus(args.output, resumes)
+
+
+def run_replay(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.testing.replay import replay
+
+    return asyncio.run(
+        replay(
+            args.capture_dir,
+            target=args.target,
+            speed=args.speed,
+            concurrency=args.concurrency,
+            api_key=args.api_key,
+            latency_scale=args.upstream_latency,
+            rate_limits=not args.no_rate_limits,
+            limit=args.limit,
+        )
+    )
+
+
+RESCORE_FIELDS = [
+    "contact_risk_score",
+    "ai_probability",
+    "document_risk_score",
+    "contact_confidence",
+    "ai_confidence",
+    "document_confidence",
+    "overall_risk_score",
+]
+
+LEVEL_CODES = {level.value: code for code, level in enumerate(RISK_LEVEL_ORDER)}
+
+
+def _float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def is_sqlite(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(16) == b"SQLite format 3\x00"
+
+
+def iter_score_rows(
+    path: str, batch_size: int = 100000, **filters
+) -> Iterator[List[Tuple]]:
+    if is_sqlite(path):
+        from app.core.result_store import ResultStore
+
+        store = ResultStore(path, batch_size, 1.0, 0)
+        try:
+            yield from store.iter_stage_scores(batch_size, **filters)
+        finally:
+            store.close()
+        return
+
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (flatten_record(json.loads(line)) for line in f if line.strip())
+
+        batch = []
+        for row in rows:
+            if row.get("error") or _float(row.get("overall_risk_score")) is None:
+                continue
+            batch.append(
+                (row["id"], *[_float(row.get(field)) for field in RESCORE_FIELDS])
+                + (LEVEL_CODES.get(row.get("risk_level"), -1),)
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def run_rescore(args: argparse.Namespace) -> Dict[str, Any]:
+    import numpy as np
+
+    rules = load_rules(args.rules) if args.rules else rulebook.current
+    weights = dict(rules.weights)
+    for stage in weights:
+        override = getattr(args, f"{stage}_weight")
+        if override is not None:
+            weights[stage] = override
+    thresholds = (
+        (
+            args.medium_threshold
+            if args.medium_threshold is not None
+            else rules.thresholds[0]
+        ),
+        (
+            args.high_threshold
+            if args.high_threshold is not None
+            else rules.thresholds[1]
+        ),
+    )
+    filters = {
+        "since": datetime.fromisoformat(args.since) if args.since else None,
+        "until": datetime.fromisoformat(args.until) if args.until else None,
+    }
+
+    start = time.perf_counter()
+    ids: List[Any] = []
+    chunks = []
+    for batch in iter_score_rows(args.source, **filters):
+        ids.extend(row[0] for row in batch)
+        chunks.append(np.array([row[1:] for row in batch], dtype=np.float64))
+    data = (
+        np.concatenate(chunks)
+        if chunks
+        else np.empty((0, len(RESCORE_FIELDS) + 1), dtype=np.float64)
+    )
+    load_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    rescored = FraudScoringService.score_batch(
+        {"contact": data[:, 0], "ai": data[:, 1], "document": data[:, 2]},
+        {"contact": data[:, 3], "ai": data[:, 4], "document": data[:, 5]},
+        weights,
+        thresholds,
+    )
+    before = data[:, 7].astype(np.int8)
+    shift = FraudScoringService.risk_level_shift(before, rescored["risk_level"])
+    delta = rescored["overall_risk_score"] - data[:, 6]
+    rescore_ms = (time.perf_counter() - start) * 1000
+
+    if args.changes:
+        changed = np.flatnonzero(before != rescored["risk_level"])
+        names = [level.value for level in RISK_LEVEL_ORDER]
+        with open(args.changes, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "before", "after", "before_score", "after_score"])
+            for index in changed:
+                writer.writerow(
+                    [
+                        ids[index],
+                        names[before[index]] if before[index] >= 0 else "",
+                        names[rescored["risk_level"][index]],
+                        round(float(data[index, 6]), 6),
+                        round(float(rescored["overall_risk_score"][index]), 6),
+                    ]
+                )
+
+    return {
+        "results": len(ids),
+        "rule_version": rules.version,
+        "weights": weights,
+        "thresholds": {"medium": thresholds[0], "high": thresholds[1]},
+        **shift,
+        "score_delta": {
+            "mean": round(float(delta.mean()), 6) if len(ids) else 0.0,
+            "max_abs": round(float(np.abs(delta).max()), 6) if len(ids) else 0.0,
+        },
+        "load_ms": round(load_ms, 1),
+        "rescore_ms": round(rescore_ms, 1),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli", description="Resume fraud detection tools"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    score = subparsers.add_parser(
+        "score", help="Score a directory of resumes or a JSONL manifest offline"
+    )
+    score.add_argument("input", help="Directory to walk or JSONL manifest of paths")
+    score.add_argument("--output", "-o", required=True, help="Results file")
+    score.add_argument("--format", choices=sorted(WRITERS), default="jsonl")
+    score.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=0,
+        help="Worker processes (default: available CPUs, honouring the cgroup quota)",
+    )
+    score.add_argument(
+        "--checkpoint", help="Checkpoint file (default: <output>.checkpoint)"
+    )
+    score.add_argument(
+        "--progress-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between throughput reports",
+    )
+    score.set_defaults(handler=run_score)
+
+    corpus = subparsers.add_parser(
+        "corpus", help="Generate a labelled synthetic resume corpus with a manifest"
+    )
+    corpus.add_argument("output", help="Directory for the files and manifest.jsonl")
+    corpus.add_argument("--count", "-n", type=int, default=100)
+    corpus.add_argument("--seed", type=int, default=0)
+    corpus.add_argument("--formats", default="pdf,docx,txt")
+    corpus.add_argument("--sizes", default="short,standard,long,huge")
+    corpus.add_argument("--structures", default="plain,tables,images")
+    corpus.add_argument(
+        "--fraud-rate",
+        type=float,
+        default=0.3,
+        help="Share of resumes carrying injected fraud signals",
+    )
+    corpus.set_defaults(handler=run_corpus)
+
+    replay = subparsers.add_parser(
+        "replay",
+        help="Re-drive captured traffic with upstream responses served from the capture",
+    )
+    replay.add_argument("capture_dir", help="CAPTURE_DIR of a capture-enabled server")
+    replay.add_argument(
+        "--target",
+        help="Base URL of a running instance started with UPSTREAM_REPLAY_DIR; "
+        "defaults to the app in-process",
+    )
+    replay.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Timing multiplier: 1 is original pacing, 10 is ten times faster, "
+        "0 sends back to back",
+    )
+    replay.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Concurrent requests when --speed is 0",
+    )
+    replay.add_argument(
+        "--upstream-latency",
+        type=float,
+        default=1.0,
+        help="Multiplier for recorded upstream latency, 0 to answer immediately",
+    )
+    replay.add_argument(
+        "--api-key", help="X-API-Key sent for requests that carried one when captured"
+    )
+    replay.add_argument(
+        "--no-rate-limits",
+        action="store_true",
+        help="Disable per-IP rate limits for in-process replay",
+    )
+    replay.add_argument("--limit", type=int, help="Replay only the first N requests")
+    replay.set_defaults(handler=run_replay)
+
+    rescore = subparsers.add_parser(
+        "rescore",
+        help="Re-score stored results with new weights or thresholds and report "
+        "the risk level shift",
+    )
+    rescore.add_argument(
+        "source",
+        help="RESULT_STORE_PATH database, or JSONL/CSV output of the score command",
+    )
+    rescore.add_argument(
+        "--rules", help="Rules file to take weights and thresholds from"
+    )
+    rescore.add_argument("--contact-weight", type=float)
+    rescore.add_argument("--ai-weight", type=float)
+    rescore.add_argument("--document-weight", type=float)
+    rescore.add_argument("--medium-threshold", type=float)
+    rescore.add_argument("--high-threshold", type=float)
+    rescore.add_argument("--since", help="ISO 8601 start, result store only")
+    rescore.add_argument("--until", help="ISO 8601 end, result store only")
+    rescore.add_argument(
+        "--changes", help="Write a CSV of results whose risk level changed"
+    )
+    rescore.set_defaults(handler=run_rescore)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    result = args.handler(args)
+    if result is not None:
+        print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
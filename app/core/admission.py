@@ -0,0 +1,134 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from fastapi import HTTPException
+from app.core.config import settings
+from app.core.priority import Priority, PriorityGate, current_priority
+
+
+class AdmissionRejected(HTTPException):
+    def __init__(self, lane: str, retry_after: int):
+        super().__init__(
+            status_code=503,
+            detail=f"Server is busy ({lane}), please retry later",
+            headers={"Retry-After": str(retry_after)},
+        )
+        self.lane = lane
+        self.retry_after = retry_after
+
+
+class AdaptiveLimiter:
+    INCREASE = 1.0
+    DECREASE = 0.9
+    LATENCY_SMOOTHING = 0.2
+    MAX_RETRY_AFTER = 60
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        target_latency: float,
+        max_queue_wait: float,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+    ):
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit or initial_limit * 4
+        self.target_latency = target_latency
+        self.max_queue_wait = max_queue_wait
+        self.rejected = 0
+        self.avg_latency: Optional[float] = None
+        self.gate = PriorityGate(initial_limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self.gate.in_use
+
+    @property
+    def waiting(self) -> int:
+        return self.gate.waiting
+
+    def estimated_wait(self) -> float:
+        if self.avg_latency is None:
+            return 0.0
+
+        if current_priority.get() == Priority.INTERACTIVE:
+            ahead = self.gate.waiting_for(Priority.INTERACTIVE)
+        else:
+            ahead = self.waiting
+        return (ahead + 1) * self.avg_latency / max(int(self.limit), 1)
+
+    def retry_after(self) -> int:
+        seconds = math.ceil(max(self.estimated_wait(), 1.0))
+        return min(seconds, self.MAX_RETRY_AFTER)
+
+    async def acquire(self) -> None:
+        if self.gate.has_capacity():
+            await self.gate.acquire()
+            return
+
+        if self.estimated_wait() > self.max_queue_wait:
+            self.rejected += 1
+            raise AdmissionRejected(self.name, self.retry_after())
+
+        try:
+            await self.gate.acquire(timeout=self.max_queue_wait)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise AdmissionRejected(self.name, self.retry_after())
+
+    def release(self, latency: float) -> None:
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency += self.LATENCY_SMOOTHING * (latency - self.avg_latency)
+
+        if latency <= self.target_latency:
+            self.limit = min(self.limit + self.INCREASE / self.limit, self.max_limit)
+        else:
+            self.limit = max(self.limit * self.DECREASE, self.min_limit)
+
+        self.gate.capacity = int(self.limit)
+        self.gate.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator["AdaptiveLimiter"]:
+        await self.acquire()
+        start = time.monotonic()
+        try:
+            yield self
+        finally:
+            self.release(time.monotonic() - start)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "avg_latency_ms": round((self.avg_latency or 0.0) * 1000, 1),
+        }
+
+
+lanes: Dict[str, AdaptiveLimiter] = {
+    "cpu": AdaptiveLimiter(
+        "cpu",
+        settings.ADMISSION_CPU_LIMIT,
+        settings.ADMISSION_CPU_TARGET_LATENCY,
+        settings.ADMISSION_MAX_QUEUE_WAIT,
+    ),
+    "upstream": AdaptiveLimiter(
+        "upstream",
+        settings.ADMISSION_UPSTREAM_LIMIT,
+        settings.ADMISSION_UPSTREAM_TARGET_LATENCY,
+        settings.ADMISSION_MAX_QUEUE_WAIT,
+    ),
+}
+
+
+def admission_lane(name: str) -> AdaptiveLimiter:
+    return lanes[name]
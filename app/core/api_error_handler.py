@@ -1,6 +1,7 @@
 import logging
 from typing import Dict, Any, Tuple
 from enum import Enum
+from app.core.metrics import record_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,7 @@ class APIErrorHandler:
     @staticmethod
     def handle_api_response(service_name: str, response) -> Tuple[bool, Dict[str, Any]]:
         if response.status_code == 200:
+            record_upstream(service_name, "success")
             return True, {}
 
         try:
@@ -88,5 +90,6 @@ class APIErrorHandler:
         APIErrorHandler.log_api_error(
             service_name, response.status_code, error_info, response_data
         )
+        record_upstream(service_name, error_info["type"].value)
 
         return False, error_info
@@ -1,13 +1,33 @@
+import re
 import time
-from typing import Any, Optional, Dict
+import weakref
+from collections import Counter
+from typing import Any, Optional, Dict, Tuple
 import hashlib
+from app.core.sanitizer import CONTROL_CHARS_PATTERN
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def text_fingerprint(text: str) -> str:
+    normalized = CONTROL_CHARS_PATTERN.sub("", text or "")
+    normalized = WHITESPACE_PATTERN.sub(" ", normalized).strip().casefold()
+    return hashlib.md5(normalized.encode()).hexdigest()
+
+
+def cache_namespace(key: str) -> str:
+    return key.split(":", 1)[0]
 
 
 class SimpleCache:
+    instances: "weakref.WeakSet[SimpleCache]" = weakref.WeakSet()
+
     def __init__(self, default_ttl: int = 3600):
         self._cache: Dict[str, Dict[str, Any]] = {}
         self.default_ttl = default_ttl
         self._stats = {"hits": 0, "misses": 0, "sets": 0}
+        self.operations: Counter = Counter()
+        SimpleCache.instances.add(self)
 
     def _generate_key(self, prefix: str, data: str) -> str:
         hash_obj = hashlib.md5(data.encode())
@@ -18,16 +38,20 @@ class SimpleCache:
             entry = self._cache[key]
             if time.time() < entry["expires"]:
                 self._stats["hits"] += 1
+                self.operations[cache_namespace(key), "hit"] += 1
                 return entry["value"]
             else:
                 del self._cache[key]
+                self.operations[cache_namespace(key), "eviction"] += 1
         self._stats["misses"] += 1
+        self.operations[cache_namespace(key), "miss"] += 1
         return None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         expires = time.time() + (ttl or self.default_ttl)
         self._cache[key] = {"value": value, "expires": expires}
         self._stats["sets"] += 1
+        self.operations[cache_namespace(key), "set"] += 1
 
     def delete(self, key: str) -> None:
         self._cache.pop(key, None)
@@ -48,17 +72,63 @@ class SimpleCache:
         }
 
     def cache_document_result(
-        self, file_content: bytes, result: Any, ttl: int = 1800
+        self,
+        file_content: bytes,
+        result: Any,
+        ttl: int = 1800,
+        content_hash: Optional[str] = None,
+        rule_version: str = "",
     ) -> str:
-        content_hash = hashlib.md5(file_content).hexdigest()
-        key = f"doc:{content_hash}"
+        content_hash = content_hash or hashlib.md5(file_content).hexdigest()
+        key = f"doc:{rule_version}:{content_hash}"
         self.set(key, result, ttl)
         return key
 
-    def get_document_result(self, file_content: bytes) -> Optional[Any]:
-        content_hash = hashlib.md5(file_content).hexdigest()
-        key = f"doc:{content_hash}"
+    def get_document_result(
+        self,
+        file_content: bytes,
+        content_hash: Optional[str] = None,
+        rule_version: str = "",
+    ) -> Optional[Any]:
+        content_hash = content_hash or hashlib.md5(file_content).hexdigest()
+        key = f"doc:{rule_version}:{content_hash}"
         return self.get(key)
 
+    def cache_text_result(
+        self, fingerprint: str, result: Any, ttl: int = 1800, rule_version: str = ""
+    ) -> str:
+        key = f"text:{rule_version}:{fingerprint}"
+        self.set(key, result, ttl)
+        return key
+
+    def get_text_result(
+        self, fingerprint: str, rule_version: str = ""
+    ) -> Optional[Any]:
+        return self.get(f"text:{rule_version}:{fingerprint}")
+
+    def cache_response(
+        self,
+        content_hash: str,
+        client_ip: Optional[str],
+        body: bytes,
+        ttl: int = 1800,
+        rule_version: str = "",
+        record: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        key = f"response:{rule_version}:{content_hash}:{client_ip or ''}"
+        self.set(key, (body, record), ttl)
+        return key
+
+    def get_response_entry(
+        self, content_hash: str, client_ip: Optional[str], rule_version: str = ""
+    ) -> Optional[Tuple[bytes, Optional[Dict[str, Any]]]]:
+        return self.get(f"response:{rule_version}:{content_hash}:{client_ip or ''}")
+
+    def get_response(
+        self, content_hash: str, client_ip: Optional[str], rule_version: str = ""
+    ) -> Optional[bytes]:
+        entry = self.get_response_entry(content_hash, client_ip, rule_version)
+        return entry[0] if entry is not None else None
+
 
 cache = SimpleCache()
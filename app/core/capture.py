@@ -0,0 +1,312 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CAPTURED_HEADERS = ("user-agent", "x-forwarded-for", "x-priority", "x-profile")
+REDACTED_PARAMS = {"api_key"}
+FILES_DIR = "files"
+
+active_request: ContextVar[Optional[str]] = ContextVar("active_request", default=None)
+
+
+def upstream_services() -> List[Tuple[str, str]]:
+    return [
+        ("abstract_email", settings.ABSTRACT_EMAIL_API),
+        ("abstract_phone", settings.ABSTRACT_PHONE_API),
+        ("abstract_ip", settings.ABSTRACT_IP_API),
+        ("winston_ai", settings.WINSTON_AI_API),
+    ]
+
+
+def upstream_service(url: str) -> str:
+    for name, base_url in upstream_services():
+        if url.startswith(base_url.split("?")[0]):
+            return name
+    return url.split("?")[0]
+
+
+def upstream_key(method: str, url, body: bytes) -> str:
+    params = sorted(
+        (key, value)
+        for key, value in url.params.multi_items()
+        if key not in REDACTED_PARAMS
+    )
+    base_url = str(url.copy_with(query=None))
+    return " ".join(
+        [
+            upstream_service(base_url),
+            method,
+            urlencode(params),
+            hashlib.sha256(body).hexdigest()[:16],
+        ]
+    )
+
+
+def file_path(directory: str, content_hash: str) -> str:
+    return os.path.join(directory, FILES_DIR, content_hash)
+
+
+class TrafficCapture:
+    def __init__(
+        self,
+        enabled: bool,
+        directory: str,
+        max_bytes: int,
+        backups: int,
+        store_files: bool,
+        max_body: int,
+        path_prefix: str = "/api/",
+    ):
+        self.enabled = enabled
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.store_files = store_files
+        self.max_body = max_body
+        self.path_prefix = path_prefix
+        self._handler: Optional[RotatingFileHandler] = None
+        self._pid: Optional[int] = None
+
+    def should_capture(self, scope) -> bool:
+        return (
+            self.enabled
+            and scope["type"] == "http"
+            and scope["path"].startswith(self.path_prefix)
+        )
+
+    def _log_handler(self) -> RotatingFileHandler:
+        if self._handler is None or self._pid != os.getpid():
+            os.makedirs(self.directory, exist_ok=True)
+            self._pid = os.getpid()
+            self._handler = RotatingFileHandler(
+                os.path.join(self.directory, f"capture-{self._pid}.jsonl"),
+                maxBytes=self.max_bytes,
+                backupCount=self.backups,
+                delay=True,
+            )
+        return self._handler
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, separators=(",", ":"))
+        self._log_handler().handle(logging.makeLogRecord({"msg": line}))
+
+    def close(self) -> None:
+        if self._handler is not None:
+            self._handler.close()
+            self._handler = None
+
+    def start_request(self, scope) -> Dict[str, Any]:
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        client = scope.get("client")
+        return {
+            "type": "request",
+            "id": uuid.uuid4().hex[:16],
+            "pid": os.getpid(),
+            "ts": time.time(),
+            "method": scope["method"],
+            "path": scope["path"],
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "client": client[0] if client else None,
+            "headers": {
+                name: headers[name] for name in CAPTURED_HEADERS if name in headers
+            },
+            "api_key": "x-api-key" in headers,
+            "content_type": headers.get("content-type", ""),
+            "status": None,
+        }
+
+    def _store(self, content: bytes) -> str:
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = file_path(self.directory, content_hash)
+        if self.store_files and not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return content_hash
+
+    async def _form(
+        self, content_type: str, body: bytes
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        from starlette.datastructures import Headers, UploadFile
+        from starlette.formparsers import MultiPartParser
+
+        async def stream():
+            yield body
+
+        form = await MultiPartParser(
+            Headers({"content-type": content_type}), stream()
+        ).parse()
+
+        parts, fields = [], {}
+        for name, value in form.multi_items():
+            if isinstance(value, UploadFile):
+                content = await value.read()
+                content_hash = await asyncio.to_thread(self._store, content)
+                parts.append(
+                    {
+                        "field": name,
+                        "filename": value.filename,
+                        "content_type": value.content_type,
+                        "sha256": content_hash,
+                        "bytes": len(content),
+                        "ref": f"{FILES_DIR}/{content_hash}"
+                        if self.store_files
+                        else None,
+                    }
+                )
+            else:
+                fields[name] = value
+        await form.close()
+        return parts, fields
+
+    async def finish_request(self, entry: Dict[str, Any], body: bytes) -> None:
+        content_type = entry.pop("content_type")
+        if len(body) > self.max_body:
+            entry["truncated"] = True
+        elif content_type.startswith("multipart/form-data"):
+            try:
+                entry["parts"], entry["fields"] = await self._form(content_type, body)
+            except Exception as e:
+                entry["parse_error"] = str(e)
+        elif body:
+            entry["body_sha256"] = await asyncio.to_thread(self._store, body)
+            entry["content_type"] = content_type
+        await asyncio.to_thread(self.write, entry)
+
+    def record_upstream(
+        self, request, request_body: bytes, response, content: bytes, elapsed_ms: float
+    ) -> None:
+        self.write(
+            {
+                "type": "upstream",
+                "request_id": active_request.get(),
+                "ts": time.time(),
+                "key": upstream_key(request.method, request.url, request_body),
+                "service": upstream_service(str(request.url.copy_with(query=None))),
+                "status": response.status_code,
+                "content_type": response.headers.get("content-type", ""),
+                "body": content.decode("utf-8", errors="replace"),
+                "elapsed_ms": round(elapsed_ms, 3),
+            }
+        )
+
+
+class CaptureMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not traffic_capture.should_capture(scope):
+            await self.app(scope, receive, send)
+            return
+
+        entry = traffic_capture.start_request(scope)
+        token = active_request.set(entry["id"])
+        body = bytearray()
+        response_bytes = 0
+        start = time.perf_counter()
+
+        async def receive_capturing():
+            message = await receive()
+            if message["type"] == "http.request" and len(body) <= (
+                traffic_capture.max_body
+            ):
+                body.extend(message.get("body", b""))
+            return message
+
+        async def send_capturing(message):
+            nonlocal response_bytes
+            if message["type"] == "http.response.start":
+                entry["status"] = message["status"]
+                entry["ttfb_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_capturing, send_capturing)
+        finally:
+            active_request.reset(token)
+            entry["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            entry["response_bytes"] = response_bytes
+            try:
+                await traffic_capture.finish_request(entry, bytes(body))
+            except Exception as e:
+                logger.warning(f"Traffic capture failed for {entry['path']}: {e}")
+
+
+class CaptureTransport:
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        import httpx
+
+        request_body = await request.aread()
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if traffic_capture.enabled:
+            try:
+                await asyncio.to_thread(
+                    traffic_capture.record_upstream,
+                    request,
+                    request_body,
+                    response,
+                    content,
+                    elapsed_ms,
+                )
+            except Exception as e:
+                logger.warning(f"Upstream capture failed: {e}")
+
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length")
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+traffic_capture = TrafficCapture(
+    settings.CAPTURE_ENABLED,
+    settings.CAPTURE_DIR,
+    settings.CAPTURE_MAX_BYTES,
+    settings.CAPTURE_BACKUPS,
+    settings.CAPTURE_FILES,
+    settings.CAPTURE_MAX_BODY,
+)
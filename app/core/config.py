@@ -1,29 +1,146 @@
 from decouple import config
 import logging
+import os
+import tempfile
+from app.core.cpu import available_cpus
+
+
+UPSTREAM_SIMULATOR: bool = config("UPSTREAM_SIMULATOR", default=False, cast=bool)
+UPSTREAM_SIMULATOR_URL: str = config(
+    "UPSTREAM_SIMULATOR_URL",
+    default="http://upstream-simulator" if UPSTREAM_SIMULATOR else "",
+).rstrip("/")
+UPSTREAM_REPLAY_DIR: str = config("UPSTREAM_REPLAY_DIR", default="")
+SIMULATOR_API_KEY = "simulator" if UPSTREAM_SIMULATOR_URL or UPSTREAM_REPLAY_DIR else ""
+
+
+def upstream_url(name: str, url: str, simulator_path: str) -> str:
+    if UPSTREAM_SIMULATOR_URL:
+        url = f"{UPSTREAM_SIMULATOR_URL}{simulator_path}"
+    return config(name, default=url)
 
 
 class Settings:
-    ABSTRACT_EMAIL_API_KEY: str = config("ABSTRACT_EMAIL_API_KEY", default="")
-    ABSTRACT_PHONE_API_KEY: str = config("ABSTRACT_PHONE_API_KEY", default="")
-    ABSTRACT_IP_API_KEY: str = config("ABSTRACT_IP_API_KEY", default="")
-    WINSTON_AI_API_KEY: str = config("WINSTON_AI_API_KEY", default="")
+    ABSTRACT_EMAIL_API_KEY: str = config(
+        "ABSTRACT_EMAIL_API_KEY", default=SIMULATOR_API_KEY
+    )
+    ABSTRACT_PHONE_API_KEY: str = config(
+        "ABSTRACT_PHONE_API_KEY", default=SIMULATOR_API_KEY
+    )
+    ABSTRACT_IP_API_KEY: str = config("ABSTRACT_IP_API_KEY", default=SIMULATOR_API_KEY)
+    WINSTON_AI_API_KEY: str = config("WINSTON_AI_API_KEY", default=SIMULATOR_API_KEY)
     DEBUG: bool = config("DEBUG", default=False, cast=bool)
     DOCS_ENABLED: bool = config("DOCS_ENABLED", default=False, cast=bool)
 
     MAX_FILE_SIZE: int = 10485760
     ALLOWED_FILE_TYPES = ["pdf", "docx", "txt"]
 
-    ABSTRACT_EMAIL_API = "https://emailvalidation.abstractapi.com/v1/"
-    ABSTRACT_PHONE_API = "https://phonevalidation.abstractapi.com/v1/"
-    ABSTRACT_IP_API = "https://ipgeolocation.abstractapi.com/v1/"
-    WINSTON_AI_API = "https://api.gowinston.ai/v2/ai-content-detection"
+    PARSE_WORKERS: int = config("PARSE_WORKERS", default=available_cpus(), cast=int)
+    UPSTREAM_MAX_CONCURRENCY: int = config(
+        "UPSTREAM_MAX_CONCURRENCY", default=10, cast=int
+    )
+    BATCH_CONCURRENCY: int = config("BATCH_CONCURRENCY", default=8, cast=int)
+    BATCH_MAX_ITEMS: int = config("BATCH_MAX_ITEMS", default=1000, cast=int)
+    JOB_WORKERS: int = config("JOB_WORKERS", default=4, cast=int)
+    JOB_QUEUE_SIZE: int = config("JOB_QUEUE_SIZE", default=50, cast=int)
+    JOB_RESULT_TTL: int = config("JOB_RESULT_TTL", default=3600, cast=int)
+    JOB_STORE_PATH: str = config("JOB_STORE_PATH", default="")
+
+    ADMISSION_CPU_LIMIT: int = config(
+        "ADMISSION_CPU_LIMIT", default=max(PARSE_WORKERS, 1) * 2, cast=int
+    )
+    ADMISSION_UPSTREAM_LIMIT: int = config(
+        "ADMISSION_UPSTREAM_LIMIT", default=20, cast=int
+    )
+    ADMISSION_CPU_TARGET_LATENCY: float = config(
+        "ADMISSION_CPU_TARGET_LATENCY", default=2.0, cast=float
+    )
+    ADMISSION_UPSTREAM_TARGET_LATENCY: float = config(
+        "ADMISSION_UPSTREAM_TARGET_LATENCY", default=5.0, cast=float
+    )
+    ADMISSION_MAX_QUEUE_WAIT: float = config(
+        "ADMISSION_MAX_QUEUE_WAIT", default=2.0, cast=float
+    )
+
+    PRIORITY_BULK_SHARE: float = config("PRIORITY_BULK_SHARE", default=0.2, cast=float)
+    PRIORITY_BULK_PATHS = ["/api/v1/detect/batch", "/api/v1/jobs"]
+    PRIORITY_BULK_API_KEYS: str = config("PRIORITY_BULK_API_KEYS", default="")
+
+    SHUTDOWN_DRAIN_TIMEOUT: float = config(
+        "SHUTDOWN_DRAIN_TIMEOUT", default=30.0, cast=float
+    )
+
+    ADMIN_API_KEY: str = config("ADMIN_API_KEY", default="")
+    PROFILE_SAMPLE_RATE: int = config("PROFILE_SAMPLE_RATE", default=0, cast=int)
+    PROFILE_INTERVAL_MS: float = config("PROFILE_INTERVAL_MS", default=5.0, cast=float)
+    PROFILE_KEEP: int = config("PROFILE_KEEP", default=50, cast=int)
+    PROFILE_DIR: str = config(
+        "PROFILE_DIR",
+        default=os.path.join(tempfile.gettempdir(), "resume-fraud-profiles"),
+    )
+
+    METRICS_SAMPLE_INTERVAL: float = config(
+        "METRICS_SAMPLE_INTERVAL", default=1.0, cast=float
+    )
+
+    RESULT_STORE_PATH: str = config("RESULT_STORE_PATH", default="")
+    RESULT_STORE_BATCH_SIZE: int = config(
+        "RESULT_STORE_BATCH_SIZE", default=200, cast=int
+    )
+    RESULT_STORE_FLUSH_INTERVAL: float = config(
+        "RESULT_STORE_FLUSH_INTERVAL", default=1.0, cast=float
+    )
+    RESULT_STORE_MAX_PENDING: int = config(
+        "RESULT_STORE_MAX_PENDING", default=10000, cast=int
+    )
+
+    CAPTURE_ENABLED: bool = config("CAPTURE_ENABLED", default=False, cast=bool)
+    CAPTURE_DIR: str = config(
+        "CAPTURE_DIR",
+        default=os.path.join(tempfile.gettempdir(), "resume-fraud-capture"),
+    )
+    CAPTURE_MAX_BYTES: int = config("CAPTURE_MAX_BYTES", default=52428800, cast=int)
+    CAPTURE_BACKUPS: int = config("CAPTURE_BACKUPS", default=5, cast=int)
+    CAPTURE_FILES: bool = config("CAPTURE_FILES", default=True, cast=bool)
+    CAPTURE_MAX_BODY: int = config("CAPTURE_MAX_BODY", default=67108864, cast=int)
+
+    RULES_PATH: str = config("RULES_PATH", default="")
+    RULES_RELOAD_INTERVAL: float = config(
+        "RULES_RELOAD_INTERVAL", default=2.0, cast=float
+    )
+
+    RATE_LIMIT_STORAGE_URI: str = config("RATE_LIMIT_STORAGE_URI", default="memory://")
+    RATE_LIMIT_STRATEGY: str = config("RATE_LIMIT_STRATEGY", default="moving-window")
+    RATE_LIMITS = {
+        "service": config("RATE_LIMIT_SERVICE", default="10/minute"),
+        "detect": config("RATE_LIMIT_DETECT", default="5/minute"),
+        "batch": config("RATE_LIMIT_BATCH", default="2/minute"),
+        "jobs": config("RATE_LIMIT_JOBS", default="20/minute"),
+    }
+    RATE_LIMIT_API_KEYS: str = config("RATE_LIMIT_API_KEYS", default="")
 
-    CONTACT_WEIGHT = 0.45
-    AI_CONTENT_WEIGHT = 0.35
-    DOCUMENT_WEIGHT = 0.20
+    UPSTREAM_SIMULATOR: bool = UPSTREAM_SIMULATOR
+    UPSTREAM_SIMULATOR_CONFIG: str = config("UPSTREAM_SIMULATOR_CONFIG", default="")
+    UPSTREAM_REPLAY_DIR: str = UPSTREAM_REPLAY_DIR
 
-    HIGH_RISK_THRESHOLD = 0.60
-    MEDIUM_RISK_THRESHOLD = 0.35
+    ABSTRACT_EMAIL_API = upstream_url(
+        "ABSTRACT_EMAIL_API",
+        "https://emailvalidation.abstractapi.com/v1/",
+        "/email/v1/",
+    )
+    ABSTRACT_PHONE_API = upstream_url(
+        "ABSTRACT_PHONE_API",
+        "https://phonevalidation.abstractapi.com/v1/",
+        "/phone/v1/",
+    )
+    ABSTRACT_IP_API = upstream_url(
+        "ABSTRACT_IP_API", "https://ipgeolocation.abstractapi.com/v1/", "/ip/v1/"
+    )
+    WINSTON_AI_API = upstream_url(
+        "WINSTON_AI_API",
+        "https://api.gowinston.ai/v2/ai-content-detection",
+        "/winston/v2/ai-content-detection",
+    )
 
 
 settings = Settings()
@@ -0,0 +1,84 @@
+import hashlib
+from typing import Any, Dict, Optional, Union
+from app.core.cache import text_fingerprint
+from app.core.sanitizer import InputSanitizer
+
+
+class DocumentContext:
+    MAX_TEXT_LENGTH = 5000
+
+    __slots__ = (
+        "raw_text",
+        "metadata",
+        "_content_hash",
+        "_text",
+        "_lower",
+        "_fingerprint",
+    )
+
+    def __init__(
+        self,
+        raw_text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+    ):
+        object.__setattr__(self, "raw_text", raw_text or "")
+        object.__setattr__(self, "metadata", metadata or {})
+        object.__setattr__(self, "_content_hash", content_hash)
+        for slot in ("_text", "_lower", "_fingerprint"):
+            object.__setattr__(self, slot, None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DocumentContext is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("DocumentContext is immutable")
+
+    @classmethod
+    def from_document_data(
+        cls,
+        document_data: Dict[str, Any],
+        file_content: Optional[bytes] = None,
+        content_hash: Optional[str] = None,
+    ) -> "DocumentContext":
+        if content_hash is None and file_content is not None:
+            content_hash = hashlib.md5(file_content).hexdigest()
+        return cls(document_data["text"], document_data["metadata"], content_hash)
+
+    @classmethod
+    def coerce(cls, value: Union[str, "DocumentContext"]) -> "DocumentContext":
+        if isinstance(value, DocumentContext):
+            return value
+        return cls(value)
+
+    def _memoize(self, slot: str, value):
+        object.__setattr__(self, slot, value)
+        return value
+
+    @property
+    def content_hash(self) -> str:
+        if self._content_hash is not None:
+            return self._content_hash
+        return self._memoize(
+            "_content_hash", hashlib.md5(self.raw_text.encode()).hexdigest()
+        )
+
+    @property
+    def text(self) -> str:
+        if self._text is not None:
+            return self._text
+        return self._memoize(
+            "_text", InputSanitizer.sanitize_text(self.raw_text, self.MAX_TEXT_LENGTH)
+        )
+
+    @property
+    def lower(self) -> str:
+        if self._lower is not None:
+            return self._lower
+        return self._memoize("_lower", self.text.lower())
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is not None:
+            return self._fingerprint
+        return self._memoize("_fingerprint", text_fingerprint(self.raw_text))
@@ -0,0 +1,477 @@
+import math
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
+
+PDF_DATE_PATTERN = re.compile(r"D:(\d{14})(?:(Z)|([+-])(\d{2})'?(\d{2})?'?)?")
+BACKREFERENCE_PATTERN = re.compile(r"\\[1-9]|\(\?P=")
+
+Timestamp = Tuple[datetime, Optional[int]]
+Check = Callable[[Dict[str, Any], Dict[str, Optional[Timestamp]]], Optional[bool]]
+NumericInput = Callable[
+    [Dict[str, Any], Dict[str, Optional[Timestamp]]], Optional[float]
+]
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: Any) -> Optional[Timestamp]:
+    if isinstance(value, datetime):
+        offset = value.utcoffset()
+        if offset is None:
+            return value, None
+        return value.replace(tzinfo=None) - offset, int(offset.total_seconds() // 60)
+
+    if not isinstance(value, str) or not value:
+        return None
+
+    try:
+        match = PDF_DATE_PATTERN.match(value)
+        if not match:
+            return parse_timestamp(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+        moment = datetime.strptime(match.group(1), "%Y%m%d%H%M%S")
+        if match.group(2):
+            return moment, 0
+        if not match.group(3):
+            return moment, None
+        minutes = int(match.group(4)) * 60 + int(match.group(5) or 0)
+        if match.group(3) == "-":
+            minutes = -minutes
+        return moment - timedelta(minutes=minutes), minutes
+    except ValueError:
+        return None
+
+
+def document_values(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    values = dict(metadata)
+    values["creator_software"] = metadata.get("creator") or metadata.get("producer")
+    return values
+
+
+class DocumentRule(NamedTuple):
+    id: str
+    score: float
+    message: str
+    field: Optional[str]
+    formats: Optional[FrozenSet[str]]
+    skip_formats: FrozenSet[str]
+    indicator: Optional[str]
+
+    def applies_to(self, document_format: str) -> bool:
+        if document_format in self.skip_formats:
+            return False
+        return self.formats is None or document_format in self.formats
+
+    def render(self, values: Dict[str, Any]) -> str:
+        if "{value}" not in self.message:
+            return self.message
+        return self.message.replace("{value}", str(values.get(self.field)))
+
+
+class Evaluation(NamedTuple):
+    indicators: Dict[str, bool]
+    messages: List[str]
+    contributions: Dict[str, float]
+    score: float
+
+
+class StringMatcher(NamedTuple):
+    field: str
+    pattern: Pattern
+    rules_by_needle: Dict[str, FrozenSet[int]]
+    indicators: Tuple[int, ...]
+
+
+class PatternGroup(NamedTuple):
+    field: str
+    guard: Optional[Pattern]
+    rules: Tuple[Tuple[int, Pattern], ...]
+    indicators: Tuple[int, ...]
+
+
+class NumericGroup(NamedTuple):
+    value: NumericInput
+    rules: Tuple[Tuple[int, float, float], ...]
+    indicators: Tuple[int, ...]
+
+
+class PlanStage(NamedTuple):
+    matchers: Tuple[StringMatcher, ...]
+    patterns: Tuple[PatternGroup, ...]
+    numeric: Tuple[NumericGroup, ...]
+    checks: Tuple[Tuple[int, Check], ...]
+    timestamp_fields: Tuple[str, ...]
+
+
+def _require(spec: Dict[str, Any], name: str) -> Any:
+    if spec.get(name) in (None, "", []):
+        raise ValueError(f"Rule '{spec.get('id')}' needs '{name}'")
+    return spec[name]
+
+
+def _number(spec: Dict[str, Any], name: str) -> Optional[float]:
+    value = spec.get(name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Rule '{spec.get('id')}': '{name}' must be a number")
+    return float(value)
+
+
+def _bounds(spec: Dict[str, Any]) -> Tuple[float, float]:
+    below, above = _number(spec, "below"), _number(spec, "above")
+    if below is None and above is None:
+        raise ValueError(f"Rule '{spec.get('id')}' needs 'below' or 'above'")
+    return (
+        -math.inf if above is None else above,
+        math.inf if below is None else below,
+    )
+
+
+def _pair(spec: Dict[str, Any]) -> Tuple[str, str]:
+    fields = _require(spec, "fields")
+    if not isinstance(fields, list) or len(fields) != 2:
+        raise ValueError(f"Rule '{spec.get('id')}': 'fields' must name two fields")
+    return fields[0], fields[1]
+
+
+def _pattern(spec: Dict[str, Any]) -> Pattern:
+    try:
+        return re.compile(_require(spec, "pattern"), re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Rule '{spec.get('id')}': invalid pattern ({e})")
+
+
+def _missing(spec: Dict[str, Any]) -> Check:
+    field = _require(spec, "field")
+
+    def check(values, timestamps):
+        value = values.get(field)
+        return value is None or (isinstance(value, str) and not value.strip())
+
+    return check
+
+
+def _timezone_mismatch(spec: Dict[str, Any]) -> Check:
+    first, second = _pair(spec)
+
+    def check(values, timestamps):
+        a, b = timestamps[first], timestamps[second]
+        if a is None or b is None or a[1] is None or b[1] is None:
+            return None
+        return a[1] != b[1]
+
+    return check
+
+
+def _field_mismatch(spec: Dict[str, Any]) -> Check:
+    first, second = _pair(spec)
+
+    def check(values, timestamps):
+        a, b = values.get(first), values.get(second)
+        if not isinstance(a, str) or not isinstance(b, str):
+            return None
+        a, b = a.strip().lower(), b.strip().lower()
+        if not a or not b:
+            return None
+        return a != b
+
+    return check
+
+
+def _timestamp_gap(spec: Dict[str, Any]) -> Tuple[Tuple, NumericInput, List[str]]:
+    start, end = _require(spec, "from"), _require(spec, "to")
+    absolute = bool(spec.get("absolute", True))
+
+    def value(values, timestamps):
+        first, second = timestamps[start], timestamps[end]
+        if first is None or second is None:
+            return None
+        gap = (second[0] - first[0]).total_seconds()
+        return abs(gap) if absolute else gap
+
+    return ("timestamp_gap", start, end, absolute), value, [start, end]
+
+
+def _ratio(spec: Dict[str, Any]) -> Tuple[Tuple, NumericInput, List[str]]:
+    numerator, denominator = _require(spec, "numerator"), _require(spec, "denominator")
+
+    def value(values, timestamps):
+        top, bottom = values.get(numerator), values.get(denominator)
+        if not isinstance(top, (int, float)) or not isinstance(bottom, (int, float)):
+            return None
+        return top / bottom if bottom > 0 else None
+
+    return ("ratio", numerator, denominator), value, []
+
+
+CHECKS: Dict[str, Callable[[Dict[str, Any]], Check]] = {
+    "missing": _missing,
+    "timezone_mismatch": _timezone_mismatch,
+    "field_mismatch": _field_mismatch,
+}
+
+NUMERIC_INPUTS = {"timestamp_gap": _timestamp_gap, "ratio": _ratio}
+
+
+def _string_matcher(
+    field: str, needles: Dict[str, Set[int]], active: Set[int], indicators: Set[int]
+) -> Optional[StringMatcher]:
+    needles = {
+        needle: indices & active
+        for needle, indices in needles.items()
+        if indices & active
+    }
+    if not needles:
+        return None
+    ordered = sorted(needles, key=len, reverse=True)
+    return StringMatcher(
+        field,
+        re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))"),
+        {
+            needle: frozenset(
+                index
+                for other, indices in needles.items()
+                if other in needle
+                for index in indices
+            )
+            for needle in ordered
+        },
+        tuple(
+            sorted(
+                {index for indices in needles.values() for index in indices}
+                & indicators
+            )
+        ),
+    )
+
+
+def _pattern_group(
+    field: str,
+    rules: List[Tuple[int, Pattern]],
+    active: Set[int],
+    indicators: Set[int],
+) -> Optional[PatternGroup]:
+    rules = [(index, pattern) for index, pattern in rules if index in active]
+    if not rules:
+        return None
+    guard = None
+    if len(rules) > 1 and not any(
+        BACKREFERENCE_PATTERN.search(pattern.pattern) for _, pattern in rules
+    ):
+        try:
+            guard = re.compile(
+                "|".join(f"(?:{pattern.pattern})" for _, pattern in rules),
+                re.IGNORECASE,
+            )
+        except re.error:
+            guard = None
+    return PatternGroup(
+        field,
+        guard,
+        tuple(rules),
+        tuple(index for index, _ in rules if index in indicators),
+    )
+
+
+class DocumentRulePlan:
+    def __init__(self, rules: List[Dict[str, Any]], confidence: float):
+        self.confidence = confidence
+        self.rules: List[DocumentRule] = []
+        self._needles: Dict[str, Dict[str, Set[int]]] = {}
+        self._patterns: Dict[str, List[Tuple[int, Pattern]]] = {}
+        self._numeric: Dict[Tuple, Tuple[NumericInput, List]] = {}
+        self._checks: List[Tuple[int, Check]] = []
+        self._timestamp_fields: Dict[int, List[str]] = {}
+        self._stages: Dict[str, PlanStage] = {}
+
+        seen = set()
+        for spec in rules:
+            if not isinstance(spec, dict):
+                raise ValueError("Document rules must be objects")
+            rule_id = _require(spec, "id")
+            if rule_id in seen:
+                raise ValueError(f"Duplicate document rule '{rule_id}'")
+            seen.add(rule_id)
+            self._add(spec)
+
+    def _add(self, spec: Dict[str, Any]) -> None:
+        index = len(self.rules)
+        kind = _require(spec, "check")
+        score = _number(spec, "score")
+        if score is None or score < 0:
+            raise ValueError(f"Rule '{spec['id']}' needs a non-negative 'score'")
+
+        if kind == "contains_any":
+            field = _require(spec, "field")
+            values = _require(spec, "values")
+            if not isinstance(values, list) or not all(
+                isinstance(value, str) and value for value in values
+            ):
+                raise ValueError(
+                    f"Rule '{spec['id']}': 'values' must be non-empty strings"
+                )
+            field_needles = self._needles.setdefault(field, {})
+            for value in values:
+                field_needles.setdefault(value.lower(), set()).add(index)
+        elif kind == "matches":
+            pattern = _pattern(spec)
+            self._patterns.setdefault(_require(spec, "field"), []).append(
+                (index, pattern)
+            )
+        elif kind in NUMERIC_INPUTS:
+            key, value, fields = NUMERIC_INPUTS[kind](spec)
+            low, high = _bounds(spec)
+            self._numeric.setdefault(key, (value, []))[1].append((index, low, high))
+            self._timestamp_fields[index] = fields
+        elif kind in CHECKS:
+            self._checks.append((index, CHECKS[kind](spec)))
+            if kind == "timezone_mismatch":
+                self._timestamp_fields[index] = list(_pair(spec))
+        else:
+            raise ValueError(f"Rule '{spec['id']}': unknown check '{kind}'")
+
+        formats = spec.get("formats")
+        self.rules.append(
+            DocumentRule(
+                id=spec["id"],
+                score=score,
+                message=spec.get("message") or spec["id"],
+                field=spec.get("field"),
+                formats=frozenset(formats) if formats is not None else None,
+                skip_formats=frozenset(spec.get("skip_formats") or ()),
+                indicator=spec.get("indicator"),
+            )
+        )
+
+    def stage(self, document_format: str) -> PlanStage:
+        stage = self._stages.get(document_format)
+        if stage is None:
+            active = {
+                index
+                for index, rule in enumerate(self.rules)
+                if rule.applies_to(document_format)
+            }
+            indicators = {index for index in active if self.rules[index].indicator}
+            matchers = (
+                _string_matcher(field, needles, active, indicators)
+                for field, needles in self._needles.items()
+            )
+            patterns = (
+                _pattern_group(field, rules, active, indicators)
+                for field, rules in self._patterns.items()
+            )
+            numeric = (
+                NumericGroup(
+                    value,
+                    tuple(rule for rule in rules if rule[0] in active),
+                    tuple(rule[0] for rule in rules if rule[0] in indicators),
+                )
+                for value, rules in self._numeric.values()
+            )
+            stage = PlanStage(
+                matchers=tuple(matcher for matcher in matchers if matcher),
+                patterns=tuple(group for group in patterns if group),
+                numeric=tuple(group for group in numeric if group.rules),
+                checks=tuple(
+                    (index, check) for index, check in self._checks if index in active
+                ),
+                timestamp_fields=tuple(
+                    dict.fromkeys(
+                        field
+                        for index in sorted(active)
+                        for field in self._timestamp_fields.get(index, ())
+                    )
+                ),
+            )
+            self._stages[document_format] = stage
+        return stage
+
+    def evaluate(self, metadata: Dict[str, Any]) -> Evaluation:
+        values = document_values(metadata)
+        stage = self.stage(values.get("format") or "")
+        timestamps = {
+            field: parse_timestamp(value)
+            if isinstance((value := values.get(field)), (str, datetime))
+            else None
+            for field in stage.timestamp_fields
+        }
+
+        fired: List[int] = []
+        checked: List[int] = []
+        for matcher in stage.matchers:
+            value = values.get(matcher.field)
+            if not isinstance(value, str) or not value:
+                continue
+            hits: Set[int] = set()
+            for needle in matcher.pattern.findall(value.lower()):
+                hits |= matcher.rules_by_needle[needle]
+            fired.extend(hits)
+            checked.extend(matcher.indicators)
+
+        for group in stage.patterns:
+            value = values.get(group.field)
+            if not isinstance(value, str) or not value:
+                continue
+            if group.guard is None or group.guard.search(value):
+                fired.extend(
+                    index for index, pattern in group.rules if pattern.search(value)
+                )
+            checked.extend(group.indicators)
+
+        for group in stage.numeric:
+            value = group.value(values, timestamps)
+            if value is None:
+                continue
+            fired.extend(
+                index for index, low, high in group.rules if low < value < high
+            )
+            checked.extend(group.indicators)
+
+        for index, check in stage.checks:
+            outcome = check(values, timestamps)
+            if outcome:
+                fired.append(index)
+            if outcome is not None and self.rules[index].indicator:
+                checked.append(index)
+
+        fired.sort()
+        indicators: Dict[str, bool] = {}
+        if checked:
+            fired_set = set(fired)
+            for index in sorted(checked):
+                indicators[self.rules[index].indicator] = index not in fired_set
+
+        messages: List[str] = []
+        contributions: Dict[str, float] = {}
+        score = 0.0
+        for index in fired:
+            rule = self.rules[index]
+            messages.append(rule.render(values))
+            contributions[rule.id] = rule.score
+            score += rule.score
+        return Evaluation(indicators, messages, contributions, score)
+
+
+def compile_document_rules(section: Dict[str, Any]) -> DocumentRulePlan:
+    rules = section.get("rules")
+    if not isinstance(rules, list):
+        raise ValueError("'document.rules' must be a list")
+    confidence = section.get("confidence", 0.7)
+    if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+        raise ValueError("'document.confidence' must be a number")
+    if not 0 <= confidence <= 1:
+        raise ValueError("'document.confidence' must be between 0 and 1")
+    return DocumentRulePlan(rules, float(confidence))
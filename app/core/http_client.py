@@ -0,0 +1,89 @@
+import asyncio
+from typing import Optional
+from urllib.parse import urlparse
+from app.core.capture import CaptureTransport, traffic_capture
+from app.core.config import settings
+
+
+def simulator_transport():
+    import httpx
+    from app.testing.upstream_simulator import SimulatorConfig, create_app
+
+    config = (
+        SimulatorConfig.load(settings.UPSTREAM_SIMULATOR_CONFIG)
+        if settings.UPSTREAM_SIMULATOR_CONFIG
+        else SimulatorConfig()
+    )
+    return httpx.ASGITransport(app=create_app(config))
+
+
+def replay_transport():
+    from app.testing.replay import ReplayTransport
+
+    return ReplayTransport.from_directory(settings.UPSTREAM_REPLAY_DIR)
+
+
+class SharedHTTPClient:
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self.transport = None
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self):
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._discard()
+        if self._client is None or self._client.is_closed:
+            if self.transport is None and settings.UPSTREAM_REPLAY_DIR:
+                self.transport = replay_transport()
+            elif self.transport is None and settings.UPSTREAM_SIMULATOR:
+                self.transport = simulator_transport()
+
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+            transport = self.transport
+            if traffic_capture.enabled:
+                transport = CaptureTransport(
+                    transport or httpx.AsyncHTTPTransport(limits=limits)
+                )
+            self._client = httpx.AsyncClient(limits=limits, transport=transport)
+            self._loop = loop
+        return self._client
+
+    def _discard(self) -> None:
+        client, loop = self._client, self._loop
+        self._client = None
+        self._loop = None
+        if client is not None and not client.is_closed and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def preconnect(self, urls) -> int:
+        client = self.get()
+        origins = {
+            f"{parsed.scheme}://{parsed.netloc}/"
+            for parsed in (urlparse(url) for url in urls)
+        }
+
+        async def connect(origin: str) -> bool:
+            try:
+                await client.head(origin, timeout=2.0)
+                return True
+            except Exception:
+                return False
+
+        results = await asyncio.gather(*(connect(origin) for origin in origins))
+        return sum(results)
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+http_client = SharedHTTPClient(settings.UPSTREAM_MAX_CONCURRENCY * 4)
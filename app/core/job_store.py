@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from app.models.schemas import JobResponse
+
+
+class JobStore:
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, "
+                "response TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_expires ON jobs (expires)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def save(self, response: JobResponse, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM jobs WHERE expires <= ?", (now,))
+            connection.execute(
+                "INSERT INTO jobs (job_id, response, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET "
+                "response = excluded.response, expires = excluded.expires",
+                (response.job_id, response.model_dump_json(), now + ttl),
+            )
+
+    def load(self, job_id: str) -> Optional[JobResponse]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT response FROM jobs WHERE job_id = ? AND expires > ?",
+                    (job_id, time.time()),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return JobResponse.model_validate_json(row[0]).model_copy(
+            update={"queue_position": None}
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
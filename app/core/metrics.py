@@ -0,0 +1,257 @@
+import asyncio
+import os
+import weakref
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from app.core import timing
+from app.core.cache import SimpleCache
+from app.core.config import settings
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+STAGE_BUCKETS = tuple(bound / 1000 for bound in timing.BUCKETS_MS)
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template, method and status",
+    ["method", "endpoint", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "endpoint"],
+    buckets=REQUEST_BUCKETS,
+)
+STAGE_LATENCY = Histogram(
+    "detection_stage_duration_seconds",
+    "Time spent in each detection stage",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+CACHE_OPERATIONS = Counter(
+    "cache_operations_total",
+    "Cache lookups, writes and expiry evictions by key namespace",
+    ["namespace", "result"],
+)
+UPSTREAM_CALLS = Counter(
+    "upstream_calls_total",
+    "Upstream API calls by service and outcome (success or APIErrorType)",
+    ["service", "outcome"],
+)
+VERIFICATIONS = Counter(
+    "verifications_total",
+    "Verification checks answered by the upstream API or the local fallback",
+    ["service", "source"],
+)
+DETECTION_METHODS = Counter(
+    "ai_detection_method_total",
+    "AI content results by detection_method",
+    ["detection_method"],
+)
+QUEUE_DEPTH = Gauge(
+    "queue_depth",
+    "Work waiting for a slot",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+IN_FLIGHT = Gauge(
+    "in_flight",
+    "Work currently holding a slot",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_LIMIT = Gauge(
+    "admission_concurrency_limit",
+    "Current adaptive concurrency limit per admission lane",
+    ["lane"],
+    multiprocess_mode="livesum",
+)
+CACHE_ENTRIES = Gauge(
+    "cache_entries",
+    "Entries held in the in-process cache",
+    multiprocess_mode="livesum",
+)
+
+
+def multiproc_dir() -> Optional[str]:
+    return os.environ.get(MULTIPROC_DIR_ENV)
+
+
+def mark_process_dead(pid: int) -> None:
+    if multiproc_dir():
+        multiprocess.mark_process_dead(pid)
+
+
+def service_label(service_name: str) -> str:
+    return service_name.lower().replace(" ", "_")
+
+
+def record_upstream(service_name: str, outcome: str) -> None:
+    UPSTREAM_CALLS.labels(service_label(service_name), outcome).inc()
+
+
+def record_verification(service: str, used_api: bool) -> None:
+    VERIFICATIONS.labels(service, "api" if used_api else "fallback").inc()
+
+
+_exported_cache_operations: "weakref.WeakKeyDictionary[SimpleCache, Dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def export_cache_operations() -> None:
+    for instance in list(SimpleCache.instances):
+        exported = _exported_cache_operations.setdefault(instance, {})
+        for labels, count in list(instance.operations.items()):
+            previous = exported.get(labels, 0)
+            if count > previous:
+                CACHE_OPERATIONS.labels(*labels).inc(count - previous)
+                exported[labels] = count
+
+
+_exported_stages: Dict[str, Tuple[List[int], float]] = {}
+
+
+def export_stage_timings() -> None:
+    for name, hist in list(timing.histograms.items()):
+        counts, total = list(hist.counts), hist.sum
+        exported_counts, exported_sum = _exported_stages.get(
+            name, ([0] * len(counts), 0.0)
+        )
+        if counts == exported_counts:
+            continue
+
+        add_observations(
+            STAGE_LATENCY.labels(name),
+            [count - exported for count, exported in zip(counts, exported_counts)],
+            (total - exported_sum) / 1000,
+        )
+        _exported_stages[name] = (counts, total)
+
+
+def add_observations(child, bucket_counts: List[int], total: float) -> None:
+    for bucket, count in zip(child._buckets, bucket_counts):
+        if count > 0:
+            bucket.inc(count)
+    child._sum.inc(total)
+
+
+def sample_state() -> None:
+    from app.core.admission import lanes
+    from app.core.cache import cache
+    from app.core.parse_pool import parse_pool
+    from app.core.upstream import governors
+    from app.services.job_queue import job_queue
+
+    export_stage_timings()
+    export_cache_operations()
+    gates = {"parse_pool": parse_pool.slots}
+    gates.update(
+        (f"upstream_{name}", governor.gate) for name, governor in governors.items()
+    )
+    for name, gate in gates.items():
+        QUEUE_DEPTH.labels(name).set(gate.waiting)
+        IN_FLIGHT.labels(name).set(gate.in_use)
+
+    for name, lane in lanes.items():
+        QUEUE_DEPTH.labels(f"admission_{name}").set(lane.waiting)
+        IN_FLIGHT.labels(f"admission_{name}").set(lane.in_flight)
+        ADMISSION_LIMIT.labels(name).set(lane.limit)
+
+    QUEUE_DEPTH.labels("jobs").set(job_queue.depth)
+    IN_FLIGHT.labels("jobs").set(job_queue.in_flight)
+    CACHE_ENTRIES.set(cache.get_stats()["cache_size"])
+
+
+def render() -> bytes:
+    sample_state()
+    if not multiproc_dir():
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+class StateSampler:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            sample_state()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> asyncio.Task:
+        if (
+            self._task is None
+            or self._task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self._routes: Dict[Any, str] = {}
+
+    def _endpoint_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+
+        label = self._routes.get(endpoint)
+        if label is None:
+            label = "unmatched"
+            for route in scope["app"].routes:
+                if endpoint in (
+                    getattr(route, "endpoint", None),
+                    getattr(route, "app", None),
+                ):
+                    label = route.path
+                    break
+            self._routes[endpoint] = label
+        return label
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            endpoint = self._endpoint_label(scope)
+            method = scope["method"]
+            REQUESTS.labels(method, endpoint, str(status)).inc()
+            REQUEST_LATENCY.labels(method, endpoint).observe(perf_counter() - start)
+
+
+state_sampler = StateSampler(settings.METRICS_SAMPLE_INTERVAL)
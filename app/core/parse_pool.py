@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+from app.core.config import settings
+from app.core.priority import PriorityGate
+from app.services.document_processor import DocumentProcessor
+
+
+class ParsePool:
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.slots = PriorityGate(max_workers * 2)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def extract(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+        if self.max_workers <= 0:
+            return DocumentProcessor.extract_sync(file_content, filename)
+
+        async with self.slots.slot():
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    self._get_executor(),
+                    DocumentProcessor.extract_sync,
+                    file_content,
+                    filename,
+                )
+            except BrokenProcessPool:
+                self.shutdown(wait=False)
+                raise
+
+    async def warm_up(self) -> int:
+        if self.max_workers <= 0:
+            DocumentProcessor.warm_up()
+            return 0
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, DocumentProcessor.warm_up)
+                for _ in range(self.max_workers)
+            )
+        )
+        return self.max_workers
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+parse_pool = ParsePool(settings.PARSE_WORKERS)
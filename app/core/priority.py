@@ -0,0 +1,146 @@
+import asyncio
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import AsyncIterator, Deque, Dict, Optional
+from starlette.datastructures import Headers
+from app.core.config import settings
+from app.core.rate_limiter import api_key_id
+
+
+class Priority(str, Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+current_priority: ContextVar[Priority] = ContextVar(
+    "current_priority", default=Priority.INTERACTIVE
+)
+
+BULK_API_KEYS = {
+    api_key_id(api_key.strip())
+    for api_key in settings.PRIORITY_BULK_API_KEYS.split(",")
+    if api_key.strip()
+}
+
+
+def resolve_priority(headers: Headers, path: str) -> Priority:
+    api_key = headers.get("x-api-key")
+    if api_key and api_key_id(api_key) in BULK_API_KEYS:
+        return Priority.BULK
+    if any(path.startswith(prefix) for prefix in settings.PRIORITY_BULK_PATHS):
+        return Priority.BULK
+    if headers.get("x-priority", "").lower() == Priority.BULK.value:
+        return Priority.BULK
+    return Priority.INTERACTIVE
+
+
+class PriorityMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = current_priority.set(
+            resolve_priority(Headers(scope=scope), scope["path"])
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_priority.reset(token)
+
+
+class PriorityGate:
+    def __init__(self, capacity: int, bulk_share: Optional[float] = None):
+        self.capacity = capacity
+        self.in_use = 0
+        bulk_share = settings.PRIORITY_BULK_SHARE if bulk_share is None else bulk_share
+        self.max_interactive_streak = (
+            math.ceil(1 / bulk_share) - 1 if bulk_share > 0 else math.inf
+        )
+        self._interactive_streak = 0
+        self._waiters: Dict[Priority, Deque[asyncio.Future]] = {
+            Priority.INTERACTIVE: deque(),
+            Priority.BULK: deque(),
+        }
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def waiting_for(self, priority: Priority) -> int:
+        return len(self._waiters[priority])
+
+    def has_capacity(self) -> bool:
+        return self.in_use < self.capacity and not self.waiting
+
+    def _pop_live(self, priority: Priority) -> Optional[asyncio.Future]:
+        waiters = self._waiters[priority]
+        while waiters:
+            future = waiters[0]
+            if not future.done() and not future.get_loop().is_closed():
+                return waiters.popleft()
+            waiters.popleft()
+        return None
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        bulk_waiting = bool(self._waiters[Priority.BULK])
+        if bulk_waiting and self._interactive_streak >= self.max_interactive_streak:
+            future = self._pop_live(Priority.BULK)
+            if future is not None:
+                self._interactive_streak = 0
+                return future
+
+        future = self._pop_live(Priority.INTERACTIVE)
+        if future is not None:
+            self._interactive_streak = (
+                self._interactive_streak + 1 if self._waiters[Priority.BULK] else 0
+            )
+            return future
+
+        self._interactive_streak = 0
+        return self._pop_live(Priority.BULK)
+
+    def wake(self) -> None:
+        while self.in_use < self.capacity:
+            future = self._next_waiter()
+            if future is None:
+                break
+            self.in_use += 1
+            future.set_result(None)
+
+    async def acquire(
+        self, priority: Optional[Priority] = None, timeout: Optional[float] = None
+    ) -> None:
+        if self.has_capacity():
+            self.in_use += 1
+            return
+
+        priority = priority or current_priority.get()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self.release()
+            elif future in self._waiters[priority]:
+                self._waiters[priority].remove(future)
+            raise
+
+    def release(self) -> None:
+        self.in_use -= 1
+        self.wake()
+
+    @asynccontextmanager
+    async def slot(self, priority: Optional[Priority] = None) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,301 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+import weakref
+from collections import Counter
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from fastapi import HTTPException, Request
+from app.core.config import settings
+from app.core.timing import request_timings
+
+ASYNCIO_DIR = os.path.dirname(asyncio.__file__)
+MAX_STACK_DEPTH = 128
+
+active_profile: ContextVar[Optional["Profile"]] = ContextVar(
+    "active_profile", default=None
+)
+
+
+def frame_label(frame) -> str:
+    code = frame.f_code
+    path = code.co_filename.replace(os.sep, "/").rsplit("/", 2)
+    return f"{code.co_qualname} ({'/'.join(path[-2:])}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame) -> Optional[str]:
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        if frame.f_code.co_filename.startswith(ASYNCIO_DIR):
+            break
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    if not labels:
+        return None
+    return ";".join(reversed(labels))
+
+
+class Profile:
+    def __init__(self, file_content: bytes, filename: str, reason: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.content_hash = hashlib.md5(file_content).hexdigest()
+        self.filename = filename
+        self.reason = reason
+        self.created_at = datetime.utcnow()
+        self.loop = asyncio.get_running_loop()
+        self.thread_id = threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.duration_ms = 0.0
+        self.timings: Dict[str, float] = {}
+        self.finished = False
+
+    def add_sample(self, stack: str) -> None:
+        self.stacks[stack] += 1
+        self.samples += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "content_hash": self.content_hash,
+            "filename": self.filename,
+            "reason": self.reason,
+            "created_at": self.created_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 2),
+            "interval_ms": settings.PROFILE_INTERVAL_MS,
+            "samples": self.samples,
+            "timings": self.timings,
+            "stacks": dict(self.stacks.most_common()),
+        }
+
+
+def to_collapsed(profile: Dict[str, Any]) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in profile["stacks"].items())
+
+
+def to_speedscope(profile: Dict[str, Any]) -> Dict[str, Any]:
+    frames: List[Dict[str, Any]] = []
+    index: Dict[str, int] = {}
+    samples = []
+    weights = []
+
+    for stack, count in profile["stacks"].items():
+        sample = []
+        for label in stack.split(";"):
+            if label not in index:
+                index[label] = len(frames)
+                name, _, location = label.rpartition(" (")
+                file, _, line = location.rstrip(")").rpartition(":")
+                frames.append({"name": name, "file": file, "line": int(line)})
+            sample.append(index[label])
+        samples.append(sample)
+        weights.append(count * profile["interval_ms"])
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": f"{profile['filename']} ({profile['content_hash']})",
+        "exporter": "resume-fraud-profiler",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": profile["id"],
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+class SamplingProfiler:
+    def __init__(
+        self, admin_key: str, sample_rate: int, interval_ms: float, directory: str
+    ):
+        self.admin_key = admin_key
+        self.sample_rate = sample_rate
+        self.interval = interval_ms / 1000
+        self.directory = directory
+        self._requests = 0
+        self._active: List[Profile] = []
+        self._tasks: "weakref.WeakKeyDictionary[asyncio.Task, Profile]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._previous_factories: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_admin(self, request: Request) -> bool:
+        supplied = request.headers.get("x-admin-key", "")
+        return bool(self.admin_key) and hmac.compare_digest(
+            supplied.encode(), self.admin_key.encode()
+        )
+
+    def should_profile(self, request: Request) -> Optional[str]:
+        if not self.admin_key:
+            return None
+
+        if self.sample_rate > 0:
+            self._requests += 1
+            if self._requests % self.sample_rate == 0:
+                return "sampled"
+
+        flag = request.headers.get("x-profile") or request.query_params.get("profile")
+        if flag and flag.lower() in ("1", "true", "yes") and self.is_admin(request):
+            return "requested"
+        return None
+
+    def _task_factory(self, loop, coro, context=None):
+        previous = self._previous_factories.get(loop)
+        if previous is not None:
+            task = previous(loop, coro, context=context)
+        else:
+            task = asyncio.Task(coro, loop=loop, context=context)
+        profile = (
+            context.get(active_profile) if context is not None else active_profile.get()
+        )
+        if profile is not None and not profile.finished:
+            self._tasks[task] = profile
+        return task
+
+    def _sample_forever(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                profiles = list(self._active)
+
+            frames = sys._current_frames()
+            for loop in {profile.loop for profile in profiles}:
+                task = asyncio.current_task(loop)
+                profile = self._tasks.get(task) if task is not None else None
+                if profile is None or profile.finished:
+                    continue
+                stack = collapse_stack(frames.get(profile.thread_id))
+                if stack:
+                    profile.add_sample(stack)
+            del frames
+            time.sleep(self.interval)
+
+    def _start(self, profile: Profile) -> None:
+        loop = profile.loop
+        if loop.get_task_factory() != self._task_factory:
+            self._previous_factories[loop] = loop.get_task_factory()
+            loop.set_task_factory(self._task_factory)
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks[task] = profile
+
+        with self._lock:
+            self._active.append(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._sample_forever, name="request-profiler", daemon=True
+                )
+                self._thread.start()
+
+    def _finish(self, profile: Profile) -> None:
+        profile.finished = True
+        with self._lock:
+            self._active.remove(profile)
+            loop_idle = all(active.loop is not profile.loop for active in self._active)
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.pop(task, None)
+        if loop_idle:
+            profile.loop.set_task_factory(
+                self._previous_factories.pop(profile.loop, None)
+            )
+
+    @asynccontextmanager
+    async def profile(
+        self, file_content: bytes, filename: str, reason: str
+    ) -> AsyncIterator[Profile]:
+        profile = Profile(file_content, filename, reason)
+        timings = request_timings.get()
+        first_timing = len(timings) if timings is not None else 0
+        token = active_profile.set(profile)
+        start = time.perf_counter()
+        self._start(profile)
+        try:
+            yield profile
+        finally:
+            self._finish(profile)
+            active_profile.reset(token)
+            profile.duration_ms = (time.perf_counter() - start) * 1000
+            for name, elapsed_ms in (timings or [])[first_timing:]:
+                profile.timings[name] = round(
+                    profile.timings.get(name, 0.0) + elapsed_ms, 3
+                )
+            await asyncio.to_thread(self.save, profile)
+
+    def save(self, profile: Profile) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{profile.id}.json")
+        with open(path, "w") as f:
+            json.dump(profile.to_dict(), f)
+
+        for stale in self._paths()[settings.PROFILE_KEEP :]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    def _paths(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        paths = [
+            os.path.join(self.directory, name)
+            for name in names
+            if name.endswith(".json")
+        ]
+        return sorted(paths, key=os.path.getmtime, reverse=True)
+
+    def recent(self) -> List[Dict[str, Any]]:
+        summaries = []
+        for path in self._paths():
+            try:
+                with open(path) as f:
+                    profile = json.load(f)
+            except (OSError, ValueError):
+                continue
+            profile.pop("stacks")
+            summaries.append(profile)
+        return summaries
+
+    def load(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        if not profile_id.isalnum():
+            return None
+        try:
+            with open(os.path.join(self.directory, f"{profile_id}.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+def require_admin(request: Request) -> None:
+    if not profiler.admin_key:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not profiler.is_admin(request):
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+
+profiler = SamplingProfiler(
+    settings.ADMIN_API_KEY,
+    settings.PROFILE_SAMPLE_RATE,
+    settings.PROFILE_INTERVAL_MS,
+    settings.PROFILE_DIR,
+)
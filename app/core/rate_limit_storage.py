@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+from limits.storage import MovingWindowSupport, Storage
+
+
+class SQLiteStorage(Storage, MovingWindowSupport):
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = urlparse(uri).path or ""
+        if not self.path or self.path == "/":
+            raise ValueError("SQLite rate limit storage needs a file path")
+
+        self.timeout = float(options.get("timeout", 5.0))
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_counters "
+                "(key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_entries "
+                "(key TEXT NOT NULL, timestamp REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS rate_limit_entries_key "
+                "ON rate_limit_entries (key, timestamp)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def _transaction(self, callback):
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = callback(connection)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        def increment(connection: sqlite3.Connection) -> int:
+            now = time.time()
+            connection.execute(
+                "DELETE FROM rate_limit_counters WHERE key = ? AND expires <= ?",
+                (key, now),
+            )
+            connection.execute(
+                "INSERT INTO rate_limit_counters (key, value, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+                (key, amount, now + expiry),
+            )
+            row = connection.execute(
+                "SELECT value FROM rate_limit_counters WHERE key = ?", (key,)
+            ).fetchone()
+            return row[0]
+
+        return self._transaction(increment)
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value FROM rate_limit_counters WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT expires FROM rate_limit_counters WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        return row[0] if row else time.time()
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connect().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> Optional[int]:
+        def delete_all(connection: sqlite3.Connection) -> int:
+            counters = connection.execute("DELETE FROM rate_limit_counters").rowcount
+            entries = connection.execute("DELETE FROM rate_limit_entries").rowcount
+            return counters + entries
+
+        return self._transaction(delete_all)
+
+    def clear(self, key: str) -> None:
+        def delete_key(connection: sqlite3.Connection) -> None:
+            connection.execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+            connection.execute("DELETE FROM rate_limit_entries WHERE key = ?", (key,))
+
+        self._transaction(delete_key)
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+
+        def acquire(connection: sqlite3.Connection) -> bool:
+            now = time.time()
+            connection.execute(
+                "DELETE FROM rate_limit_entries WHERE key = ? AND timestamp <= ?",
+                (key, now - expiry),
+            )
+            count = connection.execute(
+                "SELECT COUNT(*) FROM rate_limit_entries WHERE key = ?", (key,)
+            ).fetchone()[0]
+            if count + amount > limit:
+                return False
+
+            connection.executemany(
+                "INSERT INTO rate_limit_entries (key, timestamp) VALUES (?, ?)",
+                [(key, now)] * amount,
+            )
+            return True
+
+        return self._transaction(acquire)
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> Tuple[float, int]:
+        now = time.time()
+        with self._lock:
+            oldest, count = (
+                self._connect()
+                .execute(
+                    "SELECT MIN(timestamp), COUNT(*) FROM rate_limit_entries "
+                    "WHERE key = ? AND timestamp > ?",
+                    (key, now - expiry),
+                )
+                .fetchone()
+            )
+        return (oldest or now), count
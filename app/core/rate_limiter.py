@@ -1,12 +1,31 @@
+import hashlib
+from typing import Callable, Dict, Optional
 from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request
 from fastapi.responses import JSONResponse
+from app.core.config import settings
 
+# Importing SQLiteStorage registers the sqlite:// storage scheme with limits.
+from app.core.rate_limit_storage import SQLiteStorage  # noqa: F401
 
-def get_client_id(request: Request):
-    return get_remote_address(request)
+
+def api_key_id(api_key: str) -> str:
+    return f"apikey:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+
+
+def parse_api_key_policies(raw: str) -> Dict[str, str]:
+    policies = {}
+    for entry in raw.split(","):
+        if "=" not in entry:
+            continue
+        api_key, limit = entry.split("=", 1)
+        if api_key.strip() and limit.strip():
+            policies[api_key_id(api_key.strip())] = limit.strip()
+    return policies
+
+
+API_KEY_POLICIES = parse_api_key_policies(settings.RATE_LIMIT_API_KEYS)
 
 
 def get_real_client_ip(request: Request) -> str:
@@ -17,7 +36,34 @@ def get_real_client_ip(request: Request) -> str:
     return request.client.host
 
 
-limiter = Limiter(key_func=get_client_id)
+def get_client_id(request: Request):
+    api_key = request.headers.get("x-api-key")
+    if api_key:
+        client_id = api_key_id(api_key)
+        if client_id in API_KEY_POLICIES:
+            return client_id
+    return get_real_client_ip(request)
+
+
+def rate_limit_for(endpoint: str) -> Callable[[str], str]:
+    def provider(key: str) -> str:
+        return API_KEY_POLICIES.get(key, settings.RATE_LIMITS[endpoint])
+
+    return provider
+
+
+def build_limiter(
+    storage_uri: Optional[str] = None, storage_options: Optional[Dict] = None
+) -> Limiter:
+    return Limiter(
+        key_func=get_client_id,
+        storage_uri=storage_uri or settings.RATE_LIMIT_STORAGE_URI,
+        storage_options=storage_options or {},
+        strategy=settings.RATE_LIMIT_STRATEGY,
+    )
+
+
+limiter = build_limiter()
 
 
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
@@ -0,0 +1,446 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from app.core.config import settings
+from app.models.schemas import FraudDetectionResult
+
+logger = logging.getLogger(__name__)
+
+PHONE_DIGITS_PATTERN = re.compile(r"\D")
+
+COLUMNS = [
+    "created_at",
+    "filename",
+    "content_hash",
+    "text_fingerprint",
+    "email",
+    "email_domain",
+    "phone",
+    "client_ip",
+    "overall_risk_score",
+    "risk_level",
+    "confidence",
+    "contact_risk_score",
+    "contact_confidence",
+    "ai_probability",
+    "ai_confidence",
+    "detection_method",
+    "document_risk_score",
+    "document_confidence",
+    "rule_version",
+    "cached",
+    "timings",
+    "result",
+]
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS results ("
+    "id INTEGER PRIMARY KEY, created_at REAL NOT NULL, filename TEXT, "
+    "content_hash TEXT NOT NULL, text_fingerprint TEXT, email TEXT, "
+    "email_domain TEXT, phone TEXT, client_ip TEXT, overall_risk_score REAL NOT NULL, "
+    "risk_level TEXT NOT NULL, confidence REAL, contact_risk_score REAL, "
+    "ai_probability REAL, detection_method TEXT, document_risk_score REAL, "
+    "timings TEXT, result TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS results_created ON results (created_at)",
+    "CREATE INDEX IF NOT EXISTS results_risk ON results (risk_level, created_at)",
+    "CREATE INDEX IF NOT EXISTS results_email ON results (email, created_at)",
+    "CREATE INDEX IF NOT EXISTS results_phone ON results (phone, created_at)",
+    "CREATE INDEX IF NOT EXISTS results_domain ON results (email_domain, created_at)",
+    "CREATE INDEX IF NOT EXISTS results_content ON results (content_hash)",
+    "CREATE INDEX IF NOT EXISTS results_fingerprint ON results (text_fingerprint)",
+]
+
+ADDED_COLUMNS = {
+    "contact_confidence": "REAL",
+    "ai_confidence": "REAL",
+    "document_confidence": "REAL",
+    "rule_version": "TEXT",
+    "cached": "INTEGER NOT NULL DEFAULT 0",
+}
+
+STAGE_SCORE_COLUMNS = [
+    "id",
+    "contact_risk_score",
+    "ai_probability",
+    "document_risk_score",
+    "contact_confidence",
+    "ai_confidence",
+    "document_confidence",
+    "overall_risk_score",
+    "CASE risk_level WHEN 'low' THEN 0 WHEN 'medium' THEN 1 "
+    "WHEN 'high' THEN 2 ELSE -1 END",
+]
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    return email.strip().lower() if email else None
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    import phonenumbers
+
+    if not phone:
+        return None
+    try:
+        return phonenumbers.format_number(
+            phonenumbers.parse(phone, "US"), phonenumbers.PhoneNumberFormat.E164
+        )
+    except phonenumbers.NumberParseException:
+        return PHONE_DIGITS_PATTERN.sub("", phone) or None
+
+
+def to_timestamp(value: Optional[datetime]) -> Optional[float]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class ResultStore:
+    def __init__(
+        self, path: str, batch_size: int, flush_interval: float, max_pending: int
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(
+                self.path, timeout=10.0, isolation_level=None, check_same_thread=False
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in SCHEMA:
+                connection.execute(statement)
+            existing = {
+                row["name"] for row in connection.execute("PRAGMA table_info(results)")
+            }
+            for column, column_type in ADDED_COLUMNS.items():
+                if column not in existing:
+                    connection.execute(
+                        f"ALTER TABLE results ADD COLUMN {column} {column_type}"
+                    )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def record(
+        self,
+        result: Dict[str, Any],
+        extraction: Dict[str, Any],
+        contacts: Optional[Dict[str, Any]],
+        filename: str,
+        client_ip: Optional[str],
+        timings: Dict[str, float],
+    ) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        entry = {
+            "created_at": time.time(),
+            "result": result,
+            "extraction": extraction,
+            "contacts": contacts or {},
+            "filename": filename,
+            "client_ip": client_ip,
+            "timings": timings,
+        }
+        self._enqueue(entry)
+        return entry
+
+    def record_cached(
+        self,
+        entry: Dict[str, Any],
+        filename: str,
+        client_ip: Optional[str],
+        timings: Dict[str, float],
+    ) -> None:
+        if not self.enabled:
+            return
+
+        self._enqueue(
+            {
+                **entry,
+                "created_at": time.time(),
+                "filename": filename,
+                "client_ip": client_ip,
+                "timings": timings,
+                "cached": True,
+            }
+        )
+
+    def _enqueue(self, entry: Dict[str, Any]) -> None:
+        if len(self._pending) >= self.max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(
+                    f"Result store backlog full, dropped {self.dropped} results"
+                )
+
+        self._pending.append(entry)
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            if self._task.get_loop() is asyncio.get_running_loop():
+                self._wakeup.set()
+
+    @staticmethod
+    def _row(entry: Dict[str, Any]) -> Tuple:
+        result = entry["result"]
+        extraction = entry["extraction"]
+        email = normalize_email(entry["contacts"].get("email"))
+        contact = result.get("contact_verification") or {}
+        ai = result.get("ai_content_analysis") or {}
+        document = result.get("document_analysis") or {}
+        risk_level = result["risk_level"]
+
+        return (
+            entry["created_at"],
+            entry["filename"],
+            extraction.get("content_hash"),
+            extraction.get("text_fingerprint"),
+            email,
+            email.rsplit("@", 1)[-1] if email and "@" in email else None,
+            normalize_phone(entry["contacts"].get("original_phone")),
+            entry["client_ip"],
+            result["overall_risk_score"],
+            getattr(risk_level, "value", risk_level),
+            result.get("confidence"),
+            contact.get("risk_score"),
+            contact.get("confidence"),
+            ai.get("overall_ai_probability"),
+            ai.get("confidence"),
+            ai.get("detection_method"),
+            document.get("risk_score"),
+            document.get("confidence"),
+            result.get("rule_version"),
+            int(entry.get("cached", False)),
+            json.dumps(entry["timings"]),
+            FraudDetectionResult(
+                **result,
+                analysis_timestamp=datetime.utcfromtimestamp(entry["created_at"]),
+            ).model_dump_json(),
+        )
+
+    def write_batch(self, entries: List[Dict[str, Any]]) -> int:
+        rows = [self._row(entry) for entry in entries]
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    f"INSERT INTO results ({', '.join(COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+                    rows,
+                )
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return len(rows)
+
+    async def flush(self) -> int:
+        written = 0
+        while self._pending:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(self.batch_size, len(self._pending)))
+            ]
+            try:
+                written += await asyncio.to_thread(self.write_batch, batch)
+            except Exception as e:
+                self.dropped += len(batch)
+                logger.error(f"Result store write failed, dropped {len(batch)}: {e}")
+        return written
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> Optional[asyncio.Task]:
+        if not self.enabled:
+            return None
+        if (
+            self._task is None
+            or self._task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._wakeup = None
+        if self.enabled:
+            await self.flush()
+
+    def _where(
+        self,
+        risk_level: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        domain: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        rule_version: Optional[str] = None,
+    ) -> Tuple[List[str], List[Any]]:
+        clauses, params = [], []
+        for clause, value in [
+            ("risk_level = ?", risk_level),
+            ("created_at >= ?", to_timestamp(since)),
+            ("created_at < ?", to_timestamp(until)),
+            ("email = ?", normalize_email(email)),
+            ("phone = ?", normalize_phone(phone)),
+            ("email_domain = ?", normalize_email(domain)),
+            ("content_hash = ?", content_hash),
+            ("rule_version = ?", rule_version),
+        ]:
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return clauses, params
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        item = dict(row)
+        item["created_at"] = datetime.fromtimestamp(item["created_at"], timezone.utc)
+        item["timings"] = json.loads(item["timings"] or "{}")
+        item["result"] = json.loads(item["result"])
+        return item
+
+    def query(
+        self, limit: int = 100, before_id: Optional[int] = None, **filters
+    ) -> List[Dict[str, Any]]:
+        clauses, params = self._where(**filters)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    f"SELECT * FROM results{where} ORDER BY id DESC LIMIT ?",
+                    params + [limit],
+                )
+                .fetchall()
+            )
+        return [self._to_dict(row) for row in rows]
+
+    def get(self, result_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT * FROM results WHERE id = ?", (result_id,))
+                .fetchone()
+            )
+        return self._to_dict(row) if row else None
+
+    def iter_stage_scores(
+        self, batch_size: int = 100000, **filters
+    ) -> Iterator[List[Tuple]]:
+        clauses, params = self._where(**filters)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            self._connect()
+        connection = sqlite3.connect(self.path, timeout=10.0)
+        try:
+            cursor = connection.execute(
+                f"SELECT {', '.join(STAGE_SCORE_COLUMNS)} FROM results{where} "
+                "ORDER BY id",
+                params,
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            connection.close()
+
+    def stats(self, **filters) -> Dict[str, Any]:
+        clauses, params = self._where(**filters)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT risk_level, COUNT(*), AVG(overall_risk_score), "
+                    f"AVG(ai_probability) FROM results{where} GROUP BY risk_level",
+                    params,
+                )
+                .fetchall()
+            )
+
+        by_level = {
+            level: {
+                "count": count,
+                "avg_risk_score": round(avg_score, 4),
+                "avg_ai_probability": (
+                    round(avg_ai, 4) if avg_ai is not None else None
+                ),
+            }
+            for level, count, avg_score, avg_ai in rows
+        }
+        return {
+            "total": sum(item["count"] for item in by_level.values()),
+            "by_risk_level": by_level,
+            "pending_writes": self.pending,
+            "dropped_writes": self.dropped,
+        }
+
+
+result_store = ResultStore(
+    settings.RESULT_STORE_PATH,
+    settings.RESULT_STORE_BATCH_SIZE,
+    settings.RESULT_STORE_FLUSH_INTERVAL,
+    settings.RESULT_STORE_MAX_PENDING,
+)
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from app.core.config import settings
+from app.core.document_rules import DocumentRulePlan, compile_document_rules
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(__file__), "rules.json")
+WEIGHT_STAGES = ("contact", "ai", "document")
+NEVER_MATCHES = r"(?!)"
+
+
+class RulesError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    version: str
+    digest: str
+    weights: Dict[str, float]
+    thresholds: Tuple[float, float]
+    document: DocumentRulePlan
+    ai_indicators: Tuple[Pattern, ...]
+    generic_phrases: Tuple[Pattern, ...]
+    em_dash: Pattern
+    test_phones: Pattern
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.version}.{self.digest[:12]}"
+
+
+def _section(data: Dict[str, Any], name: str) -> Dict[str, Any]:
+    section = data.get(name)
+    if not isinstance(section, dict):
+        raise RulesError(f"'{name}' must be an object")
+    return section
+
+
+def _strings(section: Dict[str, Any], name: str) -> List[str]:
+    values = section.get(name)
+    if not isinstance(values, list) or not all(
+        isinstance(value, str) and value for value in values
+    ):
+        raise RulesError(f"'{name}' must be a list of non-empty strings")
+    return values
+
+
+def _compile(pattern: str, name: str) -> Pattern:
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise RulesError(f"Invalid pattern in '{name}': {pattern!r} ({e})")
+
+
+def any_matcher(patterns: List[str], name: str) -> Pattern:
+    for pattern in patterns:
+        _compile(pattern, name)
+    return _compile(
+        "|".join(f"(?:{pattern})" for pattern in patterns) or NEVER_MATCHES, name
+    )
+
+
+def compile_rules(data: Any, digest: str) -> RuleSet:
+    if not isinstance(data, dict):
+        raise RulesError("Rules file must contain a JSON object")
+    version = data.get("version")
+    if not isinstance(version, str) or not version.strip():
+        raise RulesError("'version' must be a non-empty string")
+
+    scoring = _section(data, "scoring")
+    weights = _section(scoring, "weights")
+    thresholds = _section(scoring, "thresholds")
+    for key, values in (
+        ("weights", {stage: weights.get(stage) for stage in WEIGHT_STAGES}),
+        ("thresholds", {name: thresholds.get(name) for name in ("medium", "high")}),
+    ):
+        for name, value in values.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise RulesError(f"'{key}.{name}' must be a number")
+            if not 0 <= value <= 1:
+                raise RulesError(f"'{key}.{name}' must be between 0 and 1")
+    if thresholds["medium"] > thresholds["high"]:
+        raise RulesError("'thresholds.medium' must not exceed 'thresholds.high'")
+
+    try:
+        document = compile_document_rules(_section(data, "document"))
+    except ValueError as e:
+        raise RulesError(str(e))
+    ai = _section(data, "ai")
+    contact = _section(data, "contact")
+    em_dash = ai.get("em_dash_pattern")
+    if not isinstance(em_dash, str) or not em_dash:
+        raise RulesError("'em_dash_pattern' must be a non-empty string")
+
+    return RuleSet(
+        version=version.strip(),
+        digest=digest,
+        weights={stage: float(weights[stage]) for stage in WEIGHT_STAGES},
+        thresholds=(float(thresholds["medium"]), float(thresholds["high"])),
+        document=document,
+        ai_indicators=tuple(
+            _compile(pattern, "indicator_patterns")
+            for pattern in _strings(ai, "indicator_patterns")
+        ),
+        generic_phrases=tuple(
+            _compile(pattern, "generic_phrase_patterns")
+            for pattern in _strings(ai, "generic_phrase_patterns")
+        ),
+        em_dash=_compile(em_dash, "em_dash_pattern"),
+        test_phones=any_matcher(
+            _strings(contact, "test_phone_patterns"), "test_phone_patterns"
+        ),
+    )
+
+
+def load_rules(path: str) -> RuleSet:
+    with open(path, "rb") as f:
+        content = f.read()
+    try:
+        data = json.loads(content)
+    except ValueError as e:
+        raise RulesError(f"Rules file is not valid JSON: {e}")
+    return compile_rules(data, hashlib.sha256(content).hexdigest())
+
+
+class Rulebook:
+    def __init__(self, path: str, interval: float):
+        self.path = path
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stat = self._file_stat()
+        self.current = load_rules(path)
+        self.loaded_at = time.time()
+        self.last_error: Optional[str] = None
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> bool:
+        with self._lock:
+            self._stat = self._file_stat()
+            try:
+                rules = load_rules(self.path)
+            except (OSError, RulesError) as e:
+                self.last_error = str(e)
+                raise RulesError(str(e))
+            self.last_error = None
+            if rules.digest == self.current.digest:
+                return False
+            previous = self.current
+            self.current = rules
+            self.loaded_at = time.time()
+        logger.info(f"Loaded rules {rules.version} (was {previous.version})")
+        return True
+
+    def check(self) -> bool:
+        if self._file_stat() == self._stat:
+            return False
+        try:
+            return self.reload()
+        except RulesError as e:
+            logger.warning(f"Keeping rules {self.current.version}: {e}")
+            return False
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await asyncio.to_thread(self.check)
+
+    def start(self) -> Optional[asyncio.Task]:
+        if self.interval <= 0:
+            return None
+        if (
+            self._task is None
+            or self._task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        rules = self.current
+        return {
+            "version": rules.version,
+            "digest": rules.digest,
+            "path": self.path,
+            "loaded_at": self.loaded_at,
+            "last_error": self.last_error,
+            "weights": rules.weights,
+            "thresholds": dict(zip(("medium", "high"), rules.thresholds)),
+            "document_rules": len(rules.document.rules),
+        }
+
+
+rulebook = Rulebook(
+    settings.RULES_PATH or DEFAULT_RULES_PATH, settings.RULES_RELOAD_INTERVAL
+)
@@ -1,6 +1,8 @@
 import re
 from typing import Optional
 
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+
 
 class InputSanitizer:
     @staticmethod
@@ -34,7 +36,7 @@ class InputSanitizer:
         if len(text) > max_length:
             text = text[:max_length]
 
-        text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
+        text = CONTROL_CHARS_PATTERN.sub("", text)
 
         return text
 
@@ -0,0 +1,120 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Tuple
+
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class Histogram:
+    __slots__ = ("name", "bounds", "counts", "sum", "count")
+
+    def __init__(self, name: str, bounds: Tuple[float, ...] = BUCKETS_MS):
+        self.name = name
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.sum += value_ms
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.bounds[index] if index < len(self.bounds) else None
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum, 3),
+            "buckets": dict(
+                zip([str(bound) for bound in self.bounds] + ["+Inf"], self.counts)
+            ),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+        }
+
+
+histograms: Dict[str, Histogram] = {}
+
+request_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def histogram(name: str) -> Histogram:
+    found = histograms.get(name)
+    if found is None:
+        found = histograms[name] = Histogram(name)
+    return found
+
+
+def record(name: str, elapsed_ms: float) -> None:
+    histogram(name).observe(elapsed_ms)
+    timings = request_timings.get()
+    if timings is not None:
+        timings.append((name, elapsed_ms))
+
+
+class Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> "Span":
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        record(self.name, (perf_counter_ns() - self.start) / 1e6)
+
+
+def server_timing_header(timings: List[Tuple[str, float]], total_ms: float) -> str:
+    totals: Dict[str, float] = {}
+    for name, elapsed_ms in timings:
+        totals[name] = totals.get(name, 0.0) + elapsed_ms
+    totals["total"] = total_ms
+    return ", ".join(f"{name};dur={elapsed:.2f}" for name, elapsed in totals.items())
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    return {name: hist.snapshot() for name, hist in sorted(histograms.items())}
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: List[Tuple[str, float]] = []
+        token = request_timings.set(timings)
+        start = perf_counter_ns()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_ms = (perf_counter_ns() - start) / 1e6
+                header = server_timing_header(timings, total_ms)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", header.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_timings.reset(token)
@@ -0,0 +1,48 @@
+from time import perf_counter_ns
+from typing import Dict
+from app.core.config import settings
+from app.core.metrics import record_upstream
+from app.core.priority import PriorityGate
+from app.core.timing import record
+
+
+class UpstreamGovernor:
+    def __init__(self, name: str, max_concurrency: int):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.gate = PriorityGate(max_concurrency)
+        self.span_name = f"upstream.{name}"
+
+    @property
+    def in_flight(self) -> int:
+        return self.gate.in_use
+
+
+class UpstreamCall:
+    __slots__ = ("governor", "start")
+
+    def __init__(self, governor: UpstreamGovernor):
+        self.governor = governor
+
+    async def __aenter__(self) -> "UpstreamCall":
+        await self.governor.gate.acquire()
+        self.start = perf_counter_ns()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        record(self.governor.span_name, (perf_counter_ns() - self.start) / 1e6)
+        if exc_type is not None:
+            record_upstream(self.governor.name, "transport_error")
+        self.governor.gate.release()
+
+
+UPSTREAM_SERVICES = ["abstract_email", "abstract_phone", "abstract_ip", "winston_ai"]
+
+governors: Dict[str, UpstreamGovernor] = {
+    name: UpstreamGovernor(name, settings.UPSTREAM_MAX_CONCURRENCY)
+    for name in UPSTREAM_SERVICES
+}
+
+
+def upstream_governor(name: str) -> UpstreamCall:
+    return UpstreamCall(governors[name])
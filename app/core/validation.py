@@ -5,17 +5,27 @@ from app.core.config import settings
 class FileValidator:
     @staticmethod
     async def validate_file(file: UploadFile) -> bytes:
-        if not file.filename:
+        FileValidator.validate_filename(file.filename)
+        file_content = await file.read()
+        return FileValidator.validate_content(file.filename, file_content)
+
+    @staticmethod
+    def validate_filename(filename: str) -> str:
+        if not filename:
             raise HTTPException(status_code=400, detail="No filename provided")
 
-        file_extension = file.filename.lower().split(".")[-1]
+        file_extension = filename.lower().split(".")[-1]
         if file_extension not in settings.ALLOWED_FILE_TYPES:
             raise HTTPException(
                 status_code=400,
                 detail=f"Unsupported file type. Allowed: {', '.join(settings.ALLOWED_FILE_TYPES).upper()}",
             )
 
-        file_content = await file.read()
+        return file_extension
+
+    @staticmethod
+    def validate_content(filename: str, file_content: bytes) -> bytes:
+        file_extension = FileValidator.validate_filename(filename)
 
         if len(file_content) == 0:
             raise HTTPException(status_code=400, detail="Empty file provided")
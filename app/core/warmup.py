@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+from app.core.config import settings
+from app.core.document_context import DocumentContext
+from app.core.http_client import http_client
+from app.core.parse_pool import parse_pool
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_TEXT = (
+    "Jane Example\nEmail: jane.example@example.com\nPhone: +1 (415) 555-2671\n\n"
+    "Results-driven engineer and team player with excellent communication skills. "
+    "Led migration of billing services—cut latency by 40%."
+)
+
+
+def _load_phone_metadata() -> None:
+    import phonenumbers
+
+    for region in phonenumbers.SUPPORTED_REGIONS:
+        phonenumbers.PhoneMetadata.metadata_for_region(region)
+    parsed = phonenumbers.parse("+1 415 555 2671", "US")
+    phonenumbers.is_valid_number(parsed)
+    phonenumbers.region_code_for_number(parsed)
+
+
+def _load_email_validator() -> None:
+    from email_validator import EmailNotValidError, validate_email
+
+    try:
+        validate_email("jane.example@example.com", check_deliverability=False)
+    except EmailNotValidError:
+        pass
+
+
+def _compile_patterns() -> None:
+    from app.services.ai_detection import AIContentDetectionService
+    from app.services.contact_verification import ContactVerificationService
+
+    context = DocumentContext(SAMPLE_TEXT)
+    ContactVerificationService()._extract_contact_info(context)
+    AIContentDetectionService()._basic_ai_detection(context)
+
+
+def _import_parsers() -> None:
+    from app.services.document_processor import DocumentProcessor
+
+    DocumentProcessor.warm_up()
+
+
+PRELOAD_STEPS = [
+    ("phonenumbers", _load_phone_metadata),
+    ("email_validator", _load_email_validator),
+    ("patterns", _compile_patterns),
+]
+
+
+class Warmup:
+    def __init__(self):
+        self.ready = False
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+        self.steps: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def _step(self, name: str, coro) -> None:
+        start = time.perf_counter()
+        try:
+            await coro
+        except Exception as e:
+            self.errors[name] = str(e)
+            logger.warning(f"Warm-up step {name} failed: {e}")
+        self.steps[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    async def run(self) -> None:
+        self.started_at = time.perf_counter()
+
+        for name, step in PRELOAD_STEPS:
+            await self._step(name, asyncio.to_thread(step))
+        await self._step("parse_pool", parse_pool.warm_up())
+        await self._step(
+            "http_pool",
+            http_client.preconnect(
+                url
+                for url, api_key in [
+                    (settings.ABSTRACT_EMAIL_API, settings.ABSTRACT_EMAIL_API_KEY),
+                    (settings.ABSTRACT_PHONE_API, settings.ABSTRACT_PHONE_API_KEY),
+                    (settings.ABSTRACT_IP_API, settings.ABSTRACT_IP_API_KEY),
+                    (settings.WINSTON_AI_API, settings.WINSTON_AI_API_KEY),
+                ]
+                if api_key
+            ),
+        )
+
+        self.completed_at = time.perf_counter()
+        self.ready = True
+
+    def preload(self) -> None:
+        for name, step in PRELOAD_STEPS + [("parsers", _import_parsers)]:
+            start = time.perf_counter()
+            step()
+            self.steps[f"preload_{name}"] = round(
+                (time.perf_counter() - start) * 1000, 1
+            )
+
+    def start(self) -> asyncio.Task:
+        if (
+            self._task is None
+            or self._task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        duration = None
+        if self.completed_at is not None:
+            duration = round((self.completed_at - self.started_at) * 1000, 1)
+        return {
+            "ready": self.ready,
+            "warmup_ms": duration,
+            "steps": dict(self.steps),
+            "errors": dict(self.errors),
+        }
+
+
+warmup = Warmup()
@@ -0,0 +1,197 @@
+import gc
+import importlib.util
+import logging
+import os
+import random
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Optional
+from decouple import config
+from app.core.cpu import available_cpus
+
+logger = logging.getLogger("app.launcher")
+
+WEB_CONCURRENCY: int = config("WEB_CONCURRENCY", default=0, cast=int)
+WORKER_MAX_REQUESTS: int = config("WORKER_MAX_REQUESTS", default=2000, cast=int)
+WORKER_MAX_REQUESTS_JITTER: int = config(
+    "WORKER_MAX_REQUESTS_JITTER", default=200, cast=int
+)
+GRACEFUL_TIMEOUT: int = config("GRACEFUL_TIMEOUT", default=30, cast=int)
+
+
+def worker_count(cpus: int, requested: int = WEB_CONCURRENCY) -> int:
+    return requested if requested > 0 else cpus
+
+
+def configure_environment(workers: int, cpus: int) -> None:
+    if config("PARSE_WORKERS", default=None) is None:
+        os.environ["PARSE_WORKERS"] = str(max(1, cpus // workers))
+
+    if workers > 1 and config("RATE_LIMIT_STORAGE_URI", default=None) is None:
+        path = os.path.join(tempfile.gettempdir(), "resume-fraud-rate-limits.db")
+        os.environ["RATE_LIMIT_STORAGE_URI"] = f"sqlite:///{path}"
+
+    if workers > 1 and not config("JOB_STORE_PATH", default=""):
+        path = os.path.join(tempfile.gettempdir(), "resume-fraud-jobs.db")
+        os.environ["JOB_STORE_PATH"] = path
+
+    if workers > 1:
+        metrics_dir = config(
+            "PROMETHEUS_MULTIPROC_DIR",
+            default=os.path.join(tempfile.gettempdir(), "resume-fraud-metrics"),
+        )
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir, exist_ok=True)
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+
+
+def server_options() -> Dict[str, Any]:
+    return {
+        "host": os.environ.get("HOST", "0.0.0.0"),
+        "port": int(os.environ.get("PORT", 8000)),
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "lifespan": "on",
+        "timeout_graceful_shutdown": GRACEFUL_TIMEOUT,
+    }
+
+
+def preload():
+    from app.main import app
+    from app.core.warmup import warmup
+
+    warmup.preload()
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+class Supervisor:
+    RESPAWN_BACKOFF = 1.0
+
+    def __init__(self, app, workers: int, options: Dict[str, Any]):
+        self.app = app
+        self.workers = workers
+        self.options = options
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+        self.kill_deadline: Optional[float] = None
+        self.socket = None
+
+    def _max_requests(self) -> Optional[int]:
+        if WORKER_MAX_REQUESTS <= 0:
+            return None
+        return WORKER_MAX_REQUESTS + random.randint(0, WORKER_MAX_REQUESTS_JITTER)
+
+    def _run_worker(self) -> None:
+        import uvicorn
+
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        random.seed()
+
+        server = uvicorn.Server(
+            uvicorn.Config(
+                self.app, limit_max_requests=self._max_requests(), **self.options
+            )
+        )
+        server.run(sockets=[self.socket])
+
+    def spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                self._run_worker()
+            except BaseException:
+                logger.exception("Worker crashed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        self.children[pid] = time.monotonic()
+        logger.info(f"Started worker {pid}")
+        return pid
+
+    def stop(self, signum=None, frame=None) -> None:
+        if self.stopping:
+            return
+
+        self.stopping = True
+        self.kill_deadline = time.monotonic() + GRACEFUL_TIMEOUT * 2 + 5
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self) -> None:
+        from app.core.metrics import mark_process_dead
+
+        pid, status = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            if self.stopping and time.monotonic() > self.kill_deadline:
+                for child in list(self.children):
+                    os.kill(child, signal.SIGKILL)
+            time.sleep(0.1)
+            return
+
+        started = self.children.pop(pid, time.monotonic())
+        mark_process_dead(pid)
+        if self.stopping:
+            return
+
+        exit_code = os.waitstatus_to_exitcode(status)
+        logger.info(f"Worker {pid} exited with {exit_code}, restarting")
+        if exit_code != 0 and time.monotonic() - started < self.RESPAWN_BACKOFF:
+            time.sleep(self.RESPAWN_BACKOFF)
+        self.spawn()
+
+    def run(self) -> int:
+        import uvicorn
+
+        self.socket = uvicorn.Config(self.app, **self.options).bind_socket()
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        for _ in range(self.workers):
+            self.spawn()
+
+        while self.children:
+            try:
+                self._reap()
+            except ChildProcessError:
+                break
+
+        self.socket.close()
+        return 0
+
+
+def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO, format="%(levelname)s:     [launcher] %(message)s"
+    )
+    cpus = available_cpus()
+    workers = worker_count(cpus)
+    configure_environment(workers, cpus)
+    options = server_options()
+
+    if not hasattr(os, "fork"):
+        import uvicorn
+
+        uvicorn.run("app.main:app", **options)
+        return 0
+
+    app = preload()
+    logger.info(
+        f"Starting {workers} workers on {cpus} CPUs "
+        f"(loop={options['loop']}, http={options['http']})"
+    )
+    return Supervisor(app, workers, options).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
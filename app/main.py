@@ -1,9 +1,37 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Request
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import List, Optional
+from fastapi import (
+    Depends,
+    FastAPI,
+    UploadFile,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+)
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+from prometheus_client import CONTENT_TYPE_LATEST
 from app.models.schemas import (
     HealthResponse,
+    ReadinessResponse,
     FraudDetectionResult,
+    JobResponse,
+    ProfileSummary,
+    ResultStoreStats,
+    RiskLevel,
+    RulesStatus,
+    StoredResult,
     ContactVerificationResult,
     AIContentResult,
     DocumentAnalysisResult,
@@ -12,21 +40,62 @@ from app.services.document_processor import DocumentProcessor
 from app.services.contact_verification import ContactVerificationService
 from app.services.ai_detection import AIContentDetectionService
 from app.services.document_analysis import DocumentAnalysisService
-from app.services.fraud_scorer import FraudScoringService
+from app.services.detection_pipeline import FraudDetectionPipeline, STAGE_MODELS
+from app.services.batch_processor import BatchProcessor
+from app.services.job_queue import job_queue, QueueFullError
+from app.core.capture import CaptureMiddleware, traffic_capture
+from app.core.http_client import http_client
+from app.core.metrics import MetricsMiddleware, render as render_metrics, state_sampler
+from app.core.parse_pool import parse_pool
+from app.core.priority import PriorityMiddleware
+from app.core.result_store import result_store
+from app.core.profiler import profiler, require_admin, to_collapsed, to_speedscope
+from app.core.rules import RulesError, rulebook
+from app.core.timing import ServerTimingMiddleware, Span
 from app.core.validation import FileValidator
-from app.core.rate_limiter import limiter, rate_limit_handler, get_real_client_ip
-from app.core.cache import cache
+from app.core.rate_limiter import (
+    limiter,
+    rate_limit_for,
+    rate_limit_handler,
+    get_real_client_ip,
+)
 from app.core.config import settings
+from app.core.warmup import warmup
 from slowapi.errors import RateLimitExceeded
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await job_queue.start()
+    warmup.start()
+    state_sampler.start()
+    result_store.start()
+    rulebook.start()
+    yield
+    await rulebook.stop()
+    await state_sampler.stop()
+    await warmup.stop()
+    await job_queue.drain(settings.SHUTDOWN_DRAIN_TIMEOUT)
+    await job_queue.stop()
+    await result_store.stop()
+    await http_client.aclose()
+    parse_pool.shutdown()
+    traffic_capture.close()
+
+
 app = FastAPI(
     title="Resume Fraud Detection System",
     description="AI-powered resume fraud detection system with contact verification, AI content detection, and document authenticity analysis",
     version="1.0.0",
     docs_url="/docs" if settings.DOCS_ENABLED else None,
     redoc_url="/redoc" if settings.DOCS_ENABLED else None,
+    lifespan=lifespan,
 )
 
+app.add_middleware(PriorityMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(CaptureMiddleware)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
 
@@ -51,23 +120,44 @@ async def health_check():
     return HealthResponse(status="healthy")
 
 
+@app.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness Check",
+    description="Report ready only once the startup warm-up has finished",
+)
+async def readiness_check():
+    readiness = ReadinessResponse(
+        status="ready" if warmup.ready else "warming_up", **warmup.status()
+    )
+    if not warmup.ready:
+        return JSONResponse(status_code=503, content=readiness.model_dump(mode="json"))
+    return readiness
+
+
+@app.get(
+    "/metrics",
+    summary="Prometheus Metrics",
+    description="Request, cache, upstream and queue metrics in Prometheus text format, aggregated across workers",
+)
+async def metrics():
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.post(
     "/api/v1/verify/contact",
     response_model=ContactVerificationResult,
     summary="Contact Information Verification",
     description="Verify email addresses and phone numbers for fraud indicators",
 )
-@limiter.limit("10/minute")
+@limiter.limit(rate_limit_for("service"))
 async def verify_contact_only(request: Request, file: UploadFile = File(...)):
     file_content = await FileValidator.validate_file(file)
-    document_data = await DocumentProcessor.extract_text_and_metadata(
-        file_content, file.filename
-    )
+    context = await DocumentProcessor.extract_context(file_content, file.filename)
 
     contact_service = ContactVerificationService()
     client_ip = get_real_client_ip(request)
-    result = await contact_service.verify_contact_info(document_data["text"], client_ip)
-    await contact_service.close()
+    result = await contact_service.verify_contact_info(context, client_ip)
 
     return ContactVerificationResult(**result)
 
@@ -78,16 +168,13 @@ async def verify_contact_only(request: Request, file: UploadFile = File(...)):
     summary="AI Content Detection",
     description="Detect AI-generated content in resume sections",
 )
-@limiter.limit("10/minute")
+@limiter.limit(rate_limit_for("service"))
 async def analyze_ai_content_only(request: Request, file: UploadFile = File(...)):
     file_content = await FileValidator.validate_file(file)
-    document_data = await DocumentProcessor.extract_text_and_metadata(
-        file_content, file.filename
-    )
+    context = await DocumentProcessor.extract_context(file_content, file.filename)
 
     ai_service = AIContentDetectionService()
-    result = await ai_service.detect_ai_content(document_data["text"])
-    await ai_service.close()
+    result = await ai_service.detect_ai_content(context)
 
     return AIContentResult(**result)
 
@@ -98,16 +185,12 @@ async def analyze_ai_content_only(request: Request, file: UploadFile = File(...)
     summary="Document Authenticity Analysis",
     description="Analyze document metadata for authenticity and template abuse indicators",
 )
-@limiter.limit("10/minute")
+@limiter.limit(rate_limit_for("service"))
 async def examine_document_only(request: Request, file: UploadFile = File(...)):
     file_content = await FileValidator.validate_file(file)
-    document_data = await DocumentProcessor.extract_text_and_metadata(
-        file_content, file.filename
-    )
+    context = await DocumentProcessor.extract_context(file_content, file.filename)
 
-    result = DocumentAnalysisService.analyze_document_authenticity(
-        document_data["metadata"]
-    )
+    result = DocumentAnalysisService.analyze_document_authenticity(context.metadata)
     return DocumentAnalysisResult(**result)
 
 
@@ -117,59 +200,261 @@ async def examine_document_only(request: Request, file: UploadFile = File(...)):
     summary="Complete Fraud Detection",
     description="Comprehensive fraud analysis using all detection methods with weighted scoring",
 )
-@limiter.limit("5/minute")
+@limiter.limit(rate_limit_for("detect"))
 async def detect_resume_fraud(request: Request, file: UploadFile = File(...)):
     file_content = await FileValidator.validate_file(file)
+    client_ip = get_real_client_ip(request)
+    profile_reason = profiler.should_profile(request)
+    headers = {}
+
+    try:
+        if profile_reason:
+            async with profiler.profile(
+                file_content, file.filename, profile_reason
+            ) as profile:
+                body = await FraudDetectionPipeline.run_json(
+                    file_content, file.filename, client_ip
+                )
+            headers["X-Profile-Id"] = profile.id
+        else:
+            body = await FraudDetectionPipeline.run_json(
+                file_content, file.filename, client_ip
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.post(
+    "/api/v1/detect/resume/stream",
+    summary="Progressive Fraud Detection",
+    description="Complete fraud analysis streamed as Server-Sent Events: extraction, document, contact, ai and final events are emitted as each stage completes",
+)
+@limiter.limit(rate_limit_for("detect"))
+async def detect_resume_fraud_stream(request: Request, file: UploadFile = File(...)):
+    file_content = await FileValidator.validate_file(file)
+    client_ip = get_real_client_ip(request)
+
+    async def events():
+        try:
+            async for stage, result in FraudDetectionPipeline.stream(
+                file_content, file.filename, client_ip
+            ):
+                with Span("serialization"):
+                    payload = STAGE_MODELS[stage](**result).model_dump_json()
+                yield f"event: {stage}\ndata: {payload}\n\n"
+        except HTTPException as e:
+            payload = json.dumps({"detail": e.detail, "status_code": e.status_code})
+            yield f"event: error\ndata: {payload}\n\n"
+        except Exception as e:
+            payload = json.dumps({"detail": f"Processing error: {str(e)}"})
+            yield f"event: error\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post(
+    "/api/v1/detect/batch",
+    summary="Batch Fraud Detection",
+    description="Analyze multiple resumes or a single ZIP archive, streaming one NDJSON result per file as each completes",
+)
+@limiter.limit(rate_limit_for("batch"))
+async def detect_resume_batch(request: Request, files: List[UploadFile] = File(...)):
+    items = BatchProcessor.iter_items(files)
+    client_ip = get_real_client_ip(request)
+
+    return StreamingResponse(
+        BatchProcessor.stream_results(items, client_ip),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.post(
+    "/api/v1/jobs",
+    response_model=JobResponse,
+    status_code=202,
+    summary="Submit Fraud Detection Job",
+    description="Queue a complete fraud analysis and return a job id to poll, optionally posting the result to a local callback URL",
+)
+@limiter.limit(rate_limit_for("jobs"))
+async def submit_detection_job(
+    request: Request,
+    file: UploadFile = File(...),
+    callback_url: Optional[str] = Form(None),
+):
+    file_content = await FileValidator.validate_file(file)
 
-    cached_result = cache.get_document_result(file_content)
-    if cached_result:
-        return FraudDetectionResult(**cached_result)
+    try:
+        callback_url = job_queue.validate_callback_url(callback_url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        document_data = await DocumentProcessor.extract_text_and_metadata(
-            file_content, file.filename
+        job = await job_queue.submit(
+            file_content, file.filename, get_real_client_ip(request), callback_url
+        )
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Job queue is full, please retry later",
+            headers={"Retry-After": str(e.retry_after)},
         )
-        text = document_data["text"]
-        metadata = document_data["metadata"]
 
-        contact_service = ContactVerificationService()
-        ai_service = AIContentDetectionService()
+    return job_queue.to_response(job)
 
-        client_ip = get_real_client_ip(request)
-        contact_result = await contact_service.verify_contact_info(text, client_ip)
-        ai_result = await ai_service.detect_ai_content(text)
-        document_result = DocumentAnalysisService.analyze_document_authenticity(
-            metadata
-        )
 
-        await contact_service.close()
-        await ai_service.close()
+@app.get(
+    "/api/v1/jobs/{job_id}",
+    response_model=JobResponse,
+    summary="Fraud Detection Job Status",
+    description="Poll a submitted job for its status and, once completed, its result",
+)
+async def get_detection_job(job_id: str):
+    response = await job_queue.lookup(job_id)
+    if response is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return response
+
 
-        contact_verification = ContactVerificationResult(**contact_result)
-        ai_content_analysis = AIContentResult(**ai_result)
-        document_analysis = DocumentAnalysisResult(**document_result)
+@app.get(
+    "/admin/profiles",
+    response_model=List[ProfileSummary],
+    summary="Recent Request Profiles",
+    description="List recent sampled or requested pipeline profiles, newest first (requires X-Admin-Key)",
+    dependencies=[Depends(require_admin)],
+)
+async def list_profiles():
+    return profiler.recent()
 
-        fraud_result = FraudScoringService.calculate_overall_risk(
-            contact_result, ai_result, document_result
-        )
 
-        result = FraudDetectionResult(
-            overall_risk_score=fraud_result["overall_risk_score"],
-            risk_level=fraud_result["risk_level"],
-            confidence=fraud_result["confidence"],
-            detected_issues=fraud_result["detected_issues"],
-            explanation=fraud_result["explanation"],
-            recommendations=fraud_result["recommendations"],
-            contact_verification=contact_verification,
-            ai_content_analysis=ai_content_analysis,
-            document_analysis=document_analysis,
+@app.get(
+    "/admin/profiles/{profile_id}",
+    summary="Request Profile",
+    description="Fetch a profile as JSON, collapsed stacks (flamegraph.pl) or speedscope format (requires X-Admin-Key)",
+    dependencies=[Depends(require_admin)],
+)
+async def get_profile(
+    profile_id: str,
+    format: str = Query("json", pattern="^(json|collapsed|speedscope)$"),
+):
+    profile = profiler.load(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    if format == "collapsed":
+        return PlainTextResponse(to_collapsed(profile))
+    if format == "speedscope":
+        return JSONResponse(
+            to_speedscope(profile),
+            headers={
+                "Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'
+            },
         )
+    return profile
+
+
+def require_result_store() -> None:
+    if not result_store.enabled:
+        raise HTTPException(status_code=404, detail="Result store is not enabled")
+
+
+def result_filters(
+    risk_level: Optional[RiskLevel] = None,
+    since: Optional[datetime] = Query(None, description="Inclusive start (ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="Exclusive end (ISO 8601)"),
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    domain: Optional[str] = Query(None, description="Email domain"),
+    content_hash: Optional[str] = None,
+    rule_version: Optional[str] = None,
+) -> dict:
+    return {
+        "risk_level": risk_level.value if risk_level else None,
+        "since": since,
+        "until": until,
+        "email": email,
+        "phone": phone,
+        "domain": domain,
+        "content_hash": content_hash,
+        "rule_version": rule_version,
+    }
 
-        cache.cache_document_result(file_content, result.model_dump())
-        return result
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
+@app.get(
+    "/admin/results",
+    response_model=List[StoredResult],
+    summary="Stored Results",
+    description="Search persisted fraud detection results by risk level, time range, email, phone or domain, newest first (requires X-Admin-Key)",
+    dependencies=[Depends(require_admin), Depends(require_result_store)],
+)
+async def list_results(
+    filters: dict = Depends(result_filters),
+    limit: int = Query(100, ge=1, le=1000),
+    before_id: Optional[int] = Query(
+        None, description="Return results older than this id"
+    ),
+):
+    return await asyncio.to_thread(
+        result_store.query, limit=limit, before_id=before_id, **filters
+    )
+
+
+@app.get(
+    "/admin/results/stats",
+    response_model=ResultStoreStats,
+    summary="Stored Result Statistics",
+    description="Result counts and average scores per risk level for the same filters as /admin/results (requires X-Admin-Key)",
+    dependencies=[Depends(require_admin), Depends(require_result_store)],
+)
+async def result_stats(filters: dict = Depends(result_filters)):
+    return await asyncio.to_thread(result_store.stats, **filters)
+
+
+@app.get(
+    "/admin/results/{result_id}",
+    response_model=StoredResult,
+    summary="Stored Result",
+    description="Fetch one persisted fraud detection result (requires X-Admin-Key)",
+    dependencies=[Depends(require_admin), Depends(require_result_store)],
+)
+async def get_result(result_id: int):
+    result = await asyncio.to_thread(result_store.get, result_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Result not found")
+    return result
+
+
+@app.get(
+    "/admin/rules",
+    response_model=RulesStatus,
+    summary="Active Scoring Rules",
+    description="Version, weights and thresholds of the rules this worker is scoring with (requires X-Admin-Key)",
+    dependencies=[Depends(require_admin)],
+)
+async def get_rules():
+    return rulebook.status()
+
+
+@app.post(
+    "/admin/rules/reload",
+    response_model=RulesStatus,
+    summary="Reload Scoring Rules",
+    description="Re-read RULES_PATH and swap it in; an invalid file is rejected with 422 and the current rules stay active (requires X-Admin-Key)",
+    dependencies=[Depends(require_admin)],
+)
+async def reload_rules():
+    try:
+        await asyncio.to_thread(rulebook.reload)
+    except RulesError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return rulebook.status()
 
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -54,6 +54,19 @@ class DocumentAnalysisResult(BaseModel):
     suspicious_patterns: List[str] = []
     risk_score: float = Field(ge=0, le=1)
     confidence: float = Field(ge=0, le=1)
+    rule_contributions: Dict[str, float] = Field(
+        default={}, description="Score added by each document rule that fired"
+    )
+
+
+class ExtractionResult(BaseModel):
+    format: Optional[str] = Field(None, description="Detected document format")
+    page_count: Optional[int] = Field(None, description="Number of pages (PDF only)")
+    character_count: int = Field(description="Length of the extracted text")
+    content_hash: str = Field(description="MD5 hash of the uploaded file")
+    text_fingerprint: str = Field(
+        description="Hash of the normalized text, shared across re-exports"
+    )
 
 
 class FraudDetectionResult(BaseModel):
@@ -84,18 +97,132 @@ class FraudDetectionResult(BaseModel):
     document_analysis: Optional[DocumentAnalysisResult] = Field(
         None, description="Document authenticity analysis results"
     )
+    rule_version: Optional[str] = Field(
+        None, description="Version of the scoring rules used for this assessment"
+    )
     analysis_timestamp: datetime = Field(
         default_factory=datetime.utcnow,
         description="Timestamp when analysis was performed",
     )
 
 
+class BatchItemResult(BaseModel):
+    index: int = Field(description="Position of the file in the submitted batch")
+    filename: str = Field(description="Uploaded filename or archive member path")
+    result: Optional[FraudDetectionResult] = Field(
+        None, description="Fraud detection result when the item succeeded"
+    )
+    error: Optional[str] = Field(None, description="Error message when the item failed")
+    status_code: int = Field(
+        200, description="HTTP status the item would have returned on its own"
+    )
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobResponse(BaseModel):
+    job_id: str = Field(description="Identifier to poll at /api/v1/jobs/{job_id}")
+    status: JobStatus = Field(description="queued, running, completed, or failed")
+    filename: str
+    submitted_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    queue_position: Optional[int] = Field(
+        None, description="Approximate number of jobs ahead while queued"
+    )
+    result: Optional[FraudDetectionResult] = None
+    error: Optional[str] = None
+
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     version: str = "1.0.0"
 
 
+class ReadinessResponse(BaseModel):
+    status: str
+    ready: bool
+    warmup_ms: Optional[float] = None
+    steps: Dict[str, float] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    content_hash: str
+    filename: str
+    reason: str = Field(description="requested (admin header/query) or sampled")
+    created_at: datetime
+    duration_ms: float
+    interval_ms: float
+    samples: int
+    timings: Dict[str, float] = Field(
+        default_factory=dict, description="Stage durations in milliseconds"
+    )
+
+
+class StoredResult(BaseModel):
+    id: int
+    created_at: datetime
+    filename: Optional[str] = None
+    content_hash: str = Field(description="MD5 hash of the uploaded file")
+    text_fingerprint: Optional[str] = None
+    email: Optional[str] = Field(None, description="First email found, lowercased")
+    email_domain: Optional[str] = None
+    phone: Optional[str] = Field(None, description="First phone found, E.164 formatted")
+    client_ip: Optional[str] = None
+    overall_risk_score: float
+    risk_level: RiskLevel
+    confidence: Optional[float] = None
+    contact_risk_score: Optional[float] = None
+    ai_probability: Optional[float] = None
+    detection_method: Optional[str] = None
+    document_risk_score: Optional[float] = None
+    rule_version: Optional[str] = None
+    cached: bool = Field(
+        False, description="Served from the response cache of an earlier analysis"
+    )
+    timings: Dict[str, float] = Field(
+        default_factory=dict, description="Stage durations in milliseconds"
+    )
+    result: FraudDetectionResult
+
+
+class RiskLevelStats(BaseModel):
+    count: int
+    avg_risk_score: float
+    avg_ai_probability: Optional[float] = None
+
+
+class ResultStoreStats(BaseModel):
+    total: int
+    by_risk_level: Dict[str, RiskLevelStats] = {}
+    pending_writes: int = Field(description="Results buffered for the next batch write")
+    dropped_writes: int = Field(
+        description="Results dropped because the write backlog was full or a write failed"
+    )
+
+
+class RulesStatus(BaseModel):
+    version: str = Field(description="Version declared in the rules file")
+    digest: str = Field(description="SHA-256 of the loaded rules file")
+    path: str
+    loaded_at: datetime
+    last_error: Optional[str] = Field(
+        None, description="Why the last reload was rejected, if it was"
+    )
+    weights: Dict[str, float]
+    thresholds: Dict[str, float]
+    document_rules: int = Field(description="Number of compiled document rules")
+
+
 class ErrorResponse(BaseModel):
     error: str
     detail: Optional[str] = None
@@ -1,112 +1,104 @@
-import httpx
-import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 from app.core.config import settings
 from app.core.api_error_handler import APIErrorHandler
-from app.core.sanitizer import InputSanitizer
+from app.core.document_context import DocumentContext
+from app.core.http_client import http_client
+from app.core.metrics import DETECTION_METHODS, record_verification
+from app.core.rules import RuleSet, rulebook
+from app.core.timing import Span
+from app.core.upstream import upstream_governor
 
 
 class AIContentDetectionService:
-    MAX_TEXT_LENGTH = 5000
+    MAX_TEXT_LENGTH = DocumentContext.MAX_TEXT_LENGTH
 
-    def __init__(self):
-        self.client = httpx.AsyncClient()
+    @property
+    def client(self):
+        return http_client.get()
 
-    async def detect_ai_content(self, text: str) -> Dict[str, Any]:
-        text = InputSanitizer.sanitize_text(text, self.MAX_TEXT_LENGTH)
-        text = self._prepare_text(text)
-        ai_probability, used_api = await self._analyze_text(text)
+    async def detect_ai_content(
+        self,
+        document: Union[str, DocumentContext],
+        rules: Optional[RuleSet] = None,
+    ) -> Dict[str, Any]:
+        context = DocumentContext.coerce(document)
+        ai_probability, used_api = await self._analyze_text(context, rules)
 
         confidence = 0.9 if used_api else 0.3
+        detection_method = "winston_ai" if used_api else "pattern_fallback"
+        record_verification("winston_ai", used_api)
+        DETECTION_METHODS.labels(detection_method).inc()
 
         return {
             "overall_ai_probability": ai_probability,
             "confidence": confidence,
-            "detection_method": "winston_ai" if used_api else "pattern_fallback",
+            "detection_method": detection_method,
         }
 
-    async def _analyze_text(self, text: str) -> tuple[float, bool]:
+    async def _analyze_text(
+        self, context: DocumentContext, rules: Optional[RuleSet] = None
+    ) -> tuple[float, bool]:
         if not settings.WINSTON_AI_API_KEY:
-            return self._basic_ai_detection(text), False
+            return self._basic_ai_detection(context, rules), False
 
         try:
-            response = await self.client.post(
-                settings.WINSTON_AI_API,
-                headers={
-                    "Authorization": f"Bearer {settings.WINSTON_AI_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "text": text,
-                    "version": "latest",
-                    "sentences": False,
-                    "language": "en",
-                },
-            )
+            async with upstream_governor("winston_ai"):
+                response = await self.client.post(
+                    settings.WINSTON_AI_API,
+                    headers={
+                        "Authorization": f"Bearer {settings.WINSTON_AI_API_KEY}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "text": self._prepare_text(context.text),
+                        "version": "latest",
+                        "sentences": False,
+                        "language": "en",
+                    },
+                )
 
             success, error_info = APIErrorHandler.handle_api_response(
                 "Winston AI", response
             )
             if not success:
-                return self._basic_ai_detection(text), False
+                return self._basic_ai_detection(context, rules), False
 
             data = response.json()
             if "error" in data or data.get("status") != 200:
-                return self._basic_ai_detection(text), False
+                return self._basic_ai_detection(context, rules), False
 
             ai_score = float(data.get("score", 0.0))
             return ai_score / 100.0, True
         except Exception:
             pass
 
-        return self._basic_ai_detection(text), False
-
-    def _basic_ai_detection(self, text: str) -> float:
-        ai_indicators = [
-            r"\bas an ai\b",
-            r"\bi am an ai\b",
-            r"\bai-generated\b",
-            r"\bgenerated by\b",
-            r"\bai assistant\b",
-            r"\blarge language model\b",
-        ]
-
-        generic_phrases = [
-            r"\bexcellent communication skills\b",
-            r"\bstrong problem-solving abilities\b",
-            r"\bteam player\b",
-            r"\bdetail-oriented\b",
-            r"\bresults-driven\b",
-        ]
+        return self._basic_ai_detection(context, rules), False
 
-        ai_score = 0.0
-        generic_score = 0.0
-        text_lower = text.lower()
+    def _basic_ai_detection(
+        self, context: DocumentContext, rules: Optional[RuleSet] = None
+    ) -> float:
+        rules = rules or rulebook.current
+        with Span("ai.local_patterns"):
+            ai_score = 0.0
+            generic_score = 0.0
+            text_lower = context.lower
 
-        for pattern in ai_indicators:
-            if re.search(pattern, text_lower):
-                ai_score += 0.3
+            for pattern in rules.ai_indicators:
+                if pattern.search(text_lower):
+                    ai_score += 0.3
 
-        for pattern in generic_phrases:
-            if re.search(pattern, text_lower):
-                generic_score += 0.1
+            for pattern in rules.generic_phrases:
+                if pattern.search(text_lower):
+                    generic_score += 0.1
 
-        em_dash_count = len(re.findall(r"—\w", text))
-        if em_dash_count >= 3:
-            ai_score += 0.2
+            em_dash_count = len(rules.em_dash.findall(context.text))
+            if em_dash_count >= 3:
+                ai_score += 0.2
 
-        return min(ai_score + (generic_score * 0.5), 1.0)
+            return min(ai_score + (generic_score * 0.5), 1.0)
 
     def _prepare_text(self, text: str) -> str:
-        text = text.strip()
-
-        if len(text) > self.MAX_TEXT_LENGTH:
-            text = text[: self.MAX_TEXT_LENGTH]
-
         if len(text) < 300:
             text = text + " " * (300 - len(text))
 
         return text
-
-    async def close(self):
-        await self.client.aclose()
@@ -0,0 +1,133 @@
+import asyncio
+import zipfile
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+from fastapi import HTTPException, UploadFile
+from app.core.config import settings
+from app.core.validation import FileValidator
+from app.models.schemas import BatchItemResult
+from app.services.detection_pipeline import FraudDetectionPipeline
+
+
+@dataclass
+class BatchItem:
+    index: int
+    filename: str
+    load: Callable[[], Awaitable[bytes]]
+
+
+class BatchProcessor:
+    @staticmethod
+    def iter_items(files: List[UploadFile]) -> Iterator[BatchItem]:
+        if len(files) == 1 and (files[0].filename or "").lower().endswith(".zip"):
+            return BatchProcessor._iter_archive(files[0])
+        return BatchProcessor._iter_uploads(files)
+
+    @staticmethod
+    def _iter_uploads(files: List[UploadFile]) -> Iterator[BatchItem]:
+        if len(files) > settings.BATCH_MAX_ITEMS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Too many files. Maximum batch size: {settings.BATCH_MAX_ITEMS}",
+            )
+
+        return (
+            BatchItem(index, upload.filename or "", upload.read)
+            for index, upload in enumerate(files)
+        )
+
+    @staticmethod
+    def _iter_archive(upload: UploadFile) -> Iterator[BatchItem]:
+        try:
+            archive = zipfile.ZipFile(upload.file)
+        except zipfile.BadZipFile:
+            raise HTTPException(status_code=400, detail="Invalid ZIP archive")
+
+        members = [info for info in archive.infolist() if not info.is_dir()]
+        if len(members) > settings.BATCH_MAX_ITEMS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Too many files. Maximum batch size: {settings.BATCH_MAX_ITEMS}",
+            )
+
+        def loader(info: zipfile.ZipInfo) -> Callable[[], Awaitable[bytes]]:
+            async def load() -> bytes:
+                if info.file_size > settings.MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE // 1024 // 1024}MB",
+                    )
+                with archive.open(info) as member:
+                    return member.read(settings.MAX_FILE_SIZE + 1)
+
+            return load
+
+        return (
+            BatchItem(index, info.filename, loader(info))
+            for index, info in enumerate(members)
+        )
+
+    @staticmethod
+    async def process_item(
+        item: BatchItem, client_ip: Optional[str]
+    ) -> BatchItemResult:
+        try:
+            FileValidator.validate_filename(item.filename)
+            file_content = FileValidator.validate_content(
+                item.filename, await item.load()
+            )
+            result = await FraudDetectionPipeline.run(
+                file_content, item.filename, client_ip
+            )
+            return BatchItemResult(
+                index=item.index, filename=item.filename, result=result
+            )
+        except HTTPException as e:
+            return BatchItemResult(
+                index=item.index,
+                filename=item.filename,
+                error=e.detail,
+                status_code=e.status_code,
+            )
+        except Exception as e:
+            return BatchItemResult(
+                index=item.index,
+                filename=item.filename,
+                error=f"Processing error: {str(e)}",
+                status_code=500,
+            )
+
+    @staticmethod
+    async def stream_results(
+        items: Iterator[BatchItem],
+        client_ip: Optional[str],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        concurrency = concurrency or settings.BATCH_CONCURRENCY
+        pending = set()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    pending.add(
+                        asyncio.ensure_future(
+                            BatchProcessor.process_item(item, client_ip)
+                        )
+                    )
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield (task.result().model_dump_json() + "\n").encode()
+        finally:
+            for task in pending:
+                task.cancel()
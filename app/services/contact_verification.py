@@ -1,56 +1,112 @@
-import httpx
 import re
-from typing import Dict, Any, Optional
-from email_validator import validate_email, EmailNotValidError
-import phonenumbers
-from phonenumbers import NumberParseException
+from typing import Dict, Any, Optional, Union
 from app.core.config import settings
 from app.core.api_error_handler import APIErrorHandler
 from app.core.sanitizer import InputSanitizer
+from app.core.document_context import DocumentContext
+from app.core.http_client import http_client
+from app.core.metrics import record_verification
+from app.core.rules import RuleSet, rulebook
+from app.core.timing import Span
+from app.core.upstream import upstream_governor
+
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+PHONE_PATTERN = re.compile(r"[\+]?[\d\s\-\(\)\.]{10,20}")
+PHONE_NORMALIZE_PATTERN = re.compile(r"[^\d+]")
 
 
 class ContactVerificationService:
-    def __init__(self):
-        self.client = httpx.AsyncClient()
+    @property
+    def client(self):
+        return http_client.get()
 
     async def verify_contact_info(
-        self, text: str, client_ip: str = None
+        self,
+        document: Union[str, DocumentContext],
+        client_ip: str = None,
+        rules: Optional[RuleSet] = None,
+    ) -> Dict[str, Any]:
+        document_contacts = await self.verify_document_contacts(document)
+        ip_result, ip_api_used = await self.verify_requester_ip(client_ip)
+        return self.combine_contact_results(
+            document_contacts, ip_result, ip_api_used, rules
+        )
+
+    async def verify_document_contacts(
+        self, document: Union[str, DocumentContext]
     ) -> Dict[str, Any]:
-        contact_info = self._extract_contact_info(text)
+        contact_info = self._extract_contact_info(document)
 
         email_result = None
         phone_result = None
-        ip_result = None
-
-        api_success_count = 0
-        total_api_calls = 0
+        email_api_used = False
+        phone_api_used = False
 
         if contact_info.get("email"):
             email_result, email_api_used = await self._verify_email(
                 contact_info["email"]
             )
-            total_api_calls += 1
-            if email_api_used:
-                api_success_count += 1
+            record_verification("abstract_email", email_api_used)
 
         if contact_info.get("phone"):
             phone_result, phone_api_used = await self._verify_phone(
                 contact_info["phone"]
             )
-            total_api_calls += 1
-            if phone_api_used:
-                api_success_count += 1
-
-        if client_ip:
-            sanitized_ip = InputSanitizer.sanitize_ip(client_ip)
-            if sanitized_ip:
-                ip_result, ip_api_used = await self._verify_ip_location(sanitized_ip)
+            record_verification("abstract_phone", phone_api_used)
+
+        return {
+            "email_verification": email_result,
+            "phone_verification": phone_result,
+            "email_api_used": email_api_used,
+            "phone_api_used": phone_api_used,
+            "original_phone": contact_info.get("phone"),
+            "email": contact_info.get("email"),
+        }
+
+    async def verify_requester_ip(
+        self, client_ip: Optional[str]
+    ) -> tuple[Optional[Dict[str, Any]], bool]:
+        if not client_ip:
+            return None, False
+
+        sanitized_ip = InputSanitizer.sanitize_ip(client_ip)
+        if not sanitized_ip:
+            return None, False
+
+        ip_result, ip_api_used = await self._verify_ip_location(sanitized_ip)
+        record_verification("abstract_ip", ip_api_used)
+        return ip_result, ip_api_used
+
+    def combine_contact_results(
+        self,
+        document_contacts: Dict[str, Any],
+        ip_result: Optional[Dict[str, Any]] = None,
+        ip_api_used: bool = False,
+        rules: Optional[RuleSet] = None,
+    ) -> Dict[str, Any]:
+        email_result = document_contacts.get("email_verification")
+        phone_result = document_contacts.get("phone_verification")
+        email_api_used = document_contacts.get("email_api_used", False)
+        phone_api_used = document_contacts.get("phone_api_used", False)
+
+        api_success_count = 0
+        total_api_calls = 0
+        for result, api_used in (
+            (email_result, email_api_used),
+            (phone_result, phone_api_used),
+            (ip_result, ip_api_used),
+        ):
+            if result:
                 total_api_calls += 1
-                if ip_api_used:
+                if api_used:
                     api_success_count += 1
 
         risk_score = self._calculate_contact_risk(
-            email_result, phone_result, ip_result, contact_info.get("phone")
+            email_result,
+            phone_result,
+            ip_result,
+            document_contacts.get("original_phone"),
+            rules,
         )
         confidence = self._calculate_verification_confidence(
             api_success_count, total_api_calls
@@ -82,14 +138,13 @@ class ContactVerificationService:
             "verification_methods": verification_methods,
         }
 
-    def _extract_contact_info(self, text: str) -> Dict[str, str]:
-        text = InputSanitizer.sanitize_text(text)
+    def _extract_contact_info(
+        self, document: Union[str, DocumentContext]
+    ) -> Dict[str, str]:
+        text = DocumentContext.coerce(document).text
 
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        phone_pattern = r"[\+]?[\d\s\-\(\)\.]{10,20}"
-
-        emails = re.findall(email_pattern, text)
-        phones = re.findall(phone_pattern, text)
+        emails = EMAIL_PATTERN.findall(text)
+        phones = PHONE_PATTERN.findall(text)
 
         sanitized_email = InputSanitizer.sanitize_email(emails[0]) if emails else None
         sanitized_phone = InputSanitizer.sanitize_phone(phones[0]) if phones else None
@@ -99,28 +154,25 @@ class ContactVerificationService:
             "phone": sanitized_phone,
         }
 
-    def _is_test_phone_number(self, phone: str) -> bool:
+    def _is_test_phone_number(
+        self, phone: str, rules: Optional[RuleSet] = None
+    ) -> bool:
         if not phone:
             return False
 
-        normalized = re.sub(r"[^\d+]", "", phone)
-
-        test_patterns = [
-            r"^555",
-            r"^1555",
-            r"^\+1555",
-            r"^1234567890$",
-            r"^5551234567$",
-        ]
+        normalized = PHONE_NORMALIZE_PATTERN.sub("", phone)
 
-        return any(re.match(pattern, normalized) for pattern in test_patterns)
+        return bool((rules or rulebook.current).test_phones.match(normalized))
 
     async def _verify_email(self, email: str) -> tuple[Dict[str, Any], bool]:
-        try:
-            validate_email(email)
-            local_valid = True
-        except EmailNotValidError:
-            local_valid = False
+        from email_validator import validate_email, EmailNotValidError
+
+        with Span("contact.local_email"):
+            try:
+                validate_email(email)
+                local_valid = True
+            except EmailNotValidError:
+                local_valid = False
 
         if not settings.ABSTRACT_EMAIL_API_KEY:
             return {
@@ -130,10 +182,11 @@ class ContactVerificationService:
             }, False
 
         try:
-            response = await self.client.get(
-                settings.ABSTRACT_EMAIL_API,
-                params={"api_key": settings.ABSTRACT_EMAIL_API_KEY, "email": email},
-            )
+            async with upstream_governor("abstract_email"):
+                response = await self.client.get(
+                    settings.ABSTRACT_EMAIL_API,
+                    params={"api_key": settings.ABSTRACT_EMAIL_API_KEY, "email": email},
+                )
 
             success, error_info = APIErrorHandler.handle_api_response(
                 "Abstract Email", response
@@ -171,22 +224,27 @@ class ContactVerificationService:
         }, False
 
     async def _verify_phone(self, phone: str) -> tuple[Dict[str, Any], bool]:
-        try:
-            parsed = phonenumbers.parse(phone, "US")
-            local_valid = phonenumbers.is_valid_number(parsed)
-            country = phonenumbers.region_code_for_number(parsed)
-        except NumberParseException:
-            local_valid = False
-            country = None
+        import phonenumbers
+        from phonenumbers import NumberParseException
+
+        with Span("contact.local_phone"):
+            try:
+                parsed = phonenumbers.parse(phone, "US")
+                local_valid = phonenumbers.is_valid_number(parsed)
+                country = phonenumbers.region_code_for_number(parsed)
+            except NumberParseException:
+                local_valid = False
+                country = None
 
         if not settings.ABSTRACT_PHONE_API_KEY:
             return {"valid": local_valid, "country": country, "carrier": None}, False
 
         try:
-            response = await self.client.get(
-                settings.ABSTRACT_PHONE_API,
-                params={"api_key": settings.ABSTRACT_PHONE_API_KEY, "phone": phone},
-            )
+            async with upstream_governor("abstract_phone"):
+                response = await self.client.get(
+                    settings.ABSTRACT_PHONE_API,
+                    params={"api_key": settings.ABSTRACT_PHONE_API_KEY, "phone": phone},
+                )
 
             success, error_info = APIErrorHandler.handle_api_response(
                 "Abstract Phone", response
@@ -214,14 +272,15 @@ class ContactVerificationService:
             return self._fallback_ip_result(ip_address), False
 
         try:
-            response = await self.client.get(
-                settings.ABSTRACT_IP_API,
-                params={
-                    "api_key": settings.ABSTRACT_IP_API_KEY,
-                    "ip_address": ip_address,
-                    "fields": "country_code,is_vpn,is_proxy,is_tor,connection,threat,abuse_confidence",
-                },
-            )
+            async with upstream_governor("abstract_ip"):
+                response = await self.client.get(
+                    settings.ABSTRACT_IP_API,
+                    params={
+                        "api_key": settings.ABSTRACT_IP_API_KEY,
+                        "ip_address": ip_address,
+                        "fields": "country_code,is_vpn,is_proxy,is_tor,connection,threat,abuse_confidence",
+                    },
+                )
 
             success, error_info = APIErrorHandler.handle_api_response(
                 "Abstract IP", response
@@ -297,6 +356,7 @@ class ContactVerificationService:
         phone_result: Optional[Dict],
         ip_result: Optional[Dict] = None,
         original_phone: Optional[str] = None,
+        rules: Optional[RuleSet] = None,
     ) -> float:
         risk = 0.0
 
@@ -316,7 +376,7 @@ class ContactVerificationService:
 
         if phone_result:
             if not phone_result.get("valid", True):
-                if original_phone and self._is_test_phone_number(original_phone):
+                if original_phone and self._is_test_phone_number(original_phone, rules):
                     pass
                 else:
                     risk += 0.3
@@ -373,6 +433,3 @@ class ContactVerificationService:
             "deliverable": local_valid,
             "quality_score": 0.5 if local_valid else 0.0,
         }
-
-    async def close(self):
-        await self.client.aclose()
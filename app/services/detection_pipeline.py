@@ -0,0 +1,240 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from app.models.schemas import (
+    AIContentResult,
+    ContactVerificationResult,
+    DocumentAnalysisResult,
+    ExtractionResult,
+    FraudDetectionResult,
+)
+from app.services.contact_verification import ContactVerificationService
+from app.services.ai_detection import AIContentDetectionService
+from app.services.document_analysis import DocumentAnalysisService
+from app.services.fraud_scorer import FraudScoringService
+from app.core.admission import AdaptiveLimiter, admission_lane
+from app.core.cache import cache
+from app.core.document_context import DocumentContext
+from app.core.parse_pool import parse_pool
+from app.core.result_store import result_store
+from app.core.rules import RuleSet, rulebook
+from app.core.timing import Span, request_timings
+
+STAGE_MODELS = {
+    "extraction": ExtractionResult,
+    "document": DocumentAnalysisResult,
+    "contact": ContactVerificationResult,
+    "ai": AIContentResult,
+    "final": FraudDetectionResult,
+}
+
+
+def _stage_timings(timings, start: float) -> Dict[str, float]:
+    totals: Dict[str, float] = {}
+    for name, elapsed_ms in timings:
+        totals[name] = round(totals.get(name, 0.0) + elapsed_ms, 3)
+    totals["total"] = round((time.perf_counter() - start) * 1000, 3)
+    return totals
+
+
+def _resolved(value: Any) -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+async def _admitted(lane: AdaptiveLimiter, coro) -> Any:
+    try:
+        async with lane.slot():
+            return await coro
+    finally:
+        coro.close()
+
+
+class FraudDetectionPipeline:
+    @staticmethod
+    async def stream(
+        file_content: bytes,
+        filename: str,
+        client_ip: Optional[str] = None,
+        rules: Optional[RuleSet] = None,
+        audit: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        rules = rules or rulebook.current
+        start = time.perf_counter()
+        request = request_timings.get()
+        timings: List[Tuple[str, float]] = []
+        request_timings.set(timings)
+        content_hash = hashlib.md5(file_content).hexdigest()
+        contact_service = ContactVerificationService()
+        ai_service = AIContentDetectionService()
+        ip_task = asyncio.ensure_future(contact_service.verify_requester_ip(client_ip))
+        tasks = [ip_task]
+
+        try:
+            document_results = cache.get_document_result(
+                file_content, content_hash, rules.cache_key
+            )
+            if document_results:
+                extraction = document_results["extraction"]
+                document_result = document_results["document_analysis"]
+                yield "extraction", extraction
+                yield "document", document_result
+                contacts_task = _resolved(document_results["document_contacts"])
+                ai_task = _resolved(document_results["ai_content_analysis"])
+                text_fingerprint = None
+            else:
+                async with admission_lane("cpu").slot():
+                    with Span("extraction"):
+                        document_data = await parse_pool.extract(file_content, filename)
+                context = DocumentContext.from_document_data(
+                    document_data, content_hash=content_hash
+                )
+                extraction = {
+                    "format": context.metadata.get("format"),
+                    "page_count": context.metadata.get("page_count"),
+                    "character_count": len(context.raw_text),
+                    "content_hash": content_hash,
+                    "text_fingerprint": context.fingerprint,
+                }
+                yield "extraction", extraction
+
+                with Span("document"):
+                    document_result = (
+                        DocumentAnalysisService.analyze_document_authenticity(
+                            context.metadata, rules
+                        )
+                    )
+                yield "document", document_result
+
+                text_result = cache.get_text_result(
+                    context.fingerprint, rules.cache_key
+                )
+                if text_result:
+                    contacts_task = _resolved(text_result["document_contacts"])
+                    ai_task = _resolved(text_result["ai_content_analysis"])
+                    text_fingerprint = None
+                else:
+                    upstream = admission_lane("upstream")
+                    contacts_task = asyncio.ensure_future(
+                        _admitted(
+                            upstream, contact_service.verify_document_contacts(context)
+                        )
+                    )
+                    ai_task = asyncio.ensure_future(
+                        _admitted(
+                            upstream, ai_service.detect_ai_content(context, rules)
+                        )
+                    )
+                    tasks += [contacts_task, ai_task]
+                    text_fingerprint = context.fingerprint
+
+            contact_result = None
+            ai_result = None
+            waiting = {ip_task, contacts_task, ai_task}
+            while waiting:
+                done, waiting = await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_COMPLETED
+                )
+                if ai_task in done:
+                    ai_result = ai_task.result()
+                    yield "ai", ai_result
+                if contact_result is None and contacts_task.done() and ip_task.done():
+                    ip_result, ip_api_used = ip_task.result()
+                    contact_result = contact_service.combine_contact_results(
+                        contacts_task.result(), ip_result, ip_api_used, rules
+                    )
+                    yield "contact", contact_result
+
+            if text_fingerprint:
+                cache.cache_text_result(
+                    text_fingerprint,
+                    {
+                        "document_contacts": contacts_task.result(),
+                        "ai_content_analysis": ai_result,
+                    },
+                    rule_version=rules.cache_key,
+                )
+            if not document_results:
+                cache.cache_document_result(
+                    file_content,
+                    {
+                        "extraction": extraction,
+                        "document_contacts": contacts_task.result(),
+                        "ai_content_analysis": ai_result,
+                        "document_analysis": document_result,
+                    },
+                    content_hash=content_hash,
+                    rule_version=rules.cache_key,
+                )
+
+            with Span("scoring"):
+                final_result = FraudScoringService.calculate_overall_risk(
+                    contact_result, ai_result, document_result, rules
+                )
+            entry = result_store.record(
+                final_result,
+                extraction,
+                contacts_task.result(),
+                filename,
+                client_ip,
+                _stage_timings(timings, start),
+            )
+            if audit is not None and entry is not None:
+                audit.update(entry)
+            yield "final", final_result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            request_timings.set(request)
+            if request is not None:
+                request.extend(timings)
+
+    @staticmethod
+    async def run(
+        file_content: bytes,
+        filename: str,
+        client_ip: Optional[str] = None,
+        rules: Optional[RuleSet] = None,
+        audit: Optional[Dict[str, Any]] = None,
+    ) -> FraudDetectionResult:
+        final_result = None
+        async for stage, result in FraudDetectionPipeline.stream(
+            file_content, filename, client_ip, rules, audit
+        ):
+            if stage == "final":
+                final_result = result
+        return FraudDetectionResult(**final_result)
+
+    @staticmethod
+    async def run_json(
+        file_content: bytes, filename: str, client_ip: Optional[str] = None
+    ) -> bytes:
+        rules = rulebook.current
+        start = time.perf_counter()
+        content_hash = hashlib.md5(file_content).hexdigest()
+        cached = cache.get_response_entry(content_hash, client_ip, rules.cache_key)
+        if cached is not None:
+            body, entry = cached
+            if entry is not None:
+                result_store.record_cached(
+                    entry, filename, client_ip, _stage_timings([], start)
+                )
+            return body
+
+        audit: Dict[str, Any] = {}
+        result = await FraudDetectionPipeline.run(
+            file_content, filename, client_ip, rules, audit
+        )
+        with Span("serialization"):
+            body = result.model_dump_json().encode()
+        cache.cache_response(
+            content_hash,
+            client_ip,
+            body,
+            rule_version=rules.cache_key,
+            record=audit or None,
+        )
+        return body
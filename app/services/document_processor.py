@@ -1,7 +1,19 @@
-import fitz
-from docx import Document
+import importlib
+import re
 from typing import Dict, Any, Optional
 from datetime import datetime
+from app.core.document_context import DocumentContext
+
+XMP_FIELDS = {
+    "xmp_create_date": "xmp:CreateDate",
+    "xmp_modify_date": "xmp:ModifyDate",
+    "xmp_creator_tool": "xmp:CreatorTool",
+    "xmp_producer": "pdf:Producer",
+}
+XMP_PATTERNS = {
+    name: re.compile(rf'{re.escape(tag)}(?:\s*=\s*"([^"]*)"|\s*>\s*([^<]*?)\s*<)')
+    for name, tag in XMP_FIELDS.items()
+}
 
 
 class DocumentProcessor:
@@ -9,6 +21,10 @@ class DocumentProcessor:
     async def extract_text_and_metadata(
         file_content: bytes, filename: str
     ) -> Dict[str, Any]:
+        return DocumentProcessor.extract_sync(file_content, filename)
+
+    @staticmethod
+    def extract_sync(file_content: bytes, filename: str) -> Dict[str, Any]:
         file_extension = filename.lower().split(".")[-1]
 
         if file_extension == "pdf":
@@ -20,8 +36,22 @@ class DocumentProcessor:
         else:
             raise ValueError(f"Unsupported file type: {file_extension}")
 
+    @staticmethod
+    def warm_up() -> None:
+        for module in ("fitz", "docx"):
+            importlib.import_module(module)
+
+    @staticmethod
+    async def extract_context(file_content: bytes, filename: str) -> DocumentContext:
+        document_data = await DocumentProcessor.extract_text_and_metadata(
+            file_content, filename
+        )
+        return DocumentContext.from_document_data(document_data, file_content)
+
     @staticmethod
     def _process_pdf(file_content: bytes) -> Dict[str, Any]:
+        import fitz
+
         doc = fitz.open(stream=file_content, filetype="pdf")
 
         text = ""
@@ -30,6 +60,7 @@ class DocumentProcessor:
             text += page.get_text()
 
         metadata = doc.metadata
+        xmp = doc.get_xml_metadata()
         doc.close()
 
         return {
@@ -43,12 +74,23 @@ class DocumentProcessor:
                 "creator": metadata.get("creator"),
                 "producer": metadata.get("producer"),
                 "title": metadata.get("title"),
+                "character_count": len(text),
+                **DocumentProcessor._xmp_fields(xmp),
             },
         }
 
+    @staticmethod
+    def _xmp_fields(xmp: str) -> Dict[str, Optional[str]]:
+        fields = {}
+        for name, pattern in XMP_PATTERNS.items():
+            match = pattern.search(xmp) if xmp else None
+            fields[name] = (match.group(1) or match.group(2) or None) if match else None
+        return fields
+
     @staticmethod
     def _process_docx(file_content: bytes) -> Dict[str, Any]:
         from io import BytesIO
+        from docx import Document
 
         doc = Document(BytesIO(file_content))
 
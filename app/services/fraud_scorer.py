@@ -1,6 +1,9 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from app.models.schemas import RiskLevel
-from app.core.config import settings
+from app.core.rules import RuleSet, rulebook
+
+SCORE_STAGES = ("contact", "ai", "document")
+RISK_LEVEL_ORDER = [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH]
 
 
 class FraudScoringService:
@@ -9,7 +12,10 @@ class FraudScoringService:
         contact_result: Optional[Dict[str, Any]] = None,
         ai_result: Optional[Dict[str, Any]] = None,
         document_result: Optional[Dict[str, Any]] = None,
+        rules: Optional[RuleSet] = None,
     ) -> Dict[str, Any]:
+        rules = rules or rulebook.current
+        weights = rules.weights
         contact_score = contact_result.get("risk_score", 0.0) if contact_result else 0.0
         ai_score = ai_result.get("overall_ai_probability", 0.0) if ai_result else 0.0
         document_score = (
@@ -17,12 +23,14 @@ class FraudScoringService:
         )
 
         overall_risk_score = (
-            contact_score * settings.CONTACT_WEIGHT
-            + ai_score * settings.AI_CONTENT_WEIGHT
-            + document_score * settings.DOCUMENT_WEIGHT
+            contact_score * weights["contact"]
+            + ai_score * weights["ai"]
+            + document_score * weights["document"]
         )
 
-        risk_level = FraudScoringService._determine_risk_level(overall_risk_score)
+        risk_level = FraudScoringService._determine_risk_level(
+            overall_risk_score, rules
+        )
 
         detected_issues = []
         if contact_result:
@@ -39,18 +47,18 @@ class FraudScoringService:
 
         if contact_result:
             contact_confidence = contact_result.get("confidence", 0.0)
-            weighted_confidence += contact_confidence * settings.CONTACT_WEIGHT
-            total_weight += settings.CONTACT_WEIGHT
+            weighted_confidence += contact_confidence * weights["contact"]
+            total_weight += weights["contact"]
 
         if ai_result:
             ai_confidence = ai_result.get("confidence", 0.0)
-            weighted_confidence += ai_confidence * settings.AI_CONTENT_WEIGHT
-            total_weight += settings.AI_CONTENT_WEIGHT
+            weighted_confidence += ai_confidence * weights["ai"]
+            total_weight += weights["ai"]
 
         if document_result:
             doc_confidence = document_result.get("confidence", 0.0)
-            weighted_confidence += doc_confidence * settings.DOCUMENT_WEIGHT
-            total_weight += settings.DOCUMENT_WEIGHT
+            weighted_confidence += doc_confidence * weights["document"]
+            total_weight += weights["document"]
 
         overall_confidence = (
             weighted_confidence / total_weight if total_weight > 0 else 0.0
@@ -73,13 +81,95 @@ class FraudScoringService:
             "contact_verification": contact_result,
             "ai_content_analysis": ai_result,
             "document_analysis": document_result,
+            "rule_version": rules.version,
+        }
+
+    @staticmethod
+    def default_weights() -> Dict[str, float]:
+        return dict(rulebook.current.weights)
+
+    @staticmethod
+    def score_batch(
+        scores: Dict[str, Sequence[float]],
+        confidences: Dict[str, Sequence[float]],
+        weights: Optional[Dict[str, float]] = None,
+        thresholds: Optional[Tuple[float, float]] = None,
+    ) -> Dict[str, Any]:
+        import numpy as np
+
+        weights = weights or FraudScoringService.default_weights()
+        medium, high = thresholds or rulebook.current.thresholds
+
+        overall = weighted_confidence = total_weight = None
+        for stage in SCORE_STAGES:
+            score = np.asarray(scores[stage], dtype=np.float64)
+            present = ~np.isnan(score)
+            confidence = np.nan_to_num(
+                np.asarray(confidences[stage], dtype=np.float64), nan=0.0
+            )
+            weight = weights[stage]
+
+            contribution = np.where(present, score, 0.0) * weight
+            stage_confidence = np.where(present, confidence * weight, 0.0)
+            stage_weight = np.where(present, weight, 0.0)
+            if overall is None:
+                overall = contribution
+                weighted_confidence = stage_confidence
+                total_weight = stage_weight
+            else:
+                overall = overall + contribution
+                weighted_confidence = weighted_confidence + stage_confidence
+                total_weight = total_weight + stage_weight
+
+        confidence = np.divide(
+            weighted_confidence,
+            total_weight,
+            out=np.zeros_like(weighted_confidence),
+            where=total_weight > 0,
+        )
+        risk_level = np.searchsorted(
+            np.array([medium, high]), overall, side="right"
+        ).astype(np.int8)
+
+        return {
+            "overall_risk_score": overall,
+            "confidence": confidence,
+            "risk_level": risk_level,
+        }
+
+    @staticmethod
+    def risk_level_shift(before: Sequence[int], after: Sequence[int]) -> Dict[str, Any]:
+        import numpy as np
+
+        before = np.asarray(before, dtype=np.int64)
+        after = np.asarray(after, dtype=np.int64)
+        known = before >= 0
+        levels = len(RISK_LEVEL_ORDER)
+        counts = np.bincount(
+            before[known] * levels + after[known], minlength=levels * levels
+        ).reshape(levels, levels)
+        names = [level.value for level in RISK_LEVEL_ORDER]
+
+        return {
+            "before": {name: int(counts[i].sum()) for i, name in enumerate(names)},
+            "after": {name: int(counts[:, i].sum()) for i, name in enumerate(names)},
+            "changed": int(counts.sum() - np.trace(counts)),
+            "transitions": {
+                f"{names[i]}->{names[j]}": int(counts[i, j])
+                for i in range(levels)
+                for j in range(levels)
+                if i != j and counts[i, j]
+            },
         }
 
     @staticmethod
-    def _determine_risk_level(score: float) -> RiskLevel:
-        if score >= settings.HIGH_RISK_THRESHOLD:
+    def _determine_risk_level(
+        score: float, rules: Optional[RuleSet] = None
+    ) -> RiskLevel:
+        medium, high = (rules or rulebook.current).thresholds
+        if score >= high:
             return RiskLevel.HIGH
-        elif score >= settings.MEDIUM_RISK_THRESHOLD:
+        elif score >= medium:
             return RiskLevel.MEDIUM
         else:
             return RiskLevel.LOW
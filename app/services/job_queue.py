@@ -0,0 +1,277 @@
+import asyncio
+import logging
+import math
+import sqlite3
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.core.job_store import JobStore
+from app.core.priority import Priority, current_priority
+from app.models.schemas import FraudDetectionResult, JobResponse, JobStatus
+from app.services.detection_pipeline import FraudDetectionPipeline
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CALLBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+class QueueFullError(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__(f"Job queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass
+class Job:
+    job_id: str
+    filename: str
+    file_content: Optional[bytes]
+    client_ip: Optional[str]
+    callback_url: Optional[str]
+    sequence: int
+    priority: Priority = field(default_factory=current_priority.get)
+    status: JobStatus = JobStatus.QUEUED
+    submitted_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    finished_monotonic: Optional[float] = None
+    result: Optional[FraudDetectionResult] = None
+    error: Optional[str] = None
+
+
+class JobQueue:
+    DEFAULT_RETRY_AFTER = 10
+    MAX_RETRY_AFTER = 300
+
+    SHUTDOWN_ERROR = "Worker shut down before the job finished"
+
+    def __init__(
+        self,
+        max_size: int,
+        workers: int,
+        result_ttl: int,
+        store: Optional[JobStore] = None,
+    ):
+        self.max_size = max_size
+        self.workers = workers
+        self.result_ttl = result_ttl
+        self.store = store
+        self._jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._completions: deque = deque(maxlen=50)
+        self._submitted = 0
+        self._started = 0
+        self.in_flight = 0
+
+    @staticmethod
+    def validate_callback_url(callback_url: Optional[str]) -> Optional[str]:
+        if not callback_url:
+            return None
+
+        parsed = urlparse(callback_url)
+        if parsed.scheme not in ["http", "https"] or (
+            parsed.hostname not in LOCAL_CALLBACK_HOSTS
+        ):
+            raise ValueError("Callback URL must be an http(s) URL on localhost")
+        return callback_url
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._queue is not None:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        for job in self._jobs.values():
+            if job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+                job.status = JobStatus.FAILED
+                job.error = self.SHUTDOWN_ERROR
+                job.file_content = None
+                job.completed_at = datetime.utcnow()
+                job.finished_monotonic = time.monotonic()
+                self._persist(job)
+        self._queue = None
+        self._loop = None
+
+    async def drain(self, timeout: float) -> bool:
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return True
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Job queue drain timed out with {self.depth} jobs queued")
+            return False
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def drain_rate(self) -> Optional[float]:
+        if len(self._completions) < 2:
+            return None
+
+        elapsed = self._completions[-1] - self._completions[0]
+        if elapsed <= 0:
+            return None
+        return (len(self._completions) - 1) / elapsed
+
+    def retry_after(self) -> int:
+        rate = self.drain_rate()
+        if not rate:
+            return self.DEFAULT_RETRY_AFTER
+
+        seconds = math.ceil((self.depth + 1) / rate)
+        return max(1, min(seconds, self.MAX_RETRY_AFTER))
+
+    async def submit(
+        self,
+        file_content: bytes,
+        filename: str,
+        client_ip: Optional[str] = None,
+        callback_url: Optional[str] = None,
+    ) -> Job:
+        await self.start()
+        self._prune()
+
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            filename=filename,
+            file_content=file_content,
+            client_ip=client_ip,
+            callback_url=callback_url,
+            sequence=self._submitted,
+        )
+
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(self.retry_after())
+
+        self._submitted += 1
+        self._jobs[job.job_id] = job
+        await self._persist_async(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._prune()
+        return self._jobs.get(job_id)
+
+    async def lookup(self, job_id: str) -> Optional[JobResponse]:
+        job = self.get(job_id)
+        if job is not None:
+            return self.to_response(job)
+        if self.store is None or not self.store.enabled:
+            return None
+        return await asyncio.to_thread(self.store.load, job_id)
+
+    def _persist(self, job: Job) -> None:
+        if self.store is None or not self.store.enabled:
+            return
+        try:
+            self.store.save(self.to_response(job), self.result_ttl)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save job {job.job_id} to the job store: {e}")
+
+    async def _persist_async(self, job: Job) -> None:
+        if self.store is not None and self.store.enabled:
+            await asyncio.to_thread(self._persist, job)
+
+    def to_response(self, job: Job) -> JobResponse:
+        queue_position = None
+        if job.status == JobStatus.QUEUED:
+            queue_position = max(job.sequence - self._started, 0)
+
+        return JobResponse(
+            job_id=job.job_id,
+            status=job.status,
+            filename=job.filename,
+            submitted_at=job.submitted_at,
+            started_at=job.started_at,
+            completed_at=job.completed_at,
+            queue_position=queue_position,
+            result=job.result,
+            error=job.error,
+        )
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.result_ttl
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_monotonic is not None and job.finished_monotonic < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        self._started += 1
+        self.in_flight += 1
+        current_priority.set(job.priority)
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        await self._persist_async(job)
+
+        try:
+            job.result = await FraudDetectionPipeline.run(
+                job.file_content, job.filename, job.client_ip
+            )
+            job.status = JobStatus.COMPLETED
+        except Exception as e:
+            job.error = f"Processing error: {str(e)}"
+            job.status = JobStatus.FAILED
+        finally:
+            self.in_flight -= 1
+            job.file_content = None
+            job.completed_at = datetime.utcnow()
+            job.finished_monotonic = time.monotonic()
+            self._completions.append(job.finished_monotonic)
+        await self._persist_async(job)
+
+        if job.callback_url:
+            await self._send_callback(job)
+
+    async def _send_callback(self, job: Job) -> None:
+        try:
+            await http_client.get().post(
+                job.callback_url,
+                content=self.to_response(job).model_dump_json(),
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
+        except Exception as e:
+            logger.warning(f"Job callback to {job.callback_url} failed: {e}")
+
+
+job_queue = JobQueue(
+    settings.JOB_QUEUE_SIZE,
+    settings.JOB_WORKERS,
+    settings.JOB_RESULT_TTL,
+    JobStore(settings.JOB_STORE_PATH),
+)
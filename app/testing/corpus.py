@@ -0,0 +1,429 @@
+import io
+import json
+import os
+import random
+import zipfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+FORMATS = ["pdf", "docx", "txt"]
+SIZES = {"short": 1, "standard": 2, "long": 10, "huge": 50}
+STRUCTURES = ["plain", "tables", "images"]
+METADATA_PROFILES = [
+    "consistent",
+    "same_minute",
+    "template_builder",
+    "malformed_date",
+    "missing",
+]
+SIGNALS = [
+    "disposable_email",
+    "test_phone",
+    "ai_phrases",
+    "em_dashes",
+    "pathological_phone_text",
+]
+
+LINES_PER_PAGE = 45
+
+FIRST_NAMES = ["Avery", "Jordan", "Priya", "Mateo", "Hana", "Kwame", "Lena", "Omar"]
+LAST_NAMES = ["Okafor", "Lindqvist", "Tanaka", "Alvarez", "Novak", "Reyes", "Chen"]
+COMPANIES = ["Northwind", "Globex", "Initech", "Umbrella Labs", "Hooli", "Vandelay"]
+ROLES = ["Software Engineer", "Data Analyst", "Product Manager", "SRE", "Designer"]
+SKILLS = ["Python", "Go", "SQL", "Kubernetes", "React", "Kafka", "Terraform", "Figma"]
+VERBS = ["Led", "Built", "Shipped", "Migrated", "Reduced", "Designed", "Automated"]
+OBJECTS = [
+    "the billing pipeline",
+    "an internal search service",
+    "onboarding flows",
+    "deployment tooling",
+    "the reporting warehouse",
+    "customer-facing APIs",
+]
+OUTCOMES = [
+    "cutting p99 latency by {n}%",
+    "saving {n} engineer-hours per month",
+    "growing weekly actives by {n}%",
+    "reducing incident volume by {n}%",
+]
+AI_PHRASES = [
+    "Results-driven professional with excellent communication skills.",
+    "Detail-oriented team player with strong problem-solving abilities.",
+    "As an AI language model, I have summarised my experience below.",
+]
+DISPOSABLE_DOMAINS = ["tempmail.com", "mailinator.com", "10minutemail.com"]
+REAL_DOMAINS = ["gmail.com", "outlook.com", "fastmail.com", "proton.me"]
+
+
+@dataclass
+class ResumeSpec:
+    id: str
+    format: str
+    size: str
+    structure: str
+    metadata: str
+    signals: List[str] = field(default_factory=list)
+    seed: int = 0
+
+    @property
+    def pages(self) -> int:
+        return SIZES[self.size]
+
+
+@dataclass
+class GeneratedResume:
+    spec: ResumeSpec
+    filename: str
+    content: bytes
+    labels: Dict[str, Any]
+
+
+def sample_spec(
+    rng: random.Random,
+    index: int,
+    formats: Sequence[str] = FORMATS,
+    sizes: Sequence[str] = tuple(SIZES),
+    structures: Sequence[str] = STRUCTURES,
+    fraud_rate: float = 0.3,
+) -> ResumeSpec:
+    document_format = rng.choice(list(formats))
+    signals = []
+    if rng.random() < fraud_rate:
+        signals = sorted(rng.sample(SIGNALS, rng.randint(1, 3)))
+    return ResumeSpec(
+        id=f"resume-{index:06d}",
+        format=document_format,
+        size=rng.choice(list(sizes)),
+        structure="plain" if document_format == "txt" else rng.choice(structures),
+        metadata="missing"
+        if document_format == "txt"
+        else rng.choice(METADATA_PROFILES),
+        signals=signals,
+        seed=rng.getrandbits(32),
+    )
+
+
+def _bullet(rng: random.Random, em_dashes: bool) -> str:
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 60))
+    separator = "—" if em_dashes else ", "
+    return f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)}{separator}{outcome}."
+
+
+def _pathological_phone_lines(rng: random.Random) -> List[str]:
+    return [
+        "Reference numbers: "
+        + " ".join(
+            "".join(rng.choice("0123456789 -().") for _ in range(rng.randint(18, 40)))
+            for _ in range(6)
+        ),
+        "Ticket IDs: " + "-".join(str(rng.randint(0, 9)) for _ in range(120)),
+        "(" * 40 + "1" * 19 + ")" * 40,
+    ]
+
+
+def compose_text(spec: ResumeSpec, rng: random.Random) -> Dict[str, Any]:
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(" ", ".")
+    if "disposable_email" in spec.signals:
+        email = f"{handle}@{rng.choice(DISPOSABLE_DOMAINS)}"
+    else:
+        email = f"{handle}@{rng.choice(REAL_DOMAINS)}"
+    if "test_phone" in spec.signals:
+        phone = f"(555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+    else:
+        phone = f"+1 (415) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+
+    em_dashes = "em_dashes" in spec.signals
+    summary = (
+        " ".join(rng.sample(AI_PHRASES, 2))
+        if "ai_phrases" in spec.signals
+        else f"{rng.choice(ROLES)} focused on {rng.choice(SKILLS)} and "
+        f"{rng.choice(SKILLS)} at {rng.choice(COMPANIES)} scale."
+    )
+
+    lines = [name, f"Email: {email}", f"Phone: {phone}", "", "SUMMARY", summary, ""]
+    if "pathological_phone_text" in spec.signals:
+        lines += _pathological_phone_lines(rng) + [""]
+
+    target_lines = spec.pages * LINES_PER_PAGE
+    year = 2024
+    while len(lines) < target_lines:
+        role = f"{rng.choice(ROLES)} — {rng.choice(COMPANIES)} ({year - 2}–{year})"
+        lines += ["EXPERIENCE", role]
+        lines += [_bullet(rng, em_dashes) for _ in range(rng.randint(3, 6))]
+        lines += [f"Skills: {', '.join(rng.sample(SKILLS, 4))}", ""]
+        year -= 2
+
+    return {"name": name, "email": email, "phone": phone, "lines": lines[:target_lines]}
+
+
+def build_metadata(spec: ResumeSpec, rng: random.Random, name: str) -> Dict[str, Any]:
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(
+        days=rng.randint(0, 300), seconds=rng.randint(0, 86400)
+    )
+    metadata = {
+        "author": name,
+        "title": f"{name} - {rng.choice(ROLES)}",
+        "creator": "Microsoft Word",
+        "created": created,
+        "modified": created + timedelta(days=rng.randint(1, 60)),
+        "malformed_date": False,
+    }
+    if spec.metadata == "same_minute":
+        metadata["modified"] = created + timedelta(seconds=rng.randint(1, 50))
+    elif spec.metadata == "template_builder":
+        metadata.update(
+            creator="Online Resume Template Generator", title="Resume", author=""
+        )
+    elif spec.metadata == "malformed_date":
+        metadata["malformed_date"] = True
+    elif spec.metadata == "missing":
+        metadata.update(author="", title="", creator="")
+    return metadata
+
+
+def _noise_png(rng: random.Random, width: int = 160, height: int = 120) -> bytes:
+    import fitz
+
+    pixmap = fitz.Pixmap(
+        fitz.csRGB, width, height, rng.randbytes(width * height * 3), False
+    )
+    return pixmap.tobytes("png")
+
+
+def _table_rows(rng: random.Random, count: int) -> List[List[str]]:
+    return [
+        [
+            str(2024 - row),
+            rng.choice(COMPANIES),
+            rng.choice(ROLES),
+            rng.choice(SKILLS),
+            f"{rng.randint(1, 99)}%",
+        ]
+        for row in range(count)
+    ]
+
+
+def _pdf_date(value: datetime) -> str:
+    return value.strftime("D:%Y%m%d%H%M%S+00'00'")
+
+
+def render_pdf(spec: ResumeSpec, rng: random.Random, text: Dict[str, Any]) -> bytes:
+    import fitz
+
+    metadata = build_metadata(spec, rng, text["name"])
+    doc = fitz.open()
+    lines = text["lines"]
+    image = _noise_png(rng) if spec.structure == "images" else None
+
+    for start in range(0, len(lines), LINES_PER_PAGE):
+        page = doc.new_page()
+        body = lines[start : start + LINES_PER_PAGE]
+        if spec.structure == "tables":
+            body = body[: LINES_PER_PAGE // 2]
+        page.insert_text((48, 48), "\n".join(body), fontsize=8)
+
+        if spec.structure == "tables":
+            y = 48 + len(body) * 10
+            for row in _table_rows(rng, 20):
+                for column, cell in enumerate(row):
+                    rect = fitz.Rect(48 + column * 100, y, 148 + column * 100, y + 14)
+                    page.draw_rect(rect, width=0.5)
+                    page.insert_text((rect.x0 + 3, rect.y1 - 4), cell, fontsize=7)
+                y += 14
+        elif image is not None:
+            page.insert_image(fitz.Rect(300, 500, 560, 660), stream=image)
+            page.insert_image(fitz.Rect(48, 660, 300, 800), stream=_noise_png(rng))
+
+    created = _pdf_date(metadata["created"])
+    doc.set_metadata(
+        {
+            "author": metadata["author"],
+            "title": metadata["title"],
+            "creator": metadata["creator"],
+            "producer": metadata["creator"],
+            "creationDate": "D:2024-13-45T99"
+            if metadata["malformed_date"]
+            else created,
+            "modDate": _pdf_date(metadata["modified"]),
+        }
+    )
+    data = doc.tobytes(garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+    return data
+
+
+def render_docx(spec: ResumeSpec, rng: random.Random, text: Dict[str, Any]) -> bytes:
+    import docx
+    from docx.shared import Inches
+
+    metadata = build_metadata(spec, rng, text["name"])
+    document = docx.Document()
+    lines = text["lines"]
+
+    for index, line in enumerate(lines):
+        document.add_paragraph(line)
+        if index and index % LINES_PER_PAGE == 0:
+            if spec.structure == "tables":
+                rows = _table_rows(rng, 40)
+                table = document.add_table(rows=0, cols=len(rows[0]))
+                for row in rows:
+                    for cell, value in zip(table.add_row().cells, row):
+                        cell.text = value
+            elif spec.structure == "images":
+                document.add_picture(io.BytesIO(_noise_png(rng)), width=Inches(3))
+
+    properties = document.core_properties
+    properties.author = metadata["author"]
+    properties.title = metadata["title"]
+    properties.created = metadata["created"]
+    properties.modified = metadata["modified"]
+    if metadata["malformed_date"]:
+        properties._element.get_or_add_created().text = "2024-13-45T99:00:00Z"
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return _fixed_zip_timestamps(buffer.getvalue())
+
+
+def _fixed_zip_timestamps(data: bytes) -> bytes:
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(
+        output, "w", zipfile.ZIP_DEFLATED
+    ) as target:
+        for info in source.infolist():
+            fixed = zipfile.ZipInfo(info.filename, date_time=(2024, 1, 1, 0, 0, 0))
+            fixed.compress_type = zipfile.ZIP_DEFLATED
+            target.writestr(fixed, source.read(info.filename))
+    return output.getvalue()
+
+
+def render_txt(spec: ResumeSpec, rng: random.Random, text: Dict[str, Any]) -> bytes:
+    return "\n".join(text["lines"]).encode()
+
+
+RENDERERS = {"pdf": render_pdf, "docx": render_docx, "txt": render_txt}
+
+
+def ground_truth(spec: ResumeSpec, text: Dict[str, Any]) -> Dict[str, Any]:
+    document_flags = []
+    if spec.format != "txt":
+        document_flags = {
+            "consistent": [],
+            "same_minute": ["timestamps_within_minute"],
+            "template_builder": [
+                "suspicious_creator",
+                "missing_author",
+                "generic_title",
+            ],
+            "malformed_date": ["malformed_date"],
+            "missing": ["missing_author"],
+        }[spec.metadata]
+        if spec.format == "docx" and spec.metadata == "template_builder":
+            document_flags = ["missing_author", "generic_title"]
+
+    return {
+        "fraudulent": bool(spec.signals)
+        or spec.metadata in ("same_minute", "template_builder"),
+        "signals": list(spec.signals),
+        "document_flags": document_flags,
+        "email": text["email"],
+        "phone": text["phone"],
+        "disposable_email": "disposable_email" in spec.signals,
+        "test_phone": "test_phone" in spec.signals,
+        "ai_phrases": "ai_phrases" in spec.signals,
+        "pages": spec.pages,
+        "lines": len(text["lines"]),
+    }
+
+
+def generate_resume(spec: ResumeSpec) -> GeneratedResume:
+    rng = random.Random(spec.seed)
+    text = compose_text(spec, rng)
+    content = RENDERERS[spec.format](spec, rng, text)
+    return GeneratedResume(
+        spec=spec,
+        filename=f"{spec.id}.{spec.format}",
+        content=content,
+        labels=ground_truth(spec, text),
+    )
+
+
+def generate_corpus(
+    count: int,
+    seed: int = 0,
+    formats: Sequence[str] = FORMATS,
+    sizes: Sequence[str] = tuple(SIZES),
+    structures: Sequence[str] = STRUCTURES,
+    fraud_rate: float = 0.3,
+) -> Iterator[GeneratedResume]:
+    rng = random.Random(seed)
+    for index in range(count):
+        yield generate_resume(
+            sample_spec(rng, index, formats, sizes, structures, fraud_rate)
+        )
+
+
+def write_corpus(
+    directory: str,
+    resumes: Iterator[GeneratedResume],
+    manifest_name: str = "manifest.jsonl",
+) -> Dict[str, Any]:
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, manifest_name)
+    written = 0
+    total_bytes = 0
+
+    with open(manifest_path, "w") as manifest:
+        for resume in resumes:
+            with open(os.path.join(directory, resume.filename), "wb") as f:
+                f.write(resume.content)
+            spec = asdict(resume.spec)
+            manifest.write(
+                json.dumps(
+                    {
+                        "id": resume.spec.id,
+                        "path": resume.filename,
+                        "bytes": len(resume.content),
+                        "spec": spec,
+                        "labels": resume.labels,
+                    }
+                )
+                + "\n"
+            )
+            written += 1
+            total_bytes += len(resume.content)
+
+    return {"manifest": manifest_path, "documents": written, "bytes": total_bytes}
+
+
+def load_labels(manifest_path: str) -> Dict[str, Dict[str, Any]]:
+    labels = {}
+    with open(manifest_path) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                labels[str(entry["id"])] = entry.get("labels", {})
+    return labels
+
+
+def scaling_series(
+    document_format: str,
+    sizes: Optional[Sequence[str]] = None,
+    structure: str = "plain",
+    seed: int = 0,
+) -> List[GeneratedResume]:
+    return [
+        generate_resume(
+            ResumeSpec(
+                id=f"{document_format}-{size}-{structure}",
+                format=document_format,
+                size=size,
+                structure=structure,
+                metadata="consistent",
+                seed=seed,
+            )
+        )
+        for size in (sizes or list(SIZES))
+    ]
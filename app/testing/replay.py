@@ -0,0 +1,344 @@
+import asyncio
+import glob
+import json
+import os
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from app.core.capture import file_path, upstream_key
+
+
+API_KEY_SETTINGS = [
+    "ABSTRACT_EMAIL_API_KEY",
+    "ABSTRACT_PHONE_API_KEY",
+    "ABSTRACT_IP_API_KEY",
+    "WINSTON_AI_API_KEY",
+]
+
+
+@dataclass
+class ReplayResult:
+    id: str
+    method: str
+    path: str
+    recorded_status: Optional[int]
+    status: Optional[int]
+    recorded_ms: Optional[float]
+    duration_ms: float
+    error: Optional[str] = None
+
+
+def log_paths(directory: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(directory, "capture-*.jsonl*")))
+
+
+def load_capture(directory: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    requests, upstream = [], []
+    for path in log_paths(directory):
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("type") == "request":
+                    requests.append(entry)
+                elif entry.get("type") == "upstream":
+                    upstream.append(entry)
+
+    requests.sort(key=lambda entry: entry["ts"])
+    upstream.sort(key=lambda entry: entry["ts"])
+    return requests, upstream
+
+
+class ReplayTransport:
+    def __init__(self, upstream: List[Dict[str, Any]], latency_scale: float = 1.0):
+        self.responses: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for entry in upstream:
+            self.responses[entry["key"]].append(entry)
+        self.latency_scale = latency_scale
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_directory(
+        cls, directory: str, latency_scale: float = 1.0
+    ) -> "ReplayTransport":
+        return cls(load_capture(directory)[1], latency_scale)
+
+    async def handle_async_request(self, request):
+        import httpx
+
+        if request.method == "HEAD":
+            return httpx.Response(200)
+
+        body = await request.aread()
+        queue = self.responses.get(upstream_key(request.method, request.url, body))
+        if not queue:
+            self.misses += 1
+            return httpx.Response(502, json={"error": "No captured upstream response"})
+
+        self.hits += 1
+        entry = queue.popleft() if len(queue) > 1 else queue[0]
+        if self.latency_scale > 0:
+            await asyncio.sleep(entry["elapsed_ms"] / 1000 * self.latency_scale)
+
+        headers = (
+            {"content-type": entry["content_type"]} if entry["content_type"] else {}
+        )
+        return httpx.Response(
+            entry["status"], headers=headers, content=entry["body"].encode("utf-8")
+        )
+
+    async def aclose(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def skip_reason(entry: Dict[str, Any], directory: str) -> Optional[str]:
+    if entry.get("truncated"):
+        return "truncated"
+    if entry.get("parse_error"):
+        return "unparsed"
+    if entry["method"] == "GET" and entry["path"].startswith("/api/v1/jobs/"):
+        return "job_poll"
+    for part in entry.get("parts", []):
+        if not os.path.exists(file_path(directory, part["sha256"])):
+            return "missing_file"
+    if entry.get("body_sha256") and not os.path.exists(
+        file_path(directory, entry["body_sha256"])
+    ):
+        return "missing_file"
+    return None
+
+
+def read_file(directory: str, content_hash: str) -> bytes:
+    with open(file_path(directory, content_hash), "rb") as f:
+        return f.read()
+
+
+def build_request(
+    entry: Dict[str, Any], directory: str, api_key: Optional[str] = None
+) -> Dict[str, Any]:
+    headers = dict(entry.get("headers", {}))
+    if entry.get("client") and "x-forwarded-for" not in headers:
+        headers["x-forwarded-for"] = entry["client"]
+    if entry.get("api_key") and api_key:
+        headers["x-api-key"] = api_key
+
+    url = entry["path"] + (f"?{entry['query']}" if entry.get("query") else "")
+    request: Dict[str, Any] = {"method": entry["method"], "url": url}
+
+    if "parts" in entry:
+        request["files"] = [
+            (
+                part["field"],
+                (
+                    part["filename"],
+                    read_file(directory, part["sha256"]),
+                    part["content_type"] or "application/octet-stream",
+                ),
+            )
+            for part in entry["parts"]
+        ]
+        request["data"] = entry.get("fields", {})
+    elif entry.get("body_sha256"):
+        request["content"] = read_file(directory, entry["body_sha256"])
+        headers["content-type"] = entry["content_type"]
+
+    request["headers"] = headers
+    return request
+
+
+class Replayer:
+    def __init__(
+        self,
+        client,
+        directory: str,
+        requests: List[Dict[str, Any]],
+        speed: float = 1.0,
+        concurrency: int = 16,
+        api_key: Optional[str] = None,
+    ):
+        self.client = client
+        self.directory = directory
+        self.requests = requests
+        self.speed = speed
+        self.concurrency = concurrency
+        self.api_key = api_key
+        self.results: List[ReplayResult] = []
+        self.skipped: Dict[str, int] = defaultdict(int)
+
+    async def _send(self, entry: Dict[str, Any]) -> None:
+        reason = skip_reason(entry, self.directory)
+        if reason:
+            self.skipped[reason] += 1
+            return
+
+        request = await asyncio.to_thread(
+            build_request, entry, self.directory, self.api_key
+        )
+        status, error = None, None
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(timeout=120.0, **request)
+            status = response.status_code
+        except Exception as e:
+            error = type(e).__name__
+        self.results.append(
+            ReplayResult(
+                id=entry["id"],
+                method=entry["method"],
+                path=entry["path"],
+                recorded_status=entry.get("status"),
+                status=status,
+                recorded_ms=entry.get("duration_ms"),
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+                error=error,
+            )
+        )
+
+    async def run_timed(self) -> None:
+        first_ts = self.requests[0]["ts"]
+        start = time.perf_counter()
+        tasks = []
+        for entry in self.requests:
+            delay = (entry["ts"] - first_ts) / self.speed - (
+                time.perf_counter() - start
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self._send(entry)))
+        await asyncio.gather(*tasks)
+
+    async def run_unpaced(self) -> None:
+        pending = iter(self.requests)
+
+        async def worker():
+            for entry in pending:
+                await self._send(entry)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    async def run(self) -> float:
+        start = time.perf_counter()
+        if self.requests:
+            if self.speed > 0:
+                await self.run_timed()
+            else:
+                await self.run_unpaced()
+        return time.perf_counter() - start
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(int(q * len(sorted_values)), len(sorted_values) - 1)
+    return round(sorted_values[index], 3)
+
+
+def latency_summary(values: List[float]) -> Dict[str, Optional[float]]:
+    ordered = sorted(values)
+    return {
+        "p50_ms": percentile(ordered, 0.50),
+        "p90_ms": percentile(ordered, 0.90),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": round(ordered[-1], 3) if ordered else None,
+    }
+
+
+def build_report(
+    replayer: Replayer, wall_time: float, upstream: Optional[Dict[str, int]]
+) -> Dict[str, Any]:
+    results = replayer.results
+    by_endpoint: Dict[str, List[ReplayResult]] = defaultdict(list)
+    for result in results:
+        by_endpoint[f"{result.method} {result.path}"].append(result)
+
+    def compare(items: List[ReplayResult]) -> Dict[str, Any]:
+        return {
+            "count": len(items),
+            "recorded": latency_summary(
+                [item.recorded_ms for item in items if item.recorded_ms is not None]
+            ),
+            "replayed": latency_summary([item.duration_ms for item in items]),
+        }
+
+    mismatches = [
+        result for result in results if result.status != result.recorded_status
+    ]
+    return {
+        "requests": len(results),
+        "skipped": dict(replayer.skipped),
+        "speed": replayer.speed,
+        "wall_time_s": round(wall_time, 3),
+        "errors": sum(1 for result in results if result.error),
+        "status_mismatches": len(mismatches),
+        "mismatch_examples": [asdict(result) for result in mismatches[:10]],
+        "latency": compare(results),
+        "endpoints": {
+            endpoint: compare(items) for endpoint, items in sorted(by_endpoint.items())
+        },
+        "upstream": upstream,
+    }
+
+
+async def replay(
+    directory: str,
+    target: Optional[str] = None,
+    speed: float = 1.0,
+    concurrency: int = 16,
+    api_key: Optional[str] = None,
+    latency_scale: float = 1.0,
+    rate_limits: bool = True,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    import httpx
+
+    requests, upstream = await asyncio.to_thread(load_capture, directory)
+    if limit:
+        requests = requests[:limit]
+
+    if target:
+        async with httpx.AsyncClient(base_url=target) as client:
+            replayer = Replayer(
+                client, directory, requests, speed, concurrency, api_key
+            )
+            wall_time = await replayer.run()
+        return build_report(replayer, wall_time, None)
+
+    from app.core.capture import traffic_capture
+    from app.core.config import settings
+    from app.core.http_client import http_client
+    from app.core.rate_limiter import limiter
+    from app.main import app
+
+    transport = ReplayTransport(upstream, latency_scale)
+    http_client.transport = transport
+    traffic_capture.enabled = False
+    limiter.enabled = rate_limits
+    for name in API_KEY_SETTINGS:
+        if not getattr(settings, name):
+            setattr(settings, name, "replay")
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://replay"
+        ) as client:
+            replayer = Replayer(
+                client, directory, requests, speed, concurrency, api_key
+            )
+            wall_time = await replayer.run()
+    return build_report(replayer, wall_time, transport.stats())
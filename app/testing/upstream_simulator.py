@@ -0,0 +1,293 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+DISPOSABLE_DOMAINS = {"tempmail.com", "mailinator.com", "10minutemail.com"}
+VPN_PREFIXES = ("10.", "172.16.", "192.168.", "100.64.")
+DEFAULT_P99_RATIO = 4.0
+
+ERROR_BODIES = {
+    401: {"error": {"message": "Invalid API key provided.", "code": "unauthorized"}},
+    402: {"error": {"message": "Quota reached.", "code": "quota_reached"}},
+    429: {"error": {"message": "Too many requests.", "code": "too_many_requests"}},
+}
+
+
+@dataclass
+class LatencyModel:
+    median_ms: float = 100.0
+    p99_ms: float = 400.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.p99_ms <= self.median_ms or self.median_ms <= 0:
+            return max(self.median_ms, 0.0)
+        sigma = math.log(self.p99_ms / self.median_ms) / 2.326
+        return rng.lognormvariate(math.log(self.median_ms), sigma)
+
+
+@dataclass
+class ServiceProfile:
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rates: Dict[int, float] = field(default_factory=dict)
+    quota: Optional[int] = None
+    hang_rate: float = 0.0
+    hang_ms: float = 30000.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ServiceProfile":
+        median_ms = float(data.get("median_ms", 100.0))
+        return cls(
+            latency=LatencyModel(
+                median_ms=median_ms,
+                p99_ms=float(data.get("p99_ms", median_ms * DEFAULT_P99_RATIO)),
+            ),
+            error_rates={
+                int(status): float(rate)
+                for status, rate in data.get("errors", {}).items()
+            },
+            quota=data.get("quota"),
+            hang_rate=float(data.get("hang_rate", 0.0)),
+            hang_ms=float(data.get("hang_ms", 30000.0)),
+        )
+
+
+DEFAULT_PROFILES = {
+    "email": {"median_ms": 150, "p99_ms": 800},
+    "phone": {"median_ms": 120, "p99_ms": 600},
+    "ip": {"median_ms": 80, "p99_ms": 400},
+    "winston": {"median_ms": 900, "p99_ms": 3000},
+}
+
+
+@dataclass
+class SimulatorConfig:
+    services: Dict[str, ServiceProfile] = field(
+        default_factory=lambda: {
+            name: ServiceProfile.from_dict(profile)
+            for name, profile in DEFAULT_PROFILES.items()
+        }
+    )
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SimulatorConfig":
+        services = dict(DEFAULT_PROFILES)
+        for name, profile in data.get("services", {}).items():
+            defaults = dict(services.get(name, {}))
+            if "median_ms" in profile and "p99_ms" not in profile:
+                defaults.pop("p99_ms", None)
+            services[name] = {**defaults, **profile}
+        return cls(
+            services={
+                name: ServiceProfile.from_dict(profile)
+                for name, profile in services.items()
+            },
+            seed=data.get("seed"),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "SimulatorConfig":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def _digest(value: str) -> int:
+    return int(hashlib.md5(value.encode()).hexdigest()[:8], 16)
+
+
+def email_payload(email: str) -> Dict[str, Any]:
+    local, _, domain = email.partition("@")
+    valid_format = bool(local) and "." in domain
+    disposable = domain.lower() in DISPOSABLE_DOMAINS
+    score = (_digest(email) % 100) / 100
+    deliverable = valid_format and not disposable and score > 0.1
+
+    def flag(value: bool) -> Dict[str, Any]:
+        return {"value": value, "text": str(value).upper()}
+
+    return {
+        "email": email,
+        "autocorrect": "",
+        "deliverability": "DELIVERABLE" if deliverable else "UNDELIVERABLE",
+        "quality_score": f"{0.5 + score / 2:.2f}" if deliverable else "0.10",
+        "is_valid_format": flag(valid_format),
+        "is_free_email": flag(domain.lower() in {"gmail.com", "yahoo.com"}),
+        "is_disposable_email": flag(disposable),
+        "is_role_email": flag(local.lower() in {"info", "admin", "hr"}),
+        "is_catchall_email": flag(False),
+        "is_mx_found": flag(valid_format),
+        "is_smtp_valid": flag(deliverable),
+    }
+
+
+def phone_payload(phone: str) -> Dict[str, Any]:
+    digits = "".join(ch for ch in phone if ch.isdigit())
+    national = digits[-10:]
+    valid = len(digits) >= 10 and not national.startswith("555")
+    return {
+        "phone": digits,
+        "valid": valid,
+        "format": {"international": f"+{digits}", "local": national},
+        "country": {"code": "US", "name": "United States", "prefix": "+1"}
+        if valid
+        else {},
+        "location": "California" if valid else "",
+        "type": "mobile" if _digest(digits) % 2 else "landline",
+        "carrier": "Simulated Wireless" if valid else "",
+    }
+
+
+def ip_payload(ip_address: str) -> Dict[str, Any]:
+    suspicious = ip_address.startswith(VPN_PREFIXES)
+    return {
+        "ip_address": ip_address,
+        "country_code": "US",
+        "connection": {
+            "is_vpn": suspicious,
+            "is_proxy": False,
+            "autonomous_system_organization": "Simulated Networks",
+        },
+        "threat": {
+            "is_tor": False,
+            "threat_level": "medium" if suspicious else "low",
+            "abuse_confidence": 40 if suspicious else 0,
+        },
+    }
+
+
+def winston_payload(text: str) -> Dict[str, Any]:
+    lowered = text.lower()
+    markers = sum(
+        lowered.count(phrase)
+        for phrase in ("team player", "results-driven", "detail-oriented", "—")
+    )
+    score = min(100.0, 10.0 + markers * 15.0 + _digest(text[:200]) % 10)
+    return {
+        "status": 200,
+        "score": score,
+        "version": "simulated",
+        "credits_used": max(1, len(text.split())),
+        "credits_remaining": 100000,
+    }
+
+
+class UpstreamSimulator:
+    def __init__(self, config: Optional[SimulatorConfig] = None):
+        self.config = config or SimulatorConfig()
+        self.rng = random.Random(self.config.seed)
+        self.usage: Counter = Counter()
+        self.responses: Counter = Counter()
+
+    def reset(self) -> None:
+        self.rng = random.Random(self.config.seed)
+        self.usage.clear()
+        self.responses.clear()
+
+    def _pick_error(self, profile: ServiceProfile) -> Optional[int]:
+        roll = self.rng.random()
+        cumulative = 0.0
+        for status, rate in profile.error_rates.items():
+            cumulative += rate
+            if roll < cumulative:
+                return status
+        return None
+
+    async def respond(self, service: str, api_key: Optional[str], build_payload):
+        profile = self.config.services[service]
+        latency_ms = profile.latency.sample(self.rng)
+        if profile.hang_rate and self.rng.random() < profile.hang_rate:
+            latency_ms = profile.hang_ms
+        await asyncio.sleep(latency_ms / 1000)
+
+        status = 200
+        if not api_key:
+            status = 401
+        elif (
+            profile.quota is not None
+            and self.usage[(service, api_key)] >= profile.quota
+        ):
+            status = 402
+        else:
+            status = self._pick_error(profile) or 200
+
+        self.responses[(service, status)] += 1
+        if status != 200:
+            body = ERROR_BODIES.get(
+                status,
+                {"error": {"message": "Upstream failure.", "code": "server_error"}},
+            )
+            return JSONResponse(body, status_code=status)
+
+        self.usage[(service, api_key)] += 1
+        return JSONResponse(build_payload())
+
+    def stats(self) -> Dict[str, Any]:
+        responses: Dict[str, Dict[str, int]] = {}
+        for (service, status), count in sorted(self.responses.items()):
+            responses.setdefault(service, {})[str(status)] = count
+        return {"responses": responses}
+
+
+def create_app(config: Optional[SimulatorConfig] = None) -> FastAPI:
+    simulator = UpstreamSimulator(config)
+    app = FastAPI(title="Upstream API Simulator", docs_url=None, redoc_url=None)
+    app.state.simulator = simulator
+
+    @app.get("/email/v1/")
+    async def email(api_key: Optional[str] = None, email: str = ""):
+        return await simulator.respond("email", api_key, lambda: email_payload(email))
+
+    @app.get("/phone/v1/")
+    async def phone(api_key: Optional[str] = None, phone: str = ""):
+        return await simulator.respond("phone", api_key, lambda: phone_payload(phone))
+
+    @app.get("/ip/v1/")
+    async def ip(api_key: Optional[str] = None, ip_address: str = ""):
+        return await simulator.respond("ip", api_key, lambda: ip_payload(ip_address))
+
+    @app.post("/winston/v2/ai-content-detection")
+    async def winston(request: Request):
+        authorization = request.headers.get("authorization", "")
+        api_key = authorization.removeprefix("Bearer ").strip() or None
+        payload = await request.json()
+        return await simulator.respond(
+            "winston", api_key, lambda: winston_payload(payload.get("text", ""))
+        )
+
+    @app.get("/_stats")
+    async def stats():
+        return simulator.stats()
+
+    @app.post("/_reset")
+    async def reset():
+        simulator.reset()
+        return simulator.stats()
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(
+        description="Serve stand-ins for the Abstract and Winston AI APIs"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--config", help="JSON file with per-service profiles")
+    args = parser.parse_args()
+
+    config = SimulatorConfig.load(args.config) if args.config else SimulatorConfig()
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLES_DIR = os.path.join(ROOT, "static", "samples")
+sys.path.insert(0, ROOT)
+
+from app.core.cache import SimpleCache
+from app.core.document_context import DocumentContext
+from app.core.document_rules import compile_document_rules
+from app.core.sanitizer import InputSanitizer
+from app.services.ai_detection import AIContentDetectionService
+from app.services.contact_verification import ContactVerificationService
+from app.services.document_analysis import DocumentAnalysisService
+from app.services.document_processor import DocumentProcessor
+from app.services.fraud_scorer import FraudScoringService
+from app.testing.corpus import ResumeSpec, compose_text, scaling_series
+
+SEED = 2025
+CORPUS_SIZES = ["short", "standard", "long", "huge"]
+
+Case = Tuple[str, Callable[[], Any]]
+
+
+def corpus_text(size: str, signals: List[str] = ()) -> str:
+    spec = ResumeSpec(
+        id=f"text-{size}",
+        format="txt",
+        size=size,
+        structure="plain",
+        metadata="missing",
+        signals=list(signals),
+        seed=SEED,
+    )
+    return "\n".join(compose_text(spec, random.Random(SEED))["lines"])
+
+
+def document_cases() -> List[Case]:
+    cases = []
+    for name in sorted(os.listdir(SAMPLES_DIR)):
+        with open(os.path.join(SAMPLES_DIR, name), "rb") as f:
+            content = f.read()
+        extension = name.rsplit(".", 1)[-1]
+        cases.append(
+            (
+                f"document.{extension}[{name}]",
+                lambda content=content, name=name: DocumentProcessor.extract_sync(
+                    content, name
+                ),
+            )
+        )
+
+    resumes = [
+        resume
+        for document_format in ["pdf", "docx", "txt"]
+        for resume in scaling_series(document_format, CORPUS_SIZES, seed=SEED)
+    ]
+    resumes += [
+        resume
+        for document_format in ["pdf", "docx"]
+        for structure in ["tables", "images"]
+        for resume in scaling_series(document_format, ["long"], structure, SEED)
+    ]
+    for resume in resumes:
+        cases.append(
+            (
+                f"document.{resume.spec.format}[{resume.spec.size}-{resume.spec.structure}]",
+                lambda resume=resume: DocumentProcessor.extract_sync(
+                    resume.content, resume.filename
+                ),
+            )
+        )
+    return cases
+
+
+def text_cases() -> List[Case]:
+    contact_service = ContactVerificationService()
+    ai_service = AIContentDetectionService()
+    cases = []
+    variants = [(size, corpus_text(size)) for size in CORPUS_SIZES]
+    variants.append(
+        ("standard-pathological", corpus_text("standard", ["pathological_phone_text"]))
+    )
+    for size, text in variants:
+        cases += [
+            (
+                f"contact.extract[{size}]",
+                lambda text=text: contact_service._extract_contact_info(
+                    DocumentContext(text)
+                ),
+            ),
+            (
+                f"ai.basic_detection[{size}]",
+                lambda text=text: ai_service._basic_ai_detection(DocumentContext(text)),
+            ),
+            (
+                f"sanitizer.text[{size}]",
+                lambda text=text: InputSanitizer.sanitize_text(
+                    text, max_length=len(text)
+                ),
+            ),
+        ]
+    return cases
+
+
+def score_arrays(count: int):
+    import numpy as np
+
+    rng = np.random.default_rng(SEED)
+    scores = {stage: rng.random(count) for stage in ["contact", "ai", "document"]}
+    confidences = {stage: rng.random(count) for stage in scores}
+    return scores, confidences
+
+
+def document_rule_plan(count: int):
+    kinds = [
+        lambda i: {
+            "check": "contains_any",
+            "field": "producer",
+            "values": [f"builder-{i}", f"export-{i}/"],
+        },
+        lambda i: {"check": "matches", "field": "creator", "pattern": rf"\bv{i}\.\d"},
+        lambda i: {
+            "check": "timestamp_gap",
+            "from": "creation_date",
+            "to": "modification_date",
+            "above": 3600 + i,
+        },
+        lambda i: {
+            "check": "ratio",
+            "numerator": "character_count",
+            "denominator": "page_count",
+            "below": i,
+        },
+    ]
+    return compile_document_rules(
+        {
+            "rules": [
+                {"id": f"rule.{i}", "score": 0.001, **kinds[i % len(kinds)](i)}
+                for i in range(count)
+            ]
+        }
+    )
+
+
+def analysis_cases() -> List[Case]:
+    metadata = {
+        "format": "pdf",
+        "page_count": 2,
+        "creation_date": "D:20240101120000",
+        "modification_date": "D:20240101120030",
+        "creator": "ResumeGenius Builder",
+        "producer": "Skia/PDF",
+        "author": None,
+        "character_count": 2400,
+    }
+    rule_plan = document_rule_plan(300)
+    contact_result = {
+        "email_verification": {"valid": True, "disposable": True, "deliverable": False},
+        "phone_verification": {"valid": False, "country": None, "carrier": None},
+        "ip_verification": {"is_vpn": True, "is_proxy": False, "is_tor": False},
+        "risk_score": 0.7,
+        "confidence": 0.8,
+    }
+    ai_result = {
+        "overall_ai_probability": 0.65,
+        "confidence": 0.3,
+        "detection_method": "pattern_fallback",
+    }
+    document_result = DocumentAnalysisService.analyze_document_authenticity(metadata)
+    batch_scores, batch_confidences = score_arrays(100000)
+
+    return [
+        (
+            "document_analysis.authenticity",
+            lambda: DocumentAnalysisService.analyze_document_authenticity(metadata),
+        ),
+        ("document_analysis.rules_300", lambda: rule_plan.evaluate(metadata)),
+        (
+            "scoring.overall_risk",
+            lambda: FraudScoringService.calculate_overall_risk(
+                contact_result, ai_result, document_result
+            ),
+        ),
+        (
+            "scoring.batch_100k",
+            lambda: FraudScoringService.score_batch(batch_scores, batch_confidences),
+        ),
+    ]
+
+
+def sanitizer_cases() -> List[Case]:
+    return [
+        (
+            "sanitizer.email",
+            lambda: InputSanitizer.sanitize_email(" Jordan.Example@Example.com "),
+        ),
+        ("sanitizer.phone", lambda: InputSanitizer.sanitize_phone("+1 (415) 555-2671")),
+        ("sanitizer.ip", lambda: InputSanitizer.sanitize_ip("203.0.113.42")),
+    ]
+
+
+def cache_cases() -> List[Case]:
+    cache = SimpleCache()
+    cache.set("doc:hit", {"risk_score": 0.1})
+    counter = iter(range(sys.maxsize))
+    return [
+        ("cache.get_hit", lambda: cache.get("doc:hit")),
+        ("cache.get_miss", lambda: cache.get("doc:miss")),
+        ("cache.set", lambda: cache.set(f"doc:{next(counter) % 1000}", 1)),
+    ]
+
+
+CASE_GROUPS = [
+    document_cases,
+    text_cases,
+    analysis_cases,
+    sanitizer_cases,
+    cache_cases,
+]
+
+
+def measure(func: Callable[[], Any], min_time: float, max_iterations: int):
+    for _ in range(3):
+        func()
+
+    gc.collect()
+    gc.disable()
+    durations = []
+    deadline = time.perf_counter() + min_time
+    try:
+        while len(durations) < max_iterations and (
+            len(durations) < 10 or time.perf_counter() < deadline
+        ):
+            start = time.perf_counter_ns()
+            func()
+            durations.append(time.perf_counter_ns() - start)
+    finally:
+        gc.enable()
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(5):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    durations.sort()
+    total_s = sum(durations) / 1e9
+    return {
+        "iterations": len(durations),
+        "ops_per_sec": round(len(durations) / total_s, 1) if total_s else None,
+        "mean_us": round(statistics.fmean(durations) / 1000, 3),
+        "p50_us": round(durations[len(durations) // 2] / 1000, 3),
+        "p99_us": round(
+            durations[min(len(durations) - 1, int(len(durations) * 0.99))] / 1000, 3
+        ),
+        "alloc_peak_bytes": int(statistics.median(peaks)),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(select: str, min_time: float, max_iterations: int) -> Dict[str, Any]:
+    results = {}
+    for group in CASE_GROUPS:
+        for name, func in group():
+            if select and select not in name:
+                continue
+            results[name] = measure(func, min_time, max_iterations)
+            print(
+                f"{name:45} {results[name]['ops_per_sec']:>12,.0f} ops/s  "
+                f"p50 {results[name]['p50_us']:>10.1f}us  "
+                f"p99 {results[name]['p99_us']:>10.1f}us  "
+                f"{results[name]['alloc_peak_bytes']:>10,} B",
+                file=sys.stderr,
+            )
+
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    rows = []
+    for name, before in baseline["results"].items():
+        after = current["results"].get(name)
+        if after is None:
+            continue
+        time_ratio = after["p50_us"] / before["p50_us"] if before["p50_us"] else 1.0
+        alloc_ratio = (
+            after["alloc_peak_bytes"] / before["alloc_peak_bytes"]
+            if before["alloc_peak_bytes"]
+            else 1.0
+        )
+        rows.append(
+            {
+                "name": name,
+                "p50_before_us": before["p50_us"],
+                "p50_after_us": after["p50_us"],
+                "time_change": round(time_ratio - 1, 3),
+                "alloc_change": round(alloc_ratio - 1, 3),
+                "regressed": time_ratio > 1 + threshold or alloc_ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(report: Dict[str, Any], path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks for the service hot paths"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks and save results")
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare results against a saved baseline"
+    )
+    for sub in (run_parser, compare_parser):
+        sub.add_argument(
+            "-k", "--select", default="", help="Only names containing this"
+        )
+        sub.add_argument("--min-time", type=float, default=0.5)
+        sub.add_argument("--max-iterations", type=int, default=20_000)
+
+    run_parser.add_argument("--output", help="Write JSON results to this path")
+    compare_parser.add_argument("baseline", help="Baseline JSON from `run --output`")
+    compare_parser.add_argument(
+        "current", nargs="?", help="Results JSON to compare (default: run now)"
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Flag p50 or allocation growth beyond this fraction",
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run(args.select, args.min_time, args.max_iterations)
+        if args.output:
+            save(report, args.output)
+        else:
+            print(json.dumps(report, indent=2))
+        return 0
+
+    baseline = load(args.baseline)
+    current = (
+        load(args.current)
+        if args.current
+        else run(args.select, args.min_time, args.max_iterations)
+    )
+    rows = compare(baseline, current, args.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regressed"] else "ok"
+        print(
+            f"{row['name']:45} {row['p50_before_us']:>10.1f}us -> "
+            f"{row['p50_after_us']:>10.1f}us  time {row['time_change']:+.1%}  "
+            f"alloc {row['alloc_change']:+.1%}  {flag}"
+        )
+    regressions = [row for row in rows if row["regressed"]]
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["fitz", "docx", "phonenumbers", "email_validator", "httpx"]
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "import_ms": elapsed * 1000,
+    "loaded": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure_once():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    return probe, modules
+
+
+def run(runs, top):
+    samples = []
+    probe, modules = None, []
+    for _ in range(runs):
+        probe, modules = measure_once()
+        samples.append(probe["import_ms"])
+
+    slowest = sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+    return {
+        "runs": runs,
+        "import_ms": {
+            "min": round(min(samples), 1),
+            "median": round(statistics.median(samples), 1),
+            "max": round(max(samples), 1),
+        },
+        "heavy_modules_loaded": probe["loaded"],
+        "slowest_modules": [
+            {"module": name, "self_ms": round(self_us / 1000, 1)}
+            for name, self_us, _ in slowest
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.runs, args.top), indent=2))
+
+
+if __name__ == "__main__":
+    main()
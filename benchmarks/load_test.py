@@ -0,0 +1,443 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLES_DIR = os.path.join(ROOT, "static", "samples")
+sys.path.insert(0, ROOT)
+
+ENDPOINTS = {
+    "detect": ("POST", "/api/v1/detect/resume"),
+    "stream": ("POST", "/api/v1/detect/resume/stream"),
+    "contact": ("POST", "/api/v1/verify/contact"),
+    "content": ("POST", "/api/v1/analyze/content"),
+    "document": ("POST", "/api/v1/examine/document"),
+    "jobs": ("POST", "/api/v1/jobs"),
+    "health": ("GET", "/health"),
+    "oversize": ("POST", "/api/v1/detect/resume"),
+}
+
+DEFAULT_MIX = "detect=6,stream=1,contact=1,content=1,document=1"
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "txt": "text/plain",
+}
+
+CACHE_SAMPLE = re.compile(
+    r'^cache_operations_total\{namespace="(?P<namespace>[^"]+)",'
+    r'result="(?P<result>[^"]+)"\} (?P<value>[0-9.e+]+)$',
+    re.MULTILINE,
+)
+
+
+def parse_mix(raw: str) -> List[Tuple[str, float]]:
+    mix = []
+    for entry in raw.split(","):
+        name, _, weight = entry.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint in mix: {name}")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+def load_documents(sources: List[str], count: int, sizes: List[str], seed: int):
+    documents = []
+    if "samples" in sources:
+        for name in sorted(os.listdir(SAMPLES_DIR)):
+            with open(os.path.join(SAMPLES_DIR, name), "rb") as f:
+                documents.append((name, f.read()))
+
+    if "corpus" in sources:
+        from app.testing.corpus import generate_corpus
+
+        documents += [
+            (resume.filename, resume.content)
+            for resume in generate_corpus(count, seed=seed, sizes=sizes)
+        ]
+    return documents
+
+
+def make_unique(filename: str, content: bytes, token: str) -> bytes:
+    if filename.endswith(".txt"):
+        return content + f"\nRef {token}".encode()
+    return content + f"%{token}".encode()
+
+
+def classify(status: Optional[int], error: Optional[str]) -> str:
+    if error:
+        return "transport_error"
+    if status == 429:
+        return "rate_limited"
+    if status == 413:
+        return "too_large"
+    if status == 503:
+        return "shed"
+    if status >= 500:
+        return "server_error"
+    if status >= 400:
+        return "client_error"
+    return "ok"
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return round(sorted_values[index], 2)
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, Optional[float]]:
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": percentile(ordered, 0.50),
+        "p90_ms": percentile(ordered, 0.90),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": round(ordered[-1], 2) if ordered else None,
+    }
+
+
+@dataclass
+class Results:
+    started: float = field(default_factory=time.perf_counter)
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    statuses: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    outcomes: Counter = field(default_factory=Counter)
+    dropped: int = 0
+
+    def record(
+        self,
+        endpoint: str,
+        latency_ms: float,
+        status: Optional[int],
+        error: Optional[str],
+    ) -> None:
+        outcome = classify(status, error)
+        self.outcomes[outcome] += 1
+        self.statuses[endpoint][str(status) if status else error] += 1
+        if outcome == "ok":
+            self.latencies[endpoint].append(latency_ms)
+
+
+class LoadGenerator:
+    def __init__(self, client, args, documents):
+        self.client = client
+        self.args = args
+        self.documents = documents
+        self.mix = parse_mix(args.mix)
+        self.rng = random.Random(args.seed)
+        self.results = Results()
+        self.sequence = 0
+
+    def _request(self) -> Tuple[str, Dict[str, Any]]:
+        names, weights = zip(*self.mix)
+        endpoint = self.rng.choices(names, weights)[0]
+        self.sequence += 1
+
+        headers = {}
+        if self.args.clients:
+            headers["X-Forwarded-For"] = (
+                f"198.18.{self.sequence % self.args.clients // 256}."
+                f"{self.sequence % self.args.clients % 256}"
+            )
+        if self.args.api_key:
+            headers["X-API-Key"] = self.args.api_key
+
+        method, path = ENDPOINTS[endpoint]
+        request = {"method": method, "url": path, "headers": headers}
+        if method == "POST":
+            if endpoint == "oversize":
+                filename, content = "oversize.txt", b"a" * (10 * 1024 * 1024 + 1)
+            else:
+                filename, content = self.rng.choice(self.documents)
+                if self.rng.random() < self.args.unique_ratio:
+                    content = make_unique(filename, content, f"{self.sequence:08d}")
+            extension = filename.rsplit(".", 1)[-1]
+            request["files"] = {
+                "file": (filename, content, CONTENT_TYPES.get(extension, "text/plain"))
+            }
+        return endpoint, request
+
+    async def _send(self, endpoint: str, request: Dict[str, Any]) -> None:
+        status, error = None, None
+        start = time.perf_counter()
+        try:
+            async with self.client.stream(
+                timeout=self.args.timeout, **request
+            ) as response:
+                async for _ in response.aiter_bytes():
+                    pass
+                status = response.status_code
+        except Exception as e:
+            error = type(e).__name__
+        self.results.record(
+            endpoint, (time.perf_counter() - start) * 1000, status, error
+        )
+
+    async def run_open_loop(self) -> None:
+        interval = 1 / self.args.rps
+        deadline = time.perf_counter() + self.args.duration
+        in_flight = set()
+        next_start = time.perf_counter()
+
+        while next_start < deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= self.args.max_in_flight:
+                self.results.dropped += 1
+            else:
+                task = asyncio.create_task(self._send(*self._request()))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_start += interval
+
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    async def run_closed_loop(self) -> None:
+        deadline = time.perf_counter() + self.args.duration
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                await self._send(*self._request())
+
+        await asyncio.gather(*(worker() for _ in range(self.args.concurrency)))
+
+    async def run(self) -> None:
+        self.results = Results()
+        if self.args.rps:
+            await self.run_open_loop()
+        else:
+            await self.run_closed_loop()
+        self.results.elapsed = time.perf_counter() - self.results.started
+
+
+async def wait_until_ready(client, timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            response = await client.get("/health/ready", timeout=5)
+            if response.status_code == 200:
+                return True
+        except Exception:
+            pass
+        await asyncio.sleep(0.25)
+    return False
+
+
+async def cache_counters(client) -> Optional[Dict[Tuple[str, str], float]]:
+    try:
+        response = await client.get("/metrics", timeout=10)
+    except Exception:
+        return None
+    if response.status_code != 200:
+        return None
+    return {
+        (match["namespace"], match["result"]): float(match["value"])
+        for match in CACHE_SAMPLE.finditer(response.text)
+    }
+
+
+def cache_hit_rates(before, after) -> Optional[Dict[str, Any]]:
+    if before is None or after is None:
+        return None
+    rates = {}
+    for namespace in sorted({namespace for namespace, _ in after}):
+        hits = after.get((namespace, "hit"), 0) - before.get((namespace, "hit"), 0)
+        misses = after.get((namespace, "miss"), 0) - before.get((namespace, "miss"), 0)
+        if hits + misses:
+            rates[namespace] = {
+                "hits": int(hits),
+                "misses": int(misses),
+                "hit_rate": round(hits / (hits + misses), 3),
+            }
+    return rates
+
+
+def build_report(args, results: Results, cache: Optional[Dict[str, Any]]):
+    completed = sum(results.outcomes.values())
+    all_latencies = [value for values in results.latencies.values() for value in values]
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "target": "in-process" if args.in_process else args.url,
+            "mode": f"open-loop {args.rps} rps"
+            if args.rps
+            else (f"closed-loop {args.concurrency} clients"),
+            "duration_s": args.duration,
+            "mix": args.mix,
+            "documents": args.documents,
+            "unique_ratio": args.unique_ratio,
+            "seed": args.seed,
+        },
+        "elapsed_s": round(results.elapsed, 2),
+        "requests": completed,
+        "dropped": results.dropped,
+        "throughput_rps": round(completed / results.elapsed, 2)
+        if results.elapsed
+        else 0,
+        "success_rps": round(results.outcomes["ok"] / results.elapsed, 2)
+        if results.elapsed
+        else 0,
+        "latency": latency_summary(all_latencies),
+        "outcomes": dict(results.outcomes),
+        "endpoints": {
+            endpoint: {
+                "requests": sum(results.statuses[endpoint].values()),
+                "statuses": dict(results.statuses[endpoint]),
+                **latency_summary(results.latencies.get(endpoint, [])),
+            }
+            for endpoint in sorted(results.statuses)
+        },
+        "cache": cache,
+    }
+
+
+def ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value}ms"
+
+
+def text_report(report: Dict[str, Any]) -> str:
+    latency = report["latency"]
+    lines = [
+        f"Target {report['meta']['target']} ({report['meta']['mode']}, "
+        f"{report['elapsed_s']}s)",
+        f"Requests {report['requests']}  dropped {report['dropped']}  "
+        f"throughput {report['throughput_rps']} rps  ok {report['success_rps']} rps",
+        f"Latency p50 {ms(latency['p50_ms'])}  p90 {ms(latency['p90_ms'])}  "
+        f"p99 {ms(latency['p99_ms'])}  max {ms(latency['max_ms'])}",
+        "Outcomes "
+        + "  ".join(f"{name} {count}" for name, count in report["outcomes"].items()),
+    ]
+    for endpoint, stats in report["endpoints"].items():
+        statuses = " ".join(f"{k}:{v}" for k, v in sorted(stats["statuses"].items()))
+        lines.append(
+            f"  {endpoint:10} n={stats['requests']:<6} p50 {ms(stats['p50_ms'])}  "
+            f"p99 {ms(stats['p99_ms'])}  [{statuses}]"
+        )
+    if report["cache"]:
+        lines.append(
+            "Cache "
+            + "  ".join(
+                f"{namespace} {stats['hit_rate']:.0%}"
+                for namespace, stats in report["cache"].items()
+            )
+        )
+    return "\n".join(lines)
+
+
+@contextlib.asynccontextmanager
+async def open_client(args):
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight
+    )
+    if not args.in_process:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits) as client:
+            yield client
+        return
+
+    if args.simulator:
+        os.environ.setdefault("UPSTREAM_SIMULATOR", "true")
+    os.chdir(ROOT)
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://app"
+        ) as client:
+            yield client
+
+
+async def main_async(args) -> Dict[str, Any]:
+    documents = load_documents(
+        args.documents.split(","), args.corpus_count, args.sizes.split(","), args.seed
+    )
+    async with open_client(args) as client:
+        if not await wait_until_ready(client, args.ready_timeout):
+            print("Target did not report ready; measuring anyway", file=sys.stderr)
+        before = await cache_counters(client)
+        generator = LoadGenerator(client, args, documents)
+        await generator.run()
+        after = await cache_counters(client)
+    return build_report(args, generator.results, cache_hit_rates(before, after))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the API with a mixed workload")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Drive app.main:app through an ASGI transport instead of the network",
+    )
+    parser.add_argument(
+        "--simulator",
+        action="store_true",
+        help="With --in-process, route upstream calls to the upstream simulator",
+    )
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--rps", type=float, help="Open-loop arrival rate")
+    load.add_argument("--concurrency", type=int, default=8, help="Closed-loop clients")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="endpoint=weight,...")
+    parser.add_argument(
+        "--documents", default="samples,corpus", help="samples and/or corpus"
+    )
+    parser.add_argument(
+        "--corpus-count", type=int, default=40, help="Generated resumes to draw from"
+    )
+    parser.add_argument(
+        "--sizes",
+        default="short,standard,long",
+        help="Generated resume sizes (short, standard, long, huge)",
+    )
+    parser.add_argument(
+        "--unique-ratio",
+        type=float,
+        default=0.5,
+        help="Fraction of uploads made unique so they miss the caches",
+    )
+    parser.add_argument(
+        "--clients",
+        type=int,
+        default=1000,
+        help="Spread requests over this many X-Forwarded-For addresses (0 = off)",
+    )
+    parser.add_argument("--api-key", help="Send as X-API-Key")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument(
+        "--ready-timeout",
+        type=float,
+        default=60.0,
+        help="Wait this long for /health/ready before starting",
+    )
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    print(text_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
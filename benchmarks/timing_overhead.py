@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.timing import Span, request_timings
+
+
+def per_iteration_ns(func, iterations):
+    start = time.perf_counter_ns()
+    func(iterations)
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def empty_loop(iterations):
+    for _ in range(iterations):
+        pass
+
+
+def span_loop(iterations):
+    for _ in range(iterations):
+        with Span("benchmark"):
+            pass
+
+
+def run(iterations, repeats):
+    baseline = min(per_iteration_ns(empty_loop, iterations) for _ in range(repeats))
+    idle = min(per_iteration_ns(span_loop, iterations) for _ in range(repeats))
+
+    request_samples = []
+    for _ in range(repeats):
+        token = request_timings.set([])
+        request_samples.append(per_iteration_ns(span_loop, iterations))
+        request_timings.reset(token)
+    in_request = min(request_samples)
+
+    return {
+        "iterations": iterations,
+        "span_ns": round(idle - baseline, 1),
+        "span_in_request_ns": round(in_request - baseline, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-span timing overhead")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--budget-ns",
+        type=float,
+        default=3000,
+        help="Exit non-zero if a span costs more than this",
+    )
+    args = parser.parse_args()
+
+    result = run(args.iterations, args.repeats)
+    print(json.dumps(result, indent=2))
+    return 0 if result["span_in_request_ns"] <= args.budget_ns else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,5 @@
-import os
-import uvicorn
-from app.main import app
+import sys
+from app.launcher import main
 
 if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 8000))
-    uvicorn.run("app.main:app", host="0.0.0.0", port=port, reload=False)
+    sys.exit(main())
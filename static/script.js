@@ -97,6 +97,9 @@ testBtn.addEventListener('click', async () => {
         
         if (endpointValue === '/health') {
             response = await fetch('/health');
+        } else if (endpointValue === '/api/v1/detect/resume') {
+            await streamDetection(startTime);
+            return;
         } else {
             const formData = new FormData();
             formData.append('file', selectedFile);
@@ -134,4 +137,75 @@ testBtn.addEventListener('click', async () => {
     }
 });
 
+const STAGE_LABELS = {
+    extraction: 'Text Extraction',
+    document: 'Document Authenticity',
+    contact: 'Contact Verification',
+    ai: 'AI Content Detection',
+    final: 'Overall Assessment'
+};
+
+function renderStages(stages) {
+    responseContainer.innerHTML = Object.entries(stages).map(([stage, entry]) => `
+        <div class="stage-result">
+            <div class="stage-title">${STAGE_LABELS[stage] || stage} <span>${(entry.elapsed / 1000).toFixed(2)}s</span></div>
+            <div class="response-container">${JSON.stringify(entry.data, null, 2)}</div>
+        </div>
+    `).join('');
+}
+
+async function streamDetection(startTime) {
+    const formData = new FormData();
+    formData.append('file', selectedFile);
+
+    const response = await fetch('/api/v1/detect/resume/stream', {
+        method: 'POST',
+        body: formData
+    });
+
+    if (!response.ok) {
+        const data = await response.json();
+        statusText.textContent = `Status: ${response.status} ${response.statusText}`;
+        statusText.className = 'status-error';
+        responseTime.textContent = `${((Date.now() - startTime) / 1000).toFixed(2)}s`;
+        responseContainer.innerHTML = `
+            <div class="response-container">${JSON.stringify(data, null, 2)}</div>
+        `;
+        return;
+    }
+
+    const stages = {};
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let failed = false;
+
+    statusText.textContent = 'Streaming results...';
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const frames = buffer.split('\n\n');
+        buffer = frames.pop();
+
+        for (const frame of frames) {
+            const event = frame.match(/^event: (.*)$/m);
+            const data = frame.match(/^data: (.*)$/m);
+            if (!event || !data) continue;
+
+            const elapsed = Date.now() - startTime;
+            stages[event[1]] = { data: JSON.parse(data[1]), elapsed };
+            failed = failed || event[1] === 'error';
+            responseTime.textContent = `${(elapsed / 1000).toFixed(2)}s`;
+            renderStages(stages);
+        }
+    }
+
+    statusText.textContent = failed ? 'Status: Processing error' : `Status: ${response.status} ${response.statusText}`;
+    statusText.className = failed ? 'status-error' : 'status-success';
+    responseTime.textContent = `${((Date.now() - startTime) / 1000).toFixed(2)}s`;
+}
+
 updateTestButton();
\ No newline at end of file
@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from io import BytesIO
+from fastapi.testclient import TestClient
+from app.core.admission import AdaptiveLimiter, AdmissionRejected, lanes
+from app.core.cache import cache
+from app.core.rate_limiter import limiter
+from app.main import app
+
+
+class TestAdaptiveLimiter:
+    @pytest.mark.asyncio
+    async def test_limit_grows_when_fast_and_shrinks_when_slow(self):
+        lane = AdaptiveLimiter("test", 4, target_latency=1.0, max_queue_wait=1.0)
+
+        for _ in range(4):
+            await lane.acquire()
+            lane.release(0.1)
+        assert lane.limit > 4
+
+        for _ in range(4):
+            await lane.acquire()
+            lane.release(5.0)
+        assert lane.limit < 4
+        assert lane.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_admitted_when_slot_frees(self):
+        lane = AdaptiveLimiter("test", 1, target_latency=1.0, max_queue_wait=1.0)
+        await lane.acquire()
+
+        waiter = asyncio.ensure_future(lane.acquire())
+        await asyncio.sleep(0.01)
+        assert lane.waiting == 1
+
+        lane.release(0.01)
+        await asyncio.wait_for(waiter, 1.0)
+        assert lane.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_queue_wait_threshold(self):
+        lane = AdaptiveLimiter("test", 1, target_latency=1.0, max_queue_wait=0.05)
+        await lane.acquire()
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await lane.acquire()
+
+        assert exc_info.value.status_code == 503
+        assert int(exc_info.value.headers["Retry-After"]) >= 1
+        assert lane.rejected == 1
+        assert lane.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_immediately_when_estimated_wait_too_long(self):
+        lane = AdaptiveLimiter("test", 1, target_latency=10.0, max_queue_wait=1.0)
+        await lane.acquire()
+        lane.avg_latency = 5.0
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await asyncio.wait_for(lane.acquire(), 0.1)
+
+        assert exc_info.value.retry_after == 5
+
+
+class TestAdmissionEndpoints:
+    def setup_method(self):
+        limiter.reset()
+        cache.clear()
+
+    def test_overloaded_server_sheds_new_analyses(self, monkeypatch):
+        client = TestClient(app)
+        busy = AdaptiveLimiter("cpu", 1, target_latency=1.0, max_queue_wait=0.01)
+        busy.gate.in_use = 1
+        monkeypatch.setitem(lanes, "cpu", busy)
+
+        files = {"file": ("busy.txt", BytesIO(b"Busy Person\nbusy@example.com"))}
+        response = client.post("/api/v1/detect/resume", files=files)
+
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+        assert client.get("/health").status_code == 200
+
+    def test_cache_hits_bypass_admission(self, monkeypatch):
+        client = TestClient(app)
+        file_content = b"Cached Person\ncached@example.com"
+        first = client.post(
+            "/api/v1/detect/resume", files={"file": ("c.txt", BytesIO(file_content))}
+        )
+        assert first.status_code == 200
+
+        busy = AdaptiveLimiter("cpu", 1, target_latency=1.0, max_queue_wait=0.01)
+        busy.gate.in_use = 1
+        monkeypatch.setitem(lanes, "cpu", busy)
+        monkeypatch.setitem(lanes, "upstream", busy)
+
+        second = client.post(
+            "/api/v1/detect/resume", files={"file": ("c.txt", BytesIO(file_content))}
+        )
+        assert second.status_code == 200
@@ -1,13 +1,21 @@
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.core.cache import cache
+from app.core.rate_limiter import limiter
 from io import BytesIO
+import json
+import time
+import zipfile
 
 
 client = TestClient(app)
 
 
 class TestAPI:
+    def setup_method(self):
+        limiter.reset()
+
     def test_health_endpoint(self):
         response = client.get("/health")
         assert response.status_code == 200
@@ -68,6 +76,25 @@ class TestAPI:
         assert "ai_content_analysis" in data
         assert "document_analysis" in data
 
+    def test_streaming_detection_emits_stage_events(self):
+        file_content = b"Sam Poe\nEmail: sam@example.com\nPhone: (555) 222-3333"
+        files = {"file": ("stream.txt", BytesIO(file_content), "text/plain")}
+
+        response = client.post("/api/v1/detect/resume/stream", files=files)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = {}
+        for frame in response.text.strip().split("\n\n"):
+            event, data = frame.split("\n")
+            events[event[len("event: ") :]] = json.loads(data[len("data: ") :])
+
+        assert list(events)[0] == "extraction"
+        assert list(events)[-1] == "final"
+        assert set(events) == {"extraction", "document", "ai", "contact", "final"}
+        assert events["extraction"]["format"] == "txt"
+        assert events["final"]["risk_level"] in ["low", "medium", "high"]
+
     def test_invalid_file_type(self):
         file_content = b"invalid content"
         files = {
@@ -84,3 +111,121 @@ class TestAPI:
         response = client.post("/api/v1/detect/resume", files=files)
         assert response.status_code == 400
         assert "Empty file" in response.json()["detail"]
+
+    def test_cached_document_reverifies_requester_ip(self):
+        cache.clear()
+        file_content = b"Jane Roe\nEmail: jane@example.com\nPhone: (555) 987-6543"
+
+        first = client.post(
+            "/api/v1/detect/resume",
+            files={"file": ("a.txt", BytesIO(file_content), "text/plain")},
+            headers={"X-Forwarded-For": "10.0.0.1"},
+        )
+        second = client.post(
+            "/api/v1/detect/resume",
+            files={"file": ("a.txt", BytesIO(file_content), "text/plain")},
+            headers={"X-Forwarded-For": "8.8.8.8"},
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        first_ip = first.json()["contact_verification"]["ip_verification"]
+        second_ip = second.json()["contact_verification"]["ip_verification"]
+        assert first_ip["ip_address"] == "10.0.0.1"
+        assert second_ip["ip_address"] == "8.8.8.8"
+        assert cache.get_stats()["hits"] >= 1
+
+    def test_repeated_detection_served_from_serialized_cache(self):
+        cache.clear()
+        file_content = b"Kim Doe\nEmail: kim@example.com\nPhone: (555) 444-1212"
+
+        responses = [
+            client.post(
+                "/api/v1/detect/resume",
+                files={"file": ("k.txt", BytesIO(file_content), "text/plain")},
+                headers={"X-Forwarded-For": "10.0.0.2"},
+            )
+            for _ in range(2)
+        ]
+
+        assert all(r.status_code == 200 for r in responses)
+        assert responses[0].headers["content-type"] == "application/json"
+        assert responses[0].content == responses[1].content
+        assert responses[1].json()["risk_level"] in ["low", "medium", "high"]
+
+    def test_rate_limit_is_per_forwarded_client(self):
+        files = {"file": ("r.txt", b"Rate Test\nrate@example.com", "text/plain")}
+
+        statuses = [
+            client.post(
+                "/api/v1/examine/document",
+                files=files,
+                headers={"X-Forwarded-For": "198.51.100.7"},
+            ).status_code
+            for _ in range(11)
+        ]
+        other = client.post(
+            "/api/v1/examine/document",
+            files=files,
+            headers={"X-Forwarded-For": "198.51.100.8"},
+        )
+
+        assert statuses[:10] == [200] * 10
+        assert statuses[10] == 429
+        assert other.status_code == 200
+
+    def test_batch_endpoint_streams_ndjson(self):
+        files = [
+            ("files", ("a.txt", BytesIO(b"Ann Lee\nann@example.com"), "text/plain")),
+            ("files", ("b.txt", BytesIO(b"Bob Ray\nbob@example.org"), "text/plain")),
+            ("files", ("c.exe", BytesIO(b"binary"), "application/octet-stream")),
+        ]
+
+        response = client.post("/api/v1/detect/batch", files=files)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        items = [json.loads(line) for line in response.text.splitlines()]
+        by_name = {item["filename"]: item for item in items}
+        assert sorted(by_name) == ["a.txt", "b.txt", "c.exe"]
+        assert by_name["a.txt"]["result"]["risk_level"] in ["low", "medium", "high"]
+        assert by_name["c.exe"]["status_code"] == 400
+        assert "Unsupported file type" in by_name["c.exe"]["error"]
+
+    def test_batch_endpoint_accepts_zip_archive(self):
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("resumes/one.txt", "One Person\none@example.com")
+            zf.writestr("resumes/two.txt", "Two Person\ntwo@example.com")
+            zf.writestr("resumes/empty.txt", "")
+        archive.seek(0)
+
+        response = client.post(
+            "/api/v1/detect/batch",
+            files=[("files", ("batch.zip", archive, "application/zip"))],
+        )
+        assert response.status_code == 200
+
+        items = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(item["index"] for item in items) == [0, 1, 2]
+        errors = [item for item in items if item["error"]]
+        assert len(errors) == 1
+        assert "Empty file" in errors[0]["error"]
+
+    def test_job_submission_and_polling(self):
+        with TestClient(app) as job_client:
+            files = {"file": ("job.txt", BytesIO(b"Job Seeker\njob@example.com"))}
+            response = job_client.post("/api/v1/jobs", files=files)
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+
+            for _ in range(100):
+                data = job_client.get(f"/api/v1/jobs/{job_id}").json()
+                if data["status"] in ["completed", "failed"]:
+                    break
+                time.sleep(0.05)
+
+            assert data["status"] == "completed"
+            assert "overall_risk_score" in data["result"]
+
+            assert job_client.get("/api/v1/jobs/unknown").status_code == 404
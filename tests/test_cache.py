@@ -1,6 +1,6 @@
 import pytest
 import time
-from app.core.cache import SimpleCache
+from app.core.cache import SimpleCache, text_fingerprint
 
 
 class TestSimpleCache:
@@ -57,3 +57,32 @@ class TestSimpleCache:
 
         assert key1 == key2
         assert key1 != key3
+
+    def test_text_fingerprint_normalization(self):
+        base = text_fingerprint("John Smith\nSenior Engineer")
+
+        assert text_fingerprint("  john   SMITH\r\n\tsenior engineer ") == base
+        assert text_fingerprint("John\x00 Smith\x07\nSenior Engineer") == base
+        assert text_fingerprint("Jane Smith\nSenior Engineer") != base
+
+    def test_text_result_caching(self):
+        cache = SimpleCache()
+
+        result = {"ai_content_analysis": {"overall_ai_probability": 0.1}}
+        cache.cache_text_result(
+            text_fingerprint("Resume text\nexported as PDF"), result
+        )
+
+        assert (
+            cache.get_text_result(text_fingerprint("resume text exported as pdf"))
+            == result
+        )
+        assert cache.get_text_result(text_fingerprint("different resume")) is None
+
+    def test_response_caching_is_per_requester(self):
+        cache = SimpleCache()
+
+        cache.cache_response("abc123", "10.0.0.1", b'{"risk_level":"low"}')
+
+        assert cache.get_response("abc123", "10.0.0.1") == b'{"risk_level":"low"}'
+        assert cache.get_response("abc123", "8.8.8.8") is None
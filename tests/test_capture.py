@@ -0,0 +1,157 @@
+import asyncio
+import httpx
+import pytest
+from io import BytesIO
+from fastapi.testclient import TestClient
+from app.core.cache import cache
+from app.core.capture import TrafficCapture, file_path, traffic_capture, upstream_key
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.core.rate_limiter import limiter
+from app.main import app
+from app.testing.replay import ReplayTransport, load_capture, replay
+from app.testing.upstream_simulator import SimulatorConfig, create_app
+
+SIMULATOR_URLS = {
+    "ABSTRACT_EMAIL_API": "http://simulator/email/v1/",
+    "ABSTRACT_PHONE_API": "http://simulator/phone/v1/",
+    "ABSTRACT_IP_API": "http://simulator/ip/v1/",
+    "WINSTON_AI_API": "http://simulator/winston/v2/ai-content-detection",
+}
+
+API_KEYS = [
+    "ABSTRACT_EMAIL_API_KEY",
+    "ABSTRACT_PHONE_API_KEY",
+    "ABSTRACT_IP_API_KEY",
+    "WINSTON_AI_API_KEY",
+]
+
+RESUME = (
+    b"Casey Replay\nEmail: casey.replay@tempmail.com\nPhone: +1 415 555 0134\n\n"
+    b"Experienced engineer who shipped billing and search services."
+)
+
+
+@pytest.fixture
+def captured(tmp_path, monkeypatch):
+    simulator_app = create_app(
+        SimulatorConfig.from_dict(
+            {
+                "seed": 3,
+                "services": {
+                    name: {"median_ms": 0, "p99_ms": 0}
+                    for name in ["email", "phone", "ip", "winston"]
+                },
+            }
+        )
+    )
+    for name, url in SIMULATOR_URLS.items():
+        monkeypatch.setattr(settings, name, url)
+    for name in API_KEYS:
+        monkeypatch.setattr(settings, name, "secret-key")
+    monkeypatch.setattr(
+        http_client, "transport", httpx.ASGITransport(app=simulator_app)
+    )
+    monkeypatch.setattr(http_client, "_client", None)
+    monkeypatch.setattr(traffic_capture, "enabled", True)
+    monkeypatch.setattr(traffic_capture, "directory", str(tmp_path))
+    monkeypatch.setattr(traffic_capture, "_handler", None)
+    monkeypatch.setattr(limiter, "enabled", True)
+    limiter.reset()
+    cache.clear()
+
+    response = TestClient(app).post(
+        "/api/v1/verify/contact",
+        files={"file": ("casey.txt", BytesIO(RESUME), "text/plain")},
+        headers={"X-Forwarded-For": "203.0.113.9", "X-API-Key": "client-key"},
+    )
+    assert response.status_code == 200
+    traffic_capture.close()
+
+    yield tmp_path, simulator_app.state.simulator
+    http_client._client = None
+    cache.clear()
+
+
+class TestTrafficCapture:
+    def test_request_entry_references_stored_file(self, captured):
+        directory, _ = captured
+        requests, upstream = load_capture(str(directory))
+
+        assert len(requests) == 1
+        entry = requests[0]
+        assert entry["path"] == "/api/v1/verify/contact"
+        assert entry["status"] == 200
+        assert entry["duration_ms"] > 0
+        assert entry["headers"]["x-forwarded-for"] == "203.0.113.9"
+        assert entry["api_key"] is True
+        assert "client-key" not in str(entry)
+
+        part = entry["parts"][0]
+        assert part["field"] == "file"
+        assert part["filename"] == "casey.txt"
+        with open(file_path(str(directory), part["sha256"]), "rb") as f:
+            assert f.read() == RESUME
+
+        services = {item["service"] for item in upstream}
+        assert {"abstract_email", "abstract_phone", "abstract_ip"} <= services
+        assert all(item["request_id"] == entry["id"] for item in upstream)
+        assert "secret-key" not in str(upstream)
+
+    def test_upstream_key_ignores_api_key(self):
+        first = httpx.URL("http://simulator/email/v1/?api_key=a&email=x%40y.com")
+        second = httpx.URL("http://simulator/email/v1/?email=x%40y.com&api_key=b")
+
+        assert upstream_key("GET", first, b"") == upstream_key("GET", second, b"")
+        assert upstream_key("GET", first, b"") != upstream_key("GET", first, b"{}")
+
+    def test_log_rotates_and_all_files_are_loaded(self, tmp_path):
+        capture = TrafficCapture(
+            True,
+            str(tmp_path),
+            max_bytes=400,
+            backups=10,
+            store_files=False,
+            max_body=1024,
+        )
+        for index in range(20):
+            capture.write(
+                {"type": "request", "id": str(index), "ts": float(index), "path": "/"}
+            )
+        capture.close()
+
+        assert len(list(tmp_path.glob("capture-*.jsonl*"))) > 1
+        requests, _ = load_capture(str(tmp_path))
+        assert [entry["id"] for entry in requests] == [str(i) for i in range(20)]
+
+
+class TestReplay:
+    def test_replay_serves_recorded_upstream_responses(self, captured, monkeypatch):
+        directory, simulator = captured
+        calls_after_capture = dict(simulator.stats()["responses"])
+        monkeypatch.setattr(traffic_capture, "enabled", False)
+        monkeypatch.setattr(http_client, "_client", None)
+        cache.clear()
+        limiter.reset()
+
+        report = asyncio.run(
+            replay(str(directory), speed=0, latency_scale=0, api_key="client-key")
+        )
+
+        assert report["requests"] == 1
+        assert report["status_mismatches"] == 0
+        assert report["upstream"]["misses"] == 0
+        assert report["upstream"]["hits"] >= 3
+        assert "POST /api/v1/verify/contact" in report["endpoints"]
+        assert simulator.stats()["responses"] == calls_after_capture
+
+    def test_replay_transport_answers_unknown_calls_with_bad_gateway(self):
+        transport = ReplayTransport([], latency_scale=0)
+
+        async def call():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await client.get("http://simulator/email/v1/?email=a%40b.c")
+
+        response = asyncio.run(call())
+        assert response.status_code == 502
+        assert transport.stats() == {"hits": 0, "misses": 1}
@@ -0,0 +1,165 @@
+import csv
+import json
+import httpx
+import pytest
+from app.cli import main
+from app.core.config import settings
+from app.core.http_client import http_client
+
+
+@pytest.fixture
+def resume_dir(tmp_path):
+    resumes = tmp_path / "resumes"
+    (resumes / "nested").mkdir(parents=True)
+    (resumes / "a.txt").write_text("Ann Lee\nann@example.com\n(555) 123-4567")
+    (resumes / "nested" / "b.txt").write_text("Bob Ray\nbob@example.org")
+    (resumes / "empty.txt").write_text("")
+    (resumes / "notes.md").write_text("ignored")
+    return resumes
+
+
+class TestScoreCommand:
+    def test_score_directory_to_jsonl(self, resume_dir, tmp_path, capsys):
+        output = tmp_path / "results.jsonl"
+
+        assert (
+            main(["score", str(resume_dir), "-o", str(output), "--workers", "1"]) == 0
+        )
+
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        by_id = {record["id"]: record for record in records}
+        assert sorted(by_id) == ["a.txt", "empty.txt", "nested/b.txt"]
+        assert "overall_risk_score" in by_id["a.txt"]["result"]
+        assert "extraction" in by_id["a.txt"]["timings"]
+        assert "Empty file" in by_id["empty.txt"]["error"]
+
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["processed"] == 3
+        assert summary["errors"] == 1
+
+    def test_score_reuses_one_http_client(self, resume_dir, tmp_path, monkeypatch):
+        class CountingTransport(httpx.MockTransport):
+            requests = 0
+            closed = 0
+
+            async def handle_async_request(self, request):
+                CountingTransport.requests += 1
+                return await super().handle_async_request(request)
+
+            async def aclose(self):
+                CountingTransport.closed += 1
+
+        monkeypatch.setattr(settings, "WINSTON_AI_API_KEY", "key")
+        monkeypatch.setattr(
+            http_client,
+            "transport",
+            CountingTransport(lambda request: httpx.Response(500)),
+        )
+        output = tmp_path / "results.jsonl"
+
+        main(["score", str(resume_dir), "-o", str(output), "--workers", "1"])
+
+        assert CountingTransport.requests == 2
+        assert CountingTransport.closed == 1
+        assert http_client._client is None
+
+    def test_score_resumes_from_checkpoint(self, resume_dir, tmp_path, capsys):
+        output = tmp_path / "results.jsonl"
+        args = ["score", str(resume_dir), "-o", str(output), "--workers", "1"]
+
+        main(args)
+        capsys.readouterr()
+        main(args)
+
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["processed"] == 0
+        assert summary["skipped"] == 3
+        assert len(output.read_text().splitlines()) == 3
+
+    def test_score_manifest_to_csv(self, resume_dir, tmp_path):
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text(
+            json.dumps({"id": "first", "path": "resumes/a.txt"})
+            + "\n"
+            + json.dumps({"path": str(resume_dir / "nested" / "b.txt")})
+            + "\n"
+        )
+        output = tmp_path / "results.csv"
+
+        main(["score", str(manifest), "-o", str(output), "--format", "csv", "-w", "2"])
+
+        with open(output) as f:
+            rows = list(csv.DictReader(f))
+        assert {row["id"] for row in rows} == {
+            "first",
+            str(resume_dir / "nested" / "b.txt"),
+        }
+        assert all(row["risk_level"] for row in rows)
+
+
+class TestRescoreCommand:
+    def test_rescore_score_output_reports_shift(self, resume_dir, tmp_path, capsys):
+        output = tmp_path / "results.jsonl"
+        main(["score", str(resume_dir), "-o", str(output), "--workers", "1"])
+        capsys.readouterr()
+        changes = tmp_path / "changes.csv"
+
+        main(
+            [
+                "rescore",
+                str(output),
+                "--contact-weight",
+                "1.0",
+                "--medium-threshold",
+                "0.0",
+                "--high-threshold",
+                "0.0",
+                "--changes",
+                str(changes),
+            ]
+        )
+
+        report = json.loads(capsys.readouterr().out)
+        assert report["results"] == 2
+        assert report["after"] == {"low": 0, "medium": 0, "high": 2}
+        assert report["weights"]["contact"] == 1.0
+        with open(changes) as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == report["changed"]
+        assert all(row["after"] == "high" for row in rows)
+
+    async def test_rescore_result_store(self, tmp_path, capsys):
+        from app.core.result_store import ResultStore
+        from app.services.fraud_scorer import FraudScoringService
+
+        path = str(tmp_path / "results.db")
+        store = ResultStore(path, 100, 1.0, 100)
+        for risk in [0.1, 0.4, 0.7]:
+            store.record(
+                FraudScoringService.calculate_overall_risk(
+                    {"risk_score": risk, "confidence": 0.9},
+                    {
+                        "overall_ai_probability": risk,
+                        "confidence": 0.9,
+                        "detection_method": "pattern_fallback",
+                    },
+                    {"risk_score": risk, "confidence": 0.9},
+                ),
+                {"content_hash": str(risk)},
+                {},
+                "resume.txt",
+                None,
+                {},
+            )
+        await store.flush()
+        store.close()
+
+        main(["rescore", path])
+        unchanged = json.loads(capsys.readouterr().out)
+        assert unchanged["results"] == 3
+        assert unchanged["changed"] == 0
+        assert unchanged["score_delta"]["max_abs"] == 0.0
+
+        main(["rescore", path, "--high-threshold", "0.3"])
+        stricter = json.loads(capsys.readouterr().out)
+        assert stricter["transitions"] == {"medium->high": 1}
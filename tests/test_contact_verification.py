@@ -25,8 +25,6 @@ class TestContactVerificationService:
         assert "confidence" in result
         assert result["confidence"] == 0.5
 
-        await service.close()
-
     @pytest.mark.asyncio
     async def test_email_verification_fallback(self):
         service = ContactVerificationService()
@@ -43,8 +41,6 @@ class TestContactVerificationService:
         assert "disposable" in email_result
         assert "deliverable" in email_result
 
-        await service.close()
-
     @pytest.mark.asyncio
     async def test_phone_verification_fallback(self):
         service = ContactVerificationService()
@@ -60,8 +56,6 @@ class TestContactVerificationService:
         assert "valid" in phone_result
         assert "country" in phone_result
 
-        await service.close()
-
     @pytest.mark.asyncio
     async def test_ip_verification_fallback(self):
         service = ContactVerificationService()
@@ -78,8 +72,6 @@ class TestContactVerificationService:
         assert "country_code" in ip_result
         assert "is_vpn" in ip_result
 
-        await service.close()
-
     def test_confidence_calculation(self):
         service = ContactVerificationService()
 
@@ -123,3 +115,27 @@ class TestContactVerificationService:
         assert result["country_code"] == "UNKNOWN"
         assert result["is_vpn"] == False
         assert result["is_tor"] == False
+
+    def test_combine_contact_results(self):
+        service = ContactVerificationService()
+        document_contacts = {
+            "email_verification": {"valid": True, "disposable": False},
+            "phone_verification": {"valid": False},
+            "email_api_used": True,
+            "phone_api_used": False,
+            "original_phone": "(555) 123-4567",
+        }
+
+        without_ip = service.combine_contact_results(document_contacts)
+        assert without_ip["ip_verification"] is None
+        assert without_ip["verification_methods"] == [
+            "abstract_email_api",
+            "local_phone_validation",
+        ]
+        assert without_ip["confidence"] == 0.7
+
+        ip_result = service._fallback_ip_result("10.0.0.1")
+        with_ip = service.combine_contact_results(document_contacts, ip_result, False)
+        assert with_ip["ip_verification"]["ip_address"] == "10.0.0.1"
+        assert "local_ip_validation" in with_ip["verification_methods"]
+        assert with_ip["risk_score"] > without_ip["risk_score"]
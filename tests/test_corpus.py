@@ -0,0 +1,122 @@
+import json
+from app.cli import main
+from app.services.contact_verification import ContactVerificationService
+from app.services.document_analysis import DocumentAnalysisService
+from app.services.document_processor import DocumentProcessor
+from app.testing.corpus import (
+    LINES_PER_PAGE,
+    ResumeSpec,
+    generate_corpus,
+    generate_resume,
+    load_labels,
+)
+
+
+def make(document_format, metadata="consistent", signals=(), size="short"):
+    return generate_resume(
+        ResumeSpec(
+            id="r",
+            format=document_format,
+            size=size,
+            structure="plain",
+            metadata=metadata,
+            signals=list(signals),
+            seed=11,
+        )
+    )
+
+
+class TestCorpusGenerator:
+    def test_generation_is_deterministic_per_seed(self):
+        first = [(r.filename, r.content) for r in generate_corpus(6, seed=4)]
+        second = [(r.filename, r.content) for r in generate_corpus(6, seed=4)]
+        other = [(r.filename, r.content) for r in generate_corpus(6, seed=5)]
+
+        assert first == second
+        assert first != other
+
+    def test_contact_labels_match_extracted_text(self):
+        resume = make("txt", signals=["disposable_email", "test_phone"])
+        text = DocumentProcessor.extract_sync(resume.content, resume.filename)["text"]
+        contacts = ContactVerificationService()._extract_contact_info(text)
+
+        assert resume.labels["disposable_email"] is True
+        assert contacts["email"] == resume.labels["email"]
+        assert "555" in resume.labels["phone"]
+        assert resume.labels["fraudulent"] is True
+
+    def test_size_dimension_scales_page_count(self):
+        short = make("pdf", size="short")
+        long = make("pdf", size="long")
+
+        short_data = DocumentProcessor.extract_sync(short.content, short.filename)
+        long_data = DocumentProcessor.extract_sync(long.content, long.filename)
+
+        assert short_data["metadata"]["page_count"] == 1
+        assert long_data["metadata"]["page_count"] == 10
+        assert long.labels["lines"] == 10 * LINES_PER_PAGE
+
+    def test_metadata_profiles_reach_document_analysis(self):
+        same_minute = make("pdf", metadata="same_minute")
+        malformed = make("docx", metadata="malformed_date")
+        template = make("pdf", metadata="template_builder")
+
+        def analyze(resume):
+            metadata = DocumentProcessor.extract_sync(resume.content, resume.filename)[
+                "metadata"
+            ]
+            return metadata, DocumentAnalysisService.analyze_document_authenticity(
+                metadata
+            )
+
+        _, same_minute_result = analyze(same_minute)
+        assert "Document created and modified within 1 minute" in (
+            same_minute_result["suspicious_patterns"]
+        )
+
+        malformed_metadata, _ = analyze(malformed)
+        assert malformed_metadata["creation_date"] is None
+        assert malformed.labels["document_flags"] == ["malformed_date"]
+
+        _, template_result = analyze(template)
+        assert any(
+            "Suspicious creator" in pattern
+            for pattern in template_result["suspicious_patterns"]
+        )
+        assert "suspicious_creator" in template.labels["document_flags"]
+
+
+class TestCorpusCommand:
+    def test_corpus_manifest_feeds_score(self, tmp_path, capsys):
+        corpus_dir = tmp_path / "corpus"
+
+        assert (
+            main(
+                [
+                    "corpus",
+                    str(corpus_dir),
+                    "-n",
+                    "4",
+                    "--seed",
+                    "2",
+                    "--formats",
+                    "txt,docx",
+                    "--sizes",
+                    "short",
+                ]
+            )
+            == 0
+        )
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["documents"] == 4
+
+        manifest = corpus_dir / "manifest.jsonl"
+        labels = load_labels(str(manifest))
+        assert len(labels) == 4
+        assert all("fraudulent" in label for label in labels.values())
+
+        output = tmp_path / "scores.jsonl"
+        assert main(["score", str(manifest), "-o", str(output), "--workers", "1"]) == 0
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert sorted(record["id"] for record in records) == sorted(labels)
+        assert all("result" in record for record in records)
@@ -0,0 +1,44 @@
+import hashlib
+import pytest
+from app.core.cache import text_fingerprint
+from app.core.document_context import DocumentContext
+
+
+class TestDocumentContext:
+    def test_views_are_derived_from_sanitized_text(self):
+        context = DocumentContext("  Jane\x00 Doe. Senior Engineer!\n\nPython  ")
+
+        assert context.text == "Jane Doe. Senior Engineer!\n\nPython"
+        assert context.lower == context.text.lower()
+        assert context.fingerprint == text_fingerprint(context.raw_text)
+
+    def test_views_are_computed_once(self):
+        context = DocumentContext("Results-driven team player " * 10)
+
+        assert context.lower is context.lower
+        assert context.fingerprint is context.fingerprint
+
+    def test_text_is_truncated_to_max_length(self):
+        context = DocumentContext("a" * 6000)
+        assert len(context.text) == DocumentContext.MAX_TEXT_LENGTH
+
+    def test_context_is_immutable(self):
+        context = DocumentContext("text", {"format": "txt"})
+
+        with pytest.raises(AttributeError):
+            context.raw_text = "other"
+        with pytest.raises(AttributeError):
+            context.extra = "value"
+
+    def test_from_document_data_hashes_file_content(self):
+        document_data = {"text": "Resume", "metadata": {"format": "txt"}}
+        context = DocumentContext.from_document_data(document_data, b"Resume")
+
+        assert context.metadata == {"format": "txt"}
+        assert context.content_hash == hashlib.md5(b"Resume").hexdigest()
+
+    def test_coerce(self):
+        context = DocumentContext("text")
+
+        assert DocumentContext.coerce(context) is context
+        assert DocumentContext.coerce("text").raw_text == "text"
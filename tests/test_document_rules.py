@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.core.document_rules import compile_document_rules, parse_timestamp
+from app.services.document_analysis import DocumentAnalysisService
+
+
+def plan(*rules):
+    return compile_document_rules({"rules": list(rules)})
+
+
+class TestParseTimestamp:
+    def test_pdf_and_iso_dates_are_normalized_to_utc(self):
+        assert parse_timestamp("D:20240101120000") == (datetime(2024, 1, 1, 12), None)
+        assert parse_timestamp("D:20240101120000Z") == (datetime(2024, 1, 1, 12), 0)
+        assert parse_timestamp("D:20240101120000+05'30'") == (
+            datetime(2024, 1, 1, 6, 30),
+            330,
+        )
+        assert parse_timestamp("D:20240101120000-08'00") == (
+            datetime(2024, 1, 1, 20),
+            -480,
+        )
+        assert parse_timestamp("2024-01-01T12:00:00Z") == (datetime(2024, 1, 1, 12), 0)
+        assert parse_timestamp(
+            datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=-5)))
+        ) == (datetime(2024, 1, 1, 17), -300)
+
+    def test_malformed_dates_are_ignored(self):
+        for value in ["D:2024-13-45T99", "D:2024", "yesterday", "", None, 42]:
+            assert parse_timestamp(value) is None
+
+
+class TestDocumentRulePlan:
+    def test_overlapping_needles_fire_every_rule(self):
+        rules = plan(
+            {
+                "id": "chrome",
+                "check": "contains_any",
+                "field": "creator",
+                "values": ["chrome"],
+                "score": 0.1,
+            },
+            {
+                "id": "headless",
+                "check": "contains_any",
+                "field": "creator",
+                "values": ["headlesschrome", "puppeteer"],
+                "score": 0.2,
+            },
+            {
+                "id": "word",
+                "check": "contains_any",
+                "field": "creator",
+                "values": ["word"],
+                "score": 0.4,
+            },
+        )
+
+        evaluation = rules.evaluate({"creator": "Mozilla/5.0 HeadlessChrome/120"})
+        assert evaluation.contributions == {"chrome": 0.1, "headless": 0.2}
+        assert evaluation.score == pytest.approx(0.3)
+        assert rules.evaluate({"creator": "Microsoft Word"}).contributions == {
+            "word": 0.4
+        }
+
+    def test_checks_skip_when_inputs_are_missing(self):
+        rules = plan(
+            {
+                "id": "timezone",
+                "check": "timezone_mismatch",
+                "fields": ["creation_date", "modification_date"],
+                "score": 0.1,
+            },
+            {
+                "id": "backdated",
+                "check": "timestamp_gap",
+                "from": "creation_date",
+                "to": "modification_date",
+                "absolute": False,
+                "below": -60,
+                "score": 0.2,
+                "indicator": "dates_in_order",
+            },
+            {
+                "id": "sparse",
+                "check": "ratio",
+                "numerator": "character_count",
+                "denominator": "page_count",
+                "below": 200,
+                "formats": ["pdf"],
+                "score": 0.1,
+            },
+        )
+
+        evaluation = rules.evaluate(
+            {
+                "format": "pdf",
+                "creation_date": "D:20240102120000+02'00'",
+                "modification_date": "D:20240101120000Z",
+                "character_count": 150,
+                "page_count": 3,
+            }
+        )
+        assert evaluation.contributions == {
+            "timezone": 0.1,
+            "backdated": 0.2,
+            "sparse": 0.1,
+        }
+        assert evaluation.indicators == {"dates_in_order": False}
+
+        empty = rules.evaluate({"format": "docx", "character_count": 10})
+        assert empty.contributions == {}
+        assert empty.indicators == {}
+
+    def test_invalid_rules_are_rejected(self):
+        for rule in [
+            {"id": "a", "check": "contains_any", "field": "title", "score": 0.1},
+            {"id": "a", "check": "ratio", "numerator": "x", "denominator": "y"},
+            {"id": "a", "check": "matches", "field": "x", "pattern": "(", "score": 1},
+            {"id": "a", "check": "timestamp_gap", "from": "x", "to": "y", "score": 1},
+        ]:
+            with pytest.raises(ValueError):
+                plan(rule)
+
+    def test_hundreds_of_rules_in_one_plan(self):
+        rules = plan(
+            *(
+                {
+                    "id": f"producer.{index}",
+                    "check": "contains_any",
+                    "field": "producer",
+                    "values": [f"tool-{index}/"],
+                    "score": 0.001,
+                }
+                for index in range(300)
+            )
+        )
+
+        evaluation = rules.evaluate({"producer": "Tool-7/1.2 via tool-42/3"})
+        assert list(evaluation.contributions) == ["producer.7", "producer.42"]
+
+
+class TestDefaultDocumentRules:
+    def test_contributions_explain_the_risk_score(self):
+        result = DocumentAnalysisService.analyze_document_authenticity(
+            {
+                "format": "pdf",
+                "page_count": 1,
+                "character_count": 2400,
+                "creation_date": "D:20240101120000",
+                "modification_date": "D:20240101120030",
+                "creator": "Online Resume Template Generator",
+                "author": "",
+                "title": "Resume",
+            }
+        )
+
+        assert result["rule_contributions"] == {
+            "timestamps.rapid_edit": 0.3,
+            "creator.suspicious": 0.4,
+            "author.missing": 0.2,
+            "title.generic": 0.15,
+        }
+        assert result["suspicious_patterns"] == [
+            "Document created and modified within 1 minute",
+            "Suspicious creator software: Online Resume Template Generator",
+            "Missing or empty author information",
+            "Generic document title",
+        ]
+        assert result["risk_score"] == 1.0
+        assert result["authenticity_indicators"] == {
+            "timestamp_consistency": False,
+            "creator_software": "Online Resume Template Generator",
+            "has_author": False,
+        }
+
+    def test_xmp_mismatch_and_text_files(self):
+        pdf = DocumentAnalysisService.analyze_document_authenticity(
+            {
+                "format": "pdf",
+                "author": "Jane Doe",
+                "creator": "Microsoft Word",
+                "creation_date": "D:20240101120000Z",
+                "xmp_creator_tool": "Canva",
+                "xmp_create_date": "2024-03-01T09:00:00Z",
+            }
+        )
+        assert set(pdf["rule_contributions"]) == {
+            "xmp.creator_mismatch",
+            "xmp.creation_mismatch",
+        }
+
+        text = DocumentAnalysisService.analyze_document_authenticity(
+            {"format": "txt", "author": None, "title": "resume.txt"}
+        )
+        assert text["rule_contributions"] == {}
+        assert text["risk_score"] == 0.0
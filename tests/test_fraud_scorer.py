@@ -1,5 +1,11 @@
+import math
+import random
 import pytest
-from app.services.fraud_scorer import FraudScoringService
+from app.services.fraud_scorer import (
+    RISK_LEVEL_ORDER,
+    SCORE_STAGES,
+    FraudScoringService,
+)
 from app.models.schemas import RiskLevel
 
 
@@ -64,3 +70,59 @@ class TestFraudScoringService:
         assert "High probability of AI-generated content detected" in issues
         assert "AI-generated content detected in summary section" in issues
         assert "AI-generated content detected in experience section" in issues
+
+
+class TestBatchScoring:
+    def test_batch_matches_scalar_scoring(self):
+        rng = random.Random(5)
+        rows = []
+        for _ in range(500):
+            rows.append(
+                {
+                    "contact": (rng.random(), rng.random()),
+                    "ai": (rng.random(), rng.random()) if rng.random() > 0.1 else None,
+                    "document": (rng.random(), rng.random()),
+                }
+            )
+
+        batch = FraudScoringService.score_batch(
+            {
+                stage: [row[stage][0] if row[stage] else math.nan for row in rows]
+                for stage in SCORE_STAGES
+            },
+            {
+                stage: [row[stage][1] if row[stage] else math.nan for row in rows]
+                for stage in SCORE_STAGES
+            },
+        )
+
+        for index, row in enumerate(rows):
+            contact, ai, document = row["contact"], row["ai"], row["document"]
+            expected = FraudScoringService.calculate_overall_risk(
+                {"risk_score": contact[0], "confidence": contact[1]},
+                {"overall_ai_probability": ai[0], "confidence": ai[1]} if ai else None,
+                {"risk_score": document[0], "confidence": document[1]},
+            )
+            assert batch["overall_risk_score"][index] == expected["overall_risk_score"]
+            assert batch["confidence"][index] == expected["confidence"]
+            assert (
+                RISK_LEVEL_ORDER[batch["risk_level"][index]] == expected["risk_level"]
+            )
+
+    def test_custom_weights_and_threshold_boundaries(self):
+        batch = FraudScoringService.score_batch(
+            {"contact": [0.5, 0.6, 0.2], "ai": [0.0] * 3, "document": [0.0] * 3},
+            {"contact": [1.0] * 3, "ai": [1.0] * 3, "document": [1.0] * 3},
+            weights={"contact": 1.0, "ai": 0.0, "document": 0.0},
+            thresholds=(0.5, 0.6),
+        )
+
+        assert list(batch["risk_level"]) == [1, 2, 0]
+
+    def test_risk_level_shift(self):
+        shift = FraudScoringService.risk_level_shift([0, 0, 1, 2, -1], [1, 0, 2, 2, 0])
+
+        assert shift["before"] == {"low": 2, "medium": 1, "high": 1}
+        assert shift["after"] == {"low": 1, "medium": 1, "high": 2}
+        assert shift["changed"] == 2
+        assert shift["transitions"] == {"low->medium": 1, "medium->high": 1}
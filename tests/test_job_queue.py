@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from app.core.job_store import JobStore
+from app.models.schemas import JobStatus
+from app.services.job_queue import JobQueue, QueueFullError
+
+
+class TestJobQueue:
+    @pytest.mark.asyncio
+    async def test_job_runs_to_completion(self):
+        queue = JobQueue(max_size=5, workers=1, result_ttl=60)
+        job = await queue.submit(b"Jane Doe\njane@example.com", "resume.txt")
+
+        for _ in range(100):
+            if queue.get(job.job_id).status == JobStatus.COMPLETED:
+                break
+            await asyncio.sleep(0.05)
+
+        response = queue.to_response(queue.get(job.job_id))
+        assert response.status == JobStatus.COMPLETED
+        assert response.result is not None
+        assert response.queue_position is None
+        assert job.file_content is None
+
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_retry_after(self):
+        queue = JobQueue(max_size=1, workers=0, result_ttl=60)
+        await queue.submit(b"first", "first.txt")
+
+        with pytest.raises(QueueFullError) as exc_info:
+            await queue.submit(b"second", "second.txt")
+
+        assert exc_info.value.retry_after == JobQueue.DEFAULT_RETRY_AFTER
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_job_status_is_shared_between_workers(self, tmp_path):
+        path = str(tmp_path / "jobs.db")
+        accepting = JobQueue(max_size=5, workers=1, result_ttl=60, store=JobStore(path))
+        polling = JobQueue(max_size=5, workers=1, result_ttl=60, store=JobStore(path))
+        job = await accepting.submit(b"Jane Doe\njane@example.com", "resume.txt")
+
+        for _ in range(100):
+            response = await polling.lookup(job.job_id)
+            if response.status == JobStatus.COMPLETED:
+                break
+            await asyncio.sleep(0.05)
+
+        assert response.status == JobStatus.COMPLETED
+        assert response.result is not None
+        assert await polling.lookup("missing") is None
+        await accepting.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_unfinished_jobs(self, tmp_path):
+        store = JobStore(str(tmp_path / "jobs.db"))
+        queue = JobQueue(max_size=5, workers=0, result_ttl=60, store=store)
+        job = await queue.submit(b"queued", "queued.txt")
+
+        await queue.stop()
+
+        response = store.load(job.job_id)
+        assert response.status == JobStatus.FAILED
+        assert response.error == JobQueue.SHUTDOWN_ERROR
+
+    def test_retry_after_uses_drain_rate(self):
+        queue = JobQueue(max_size=10, workers=1, result_ttl=60)
+        queue._completions.extend([0.0, 1.0, 2.0, 3.0, 4.0])
+
+        assert queue.drain_rate() == 1.0
+        assert queue.retry_after() == 1
+
+    def test_callback_url_must_be_local(self):
+        assert JobQueue.validate_callback_url(None) is None
+        assert (
+            JobQueue.validate_callback_url("http://localhost:9000/hook")
+            == "http://localhost:9000/hook"
+        )
+
+        with pytest.raises(ValueError):
+            JobQueue.validate_callback_url("https://example.com/hook")
+        with pytest.raises(ValueError):
+            JobQueue.validate_callback_url("file:///etc/passwd")
@@ -0,0 +1,68 @@
+import os
+from app import launcher
+from app.core import cpu
+
+
+class TestLauncher:
+    def test_cgroup_v2_quota(self, tmp_path, monkeypatch):
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        monkeypatch.setattr(cpu, "CGROUP_V2_CPU_MAX", str(cpu_max))
+
+        assert cpu.cgroup_cpu_limit() == 1.5
+
+        cpu_max.write_text("max 100000\n")
+        assert cpu.cgroup_cpu_limit() is None
+
+    def test_cgroup_v1_quota(self, tmp_path, monkeypatch):
+        quota = tmp_path / "cpu.cfs_quota_us"
+        period = tmp_path / "cpu.cfs_period_us"
+        quota.write_text("200000")
+        period.write_text("100000")
+        monkeypatch.setattr(cpu, "CGROUP_V2_CPU_MAX", str(tmp_path / "missing"))
+        monkeypatch.setattr(cpu, "CGROUP_V1_QUOTA", str(quota))
+        monkeypatch.setattr(cpu, "CGROUP_V1_PERIOD", str(period))
+
+        assert cpu.cgroup_cpu_limit() == 2.0
+
+        quota.write_text("-1")
+        assert cpu.cgroup_cpu_limit() is None
+
+    def test_available_cpus_respects_quota(self, monkeypatch):
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(16)))
+        monkeypatch.setattr(cpu, "cgroup_cpu_limit", lambda: 2.5)
+        assert cpu.available_cpus() == 3
+
+        monkeypatch.setattr(cpu, "cgroup_cpu_limit", lambda: None)
+        assert cpu.available_cpus() == 16
+
+    def test_worker_count(self):
+        assert launcher.worker_count(4, requested=0) == 4
+        assert launcher.worker_count(4, requested=2) == 2
+
+    def test_configure_environment_shares_rate_limits(self, tmp_path, monkeypatch):
+        for name in ["PARSE_WORKERS", "RATE_LIMIT_STORAGE_URI", "JOB_STORE_PATH"]:
+            monkeypatch.setenv(name, "")
+            monkeypatch.delenv(name)
+        metrics_dir = tmp_path / "metrics"
+        metrics_dir.mkdir()
+        (metrics_dir / "counter_123.db").write_bytes(b"stale")
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(metrics_dir))
+
+        launcher.configure_environment(workers=4, cpus=8)
+
+        assert os.environ["PARSE_WORKERS"] == "2"
+        assert os.environ["RATE_LIMIT_STORAGE_URI"].startswith("sqlite:///")
+        assert os.environ["JOB_STORE_PATH"].endswith("resume-fraud-jobs.db")
+        assert metrics_dir.is_dir()
+        assert list(metrics_dir.iterdir()) == []
+
+    def test_configure_environment_keeps_explicit_settings(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        monkeypatch.setenv("PARSE_WORKERS", "6")
+        monkeypatch.setenv("RATE_LIMIT_STORAGE_URI", "redis://cache:6379")
+
+        launcher.configure_environment(workers=4, cpus=8)
+
+        assert os.environ["PARSE_WORKERS"] == "6"
+        assert os.environ["RATE_LIMIT_STORAGE_URI"] == "redis://cache:6379"
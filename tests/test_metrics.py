@@ -0,0 +1,218 @@
+import os
+import subprocess
+import sys
+import textwrap
+from io import BytesIO
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY, CollectorRegistry, Histogram
+from app.core.api_error_handler import APIErrorHandler
+from app.core.cache import SimpleCache
+from app.core.metrics import STAGE_BUCKETS, add_observations
+from app.core.rate_limiter import limiter
+from app.core.timing import Histogram as SpanHistogram, Span
+from app.main import app
+
+
+client = TestClient(app)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+
+    def json(self):
+        return self._payload
+
+
+class TestMetrics:
+    def setup_method(self):
+        limiter.reset()
+
+    def test_metrics_endpoint_serves_prometheus_text(self):
+        client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert (
+            'http_requests_total{endpoint="/health",method="GET",status="200"}' in body
+        )
+        assert 'queue_depth{queue="jobs"}' in body
+        assert 'in_flight{queue="parse_pool"}' in body
+        assert 'admission_concurrency_limit{lane="cpu"}' in body
+
+    def test_requests_are_labelled_by_route_template(self):
+        before = sample(
+            "http_requests_total",
+            method="GET",
+            endpoint="/api/v1/jobs/{job_id}",
+            status="404",
+        )
+
+        client.get("/api/v1/jobs/does-not-exist")
+        client.get("/no/such/path")
+
+        assert (
+            sample(
+                "http_requests_total",
+                method="GET",
+                endpoint="/api/v1/jobs/{job_id}",
+                status="404",
+            )
+            == before + 1
+        )
+        assert sample(
+            "http_requests_total", method="GET", endpoint="unmatched", status="404"
+        )
+
+    def test_cache_operations_counted_per_namespace(self):
+        cache = SimpleCache()
+        client.get("/metrics")
+        before_hits = sample("cache_operations_total", namespace="text", result="hit")
+        before_evictions = sample(
+            "cache_operations_total", namespace="doc", result="eviction"
+        )
+
+        cache.cache_text_result("abc", {"x": 1})
+        cache.get_text_result("abc")
+        cache.set("doc:expired", 1, ttl=-1)
+        cache.get("doc:expired")
+        assert (
+            sample("cache_operations_total", namespace="text", result="hit")
+            == before_hits
+        )
+
+        client.get("/metrics")
+        assert (
+            sample("cache_operations_total", namespace="text", result="hit")
+            == before_hits + 1
+        )
+        assert (
+            sample("cache_operations_total", namespace="doc", result="eviction")
+            == before_evictions + 1
+        )
+
+    def test_upstream_calls_counted_by_error_type(self):
+        labels = {"service": "abstract_email"}
+        before_ok = sample("upstream_calls_total", outcome="success", **labels)
+        before_limited = sample(
+            "upstream_calls_total", outcome="rate_limited", **labels
+        )
+
+        APIErrorHandler.handle_api_response("Abstract Email", FakeResponse(200))
+        APIErrorHandler.handle_api_response("Abstract Email", FakeResponse(429))
+
+        assert sample("upstream_calls_total", outcome="success", **labels) == (
+            before_ok + 1
+        )
+        assert sample("upstream_calls_total", outcome="rate_limited", **labels) == (
+            before_limited + 1
+        )
+
+    def test_detection_records_method_and_fallbacks(self):
+        before_method = sample(
+            "ai_detection_method_total", detection_method="pattern_fallback"
+        )
+        before_fallback = sample(
+            "verifications_total", service="winston_ai", source="fallback"
+        )
+
+        response = client.post(
+            "/api/v1/analyze/content",
+            files={
+                "file": ("m.txt", BytesIO(b"Results-driven team player."), "text/plain")
+            },
+        )
+
+        assert response.status_code == 200
+        assert (
+            sample("ai_detection_method_total", detection_method="pattern_fallback")
+            == before_method + 1
+        )
+        assert (
+            sample("verifications_total", service="winston_ai", source="fallback")
+            == before_fallback + 1
+        )
+
+    def test_stage_latency_is_exported_at_scrape_time(self):
+        labels = {"stage": "unit.export"}
+        before = sample("detection_stage_duration_seconds_count", **labels)
+
+        for _ in range(3):
+            with Span("unit.export"):
+                pass
+        assert sample("detection_stage_duration_seconds_count", **labels) == before
+
+        client.get("/metrics")
+        client.get("/metrics")
+
+        assert sample("detection_stage_duration_seconds_count", **labels) == before + 3
+        assert (
+            sample("detection_stage_duration_seconds_bucket", le="0.001", **labels)
+            == before + 3
+        )
+
+    def test_bulk_observations_match_prometheus_observe(self):
+        registry = CollectorRegistry()
+        histogram = Histogram(
+            "bulk", "Bulk", ["path"], buckets=STAGE_BUCKETS, registry=registry
+        )
+        spans = SpanHistogram("bulk")
+        for value_ms in [0.4, 1, 3, 200, 200, 42000]:
+            histogram.labels("observe").observe(value_ms / 1000)
+            spans.observe(value_ms)
+
+        add_observations(histogram.labels("bulk"), spans.counts, spans.sum / 1000)
+
+        samples = {
+            (sample.name, sample.labels.get("le"), sample.labels["path"]): sample.value
+            for metric in registry.collect()
+            for sample in metric.samples
+            if not sample.name.endswith("_created")
+        }
+        observed = {
+            key[:2]: value for key, value in samples.items() if key[2] == "observe"
+        }
+        bulk = {key[:2]: value for key, value in samples.items() if key[2] == "bulk"}
+        assert len(observed) == len(STAGE_BUCKETS) + 3
+        assert bulk == observed
+
+    def test_multiprocess_mode_aggregates_across_workers(self, tmp_path):
+        script = textwrap.dedent(
+            """
+            import os
+            from app.core.metrics import record_upstream, render
+
+            for _ in range(3):
+                pid = os.fork()
+                if pid == 0:
+                    record_upstream("Winston AI", "success")
+                    os._exit(0)
+                os.waitpid(pid, 0)
+
+            print(render().decode())
+            """
+        )
+        env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env=env,
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert (
+            'upstream_calls_total{outcome="success",service="winston_ai"} 3.0'
+            in result.stdout
+        )
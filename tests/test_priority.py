@@ -0,0 +1,80 @@
+import asyncio
+import pytest
+from starlette.datastructures import Headers
+from app.core import priority as priority_module
+from app.core.priority import Priority, PriorityGate, resolve_priority
+from app.core.rate_limiter import api_key_id
+
+
+async def grant_order(gate, priorities):
+    order = []
+
+    async def worker(index, priority):
+        async with gate.slot(priority):
+            order.append(index)
+            await asyncio.sleep(0)
+
+    await gate.acquire()
+    tasks = [
+        asyncio.ensure_future(worker(index, priority))
+        for index, priority in enumerate(priorities)
+    ]
+    await asyncio.sleep(0)
+    gate.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestPriorityGate:
+    @pytest.mark.asyncio
+    async def test_interactive_dequeued_before_bulk(self):
+        gate = PriorityGate(1, bulk_share=0)
+        order = await grant_order(
+            gate, [Priority.BULK, Priority.BULK, Priority.INTERACTIVE]
+        )
+
+        assert order == [2, 0, 1]
+        assert gate.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_gets_minimum_share(self):
+        gate = PriorityGate(1, bulk_share=0.25)
+        order = await grant_order(
+            gate, [Priority.BULK] + [Priority.INTERACTIVE] * 6 + [Priority.BULK]
+        )
+
+        assert order == [1, 2, 3, 0, 4, 5, 6, 7]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_leaves_queue(self):
+        gate = PriorityGate(1)
+        await gate.acquire()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await gate.acquire(Priority.BULK, timeout=0.01)
+
+        assert gate.waiting == 0
+        gate.release()
+        assert gate.in_use == 0
+
+
+class TestResolvePriority:
+    def test_defaults_to_interactive(self):
+        resolved = resolve_priority(Headers({}), "/api/v1/detect/resume")
+        assert resolved == Priority.INTERACTIVE
+
+    def test_header_and_endpoint_select_bulk(self):
+        bulk_header = Headers({"X-Priority": "bulk"})
+        interactive_header = Headers({"X-Priority": "interactive"})
+
+        assert resolve_priority(bulk_header, "/api/v1/detect/resume") == Priority.BULK
+        assert resolve_priority(Headers({}), "/api/v1/detect/batch") == Priority.BULK
+        assert resolve_priority(interactive_header, "/api/v1/jobs") == Priority.BULK
+
+    def test_bulk_api_key_class(self, monkeypatch):
+        monkeypatch.setattr(
+            priority_module, "BULK_API_KEYS", {api_key_id("ats-sync-key")}
+        )
+
+        headers = Headers({"X-API-Key": "ats-sync-key"})
+        assert resolve_priority(headers, "/api/v1/detect/resume") == Priority.BULK
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from io import BytesIO
+import pytest
+from fastapi.testclient import TestClient
+from app.core.profiler import SamplingProfiler, profiler, to_collapsed, to_speedscope
+from app.core.rate_limiter import limiter
+from app.main import app
+
+
+client = TestClient(app)
+
+
+def busy_profiled_work(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def busy_unrelated_work(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def upload(content=b"Ada Byron\nEmail: ada@example.com\nPhone: (555) 303-4040"):
+    return {"file": ("ada.txt", BytesIO(content), "text/plain")}
+
+
+@pytest.fixture
+def admin_profiler(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiler, "admin_key", "secret")
+    monkeypatch.setattr(profiler, "directory", str(tmp_path))
+    return profiler
+
+
+class TestSamplingProfiler:
+    async def test_samples_only_the_profiled_task_tree(self, tmp_path):
+        sampler = SamplingProfiler("", 0, 1.0, str(tmp_path))
+        loop = asyncio.get_running_loop()
+
+        async def profiled():
+            async with sampler.profile(b"doc", "doc.txt", "requested") as profile:
+                await asyncio.sleep(0)
+                await asyncio.gather(
+                    asyncio.create_task(asyncio.to_thread(lambda: None)),
+                    asyncio.create_task(run_busy(busy_profiled_work)),
+                )
+            return profile
+
+        async def run_busy(func):
+            func(0.1)
+
+        async def unrelated():
+            await asyncio.sleep(0)
+            for _ in range(4):
+                busy_unrelated_work(0.02)
+                await asyncio.sleep(0)
+
+        profile, _ = await asyncio.gather(profiled(), unrelated())
+
+        stacks = to_collapsed(profile.to_dict())
+        assert profile.samples > 0
+        assert "busy_profiled_work" in stacks
+        assert "busy_unrelated_work" not in stacks
+        assert (tmp_path / f"{profile.id}.json").exists()
+        assert loop.get_task_factory() is None
+
+    def test_speedscope_export_shares_frames(self):
+        profile = {
+            "id": "abc",
+            "filename": "a.pdf",
+            "content_hash": "hash",
+            "interval_ms": 5.0,
+            "stacks": {
+                "run (app/x.py:1);parse (app/y.py:10)": 3,
+                "run (app/x.py:1);score (app/z.py:20)": 1,
+            },
+        }
+
+        speedscope = to_speedscope(profile)
+
+        frames = speedscope["shared"]["frames"]
+        assert [frame["name"] for frame in frames] == ["run", "parse", "score"]
+        assert frames[1] == {"name": "parse", "file": "app/y.py", "line": 10}
+        assert speedscope["profiles"][0]["samples"] == [[0, 1], [0, 2]]
+        assert speedscope["profiles"][0]["weights"] == [15.0, 5.0]
+
+
+class TestProfileEndpoints:
+    def setup_method(self):
+        limiter.reset()
+
+    def test_admin_endpoints_hidden_without_admin_key(self):
+        assert client.get("/admin/profiles").status_code == 404
+
+        response = client.post(
+            "/api/v1/detect/resume", files=upload(), headers={"X-Profile": "1"}
+        )
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+
+    def test_profile_requires_valid_admin_key(self, admin_profiler):
+        assert (
+            client.get("/admin/profiles", headers={"X-Admin-Key": "wrong"}).status_code
+            == 403
+        )
+
+        response = client.post(
+            "/api/v1/detect/resume",
+            files=upload(),
+            headers={"X-Profile": "1", "X-Admin-Key": "wrong"},
+        )
+        assert "x-profile-id" not in response.headers
+
+    def test_requested_profile_is_listed_and_exportable(self, admin_profiler):
+        admin = {"X-Admin-Key": "secret"}
+        response = client.post(
+            "/api/v1/detect/resume?profile=1",
+            files=upload(b"Grace Hopper\nEmail: grace@example.com"),
+            headers=admin,
+        )
+        assert response.status_code == 200
+        profile_id = response.headers["x-profile-id"]
+
+        listed = client.get("/admin/profiles", headers=admin).json()
+        assert listed[0]["id"] == profile_id
+        assert listed[0]["reason"] == "requested"
+        assert listed[0]["filename"] == "ada.txt"
+        assert "scoring" in listed[0]["timings"]
+
+        detail = client.get(f"/admin/profiles/{profile_id}", headers=admin)
+        assert detail.json()["content_hash"] == listed[0]["content_hash"]
+
+        collapsed = client.get(
+            f"/admin/profiles/{profile_id}?format=collapsed", headers=admin
+        )
+        assert collapsed.headers["content-type"].startswith("text/plain")
+
+        speedscope = client.get(
+            f"/admin/profiles/{profile_id}?format=speedscope", headers=admin
+        )
+        assert speedscope.json()["profiles"][0]["type"] == "sampled"
+
+        assert client.get("/admin/profiles/missing", headers=admin).status_code == 404
+
+    def test_sampling_is_off_without_admin_key(self, monkeypatch):
+        monkeypatch.setattr(profiler, "admin_key", "")
+        monkeypatch.setattr(profiler, "sample_rate", 1)
+
+        response = client.post("/api/v1/detect/resume", files=upload())
+
+        assert "x-profile-id" not in response.headers
+
+    def test_one_in_n_sampling(self, admin_profiler, monkeypatch):
+        monkeypatch.setattr(profiler, "sample_rate", 2)
+        monkeypatch.setattr(profiler, "_requests", 0)
+
+        responses = [
+            client.post("/api/v1/detect/resume", files=upload()) for _ in range(2)
+        ]
+
+        assert "x-profile-id" not in responses[0].headers
+        assert "x-profile-id" in responses[1].headers
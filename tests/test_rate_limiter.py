@@ -0,0 +1,84 @@
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+from starlette.requests import Request
+from app.core import rate_limiter
+from app.core.rate_limiter import (
+    api_key_id,
+    get_client_id,
+    parse_api_key_policies,
+    rate_limit_for,
+)
+
+
+def make_request(headers=None):
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/detect/resume",
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+        "client": ("127.0.0.1", 5000),
+    }
+    return Request(scope)
+
+
+class TestRateLimiter:
+    def test_sqlite_storage_is_shared_between_workers(self, tmp_path):
+        uri = f"sqlite:///{tmp_path / 'limits.db'}"
+        limit = parse("3/minute")
+        worker_a = MovingWindowRateLimiter(storage_from_string(uri))
+        worker_b = MovingWindowRateLimiter(storage_from_string(uri))
+
+        assert worker_a.hit(limit, "client")
+        assert worker_b.hit(limit, "client")
+        assert worker_a.hit(limit, "client")
+        assert not worker_b.hit(limit, "client")
+        assert worker_a.hit(limit, "other-client")
+        assert worker_b.get_window_stats(limit, "client").remaining == 0
+
+    def test_sqlite_storage_fixed_window_and_reset(self, tmp_path):
+        storage = storage_from_string(f"sqlite:///{tmp_path / 'limits.db'}")
+        strategy = FixedWindowRateLimiter(storage)
+        limit = parse("2/minute")
+
+        assert strategy.hit(limit, "client")
+        assert strategy.hit(limit, "client")
+        assert not strategy.hit(limit, "client")
+
+        storage.reset()
+        assert strategy.hit(limit, "client")
+
+    def test_redis_storage_against_local_stand_in(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+
+        limiter = rate_limiter.build_limiter(
+            "redis://localhost:6379",
+            {"connection_pool": fakeredis.FakeRedis().connection_pool},
+        )
+        strategy = MovingWindowRateLimiter(limiter._storage)
+        limit = parse("2/minute")
+
+        assert strategy.hit(limit, "client")
+        assert strategy.hit(limit, "client")
+        assert not strategy.hit(limit, "client")
+
+    def test_client_id_uses_forwarded_ip(self):
+        request = make_request({"X-Forwarded-For": "203.0.113.9, 10.0.0.1"})
+        assert get_client_id(request) == "203.0.113.9"
+
+    def test_api_key_policies(self, monkeypatch):
+        policies = parse_api_key_policies("partner-key=100/minute, bad-entry,")
+        monkeypatch.setattr(rate_limiter, "API_KEY_POLICIES", policies)
+
+        known = make_request({"X-API-Key": "partner-key"})
+        unknown = make_request({"X-API-Key": "unknown-key"})
+
+        assert get_client_id(known) == api_key_id("partner-key")
+        assert get_client_id(unknown) == "127.0.0.1"
+        assert rate_limit_for("detect")(api_key_id("partner-key")) == "100/minute"
+        assert rate_limit_for("detect")("127.0.0.1") == "5/minute"
@@ -0,0 +1,243 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+import pytest
+from fastapi.testclient import TestClient
+from app.core.cache import cache
+from app.core.parse_pool import parse_pool
+from app.core.profiler import profiler
+from app.core.rate_limiter import limiter
+from app.core.result_store import ResultStore, result_store
+from app.core.timing import record as record_span, request_timings
+from app.main import app
+from app.services.batch_processor import BatchItem, BatchProcessor
+from app.services.fraud_scorer import FraudScoringService
+
+
+client = TestClient(app)
+
+
+def scored(contact_risk, ai_probability, document_risk):
+    return FraudScoringService.calculate_overall_risk(
+        {"risk_score": contact_risk, "confidence": 0.8, "verification_methods": []},
+        {
+            "overall_ai_probability": ai_probability,
+            "confidence": 0.7,
+            "detection_method": "pattern_fallback",
+        },
+        {
+            "authenticity_indicators": {},
+            "suspicious_patterns": [],
+            "risk_score": document_risk,
+            "confidence": 0.6,
+        },
+    )
+
+
+def record(store, email, phone, risk, content_hash="abc"):
+    store.record(
+        scored(risk, risk, risk),
+        {"content_hash": content_hash, "text_fingerprint": f"fp-{content_hash}"},
+        {"email": email, "original_phone": phone},
+        "resume.pdf",
+        "203.0.113.7",
+        {"extraction": 4.2, "total": 9.5},
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultStore(str(tmp_path / "results.db"), 50, 0.05, 100)
+    yield store
+    store.close()
+
+
+class TestResultStore:
+    async def test_filters_use_normalized_contacts(self, store):
+        record(store, "Jane.Doe@Example.com", "+1 (415) 555-2671", 0.9, "high")
+        record(store, "sam@tempmail.com", "415.555.0000", 0.1, "low")
+        record(store, None, None, 0.5, "medium")
+        assert await store.flush() == 3
+
+        assert [
+            r["content_hash"] for r in store.query(email="jane.doe@example.com")
+        ] == ["high"]
+        assert [r["content_hash"] for r in store.query(phone="415-555-2671")] == [
+            "high"
+        ]
+        assert [r["content_hash"] for r in store.query(domain="TEMPMAIL.com")] == [
+            "low"
+        ]
+        assert [r["content_hash"] for r in store.query(risk_level="high")] == ["high"]
+
+        newest_first = store.query()
+        assert [r["content_hash"] for r in newest_first] == ["medium", "low", "high"]
+        older = store.query(before_id=newest_first[0]["id"], limit=1)
+        assert [r["content_hash"] for r in older] == ["low"]
+
+        stored = store.get(newest_first[-1]["id"])
+        assert stored["email_domain"] == "example.com"
+        assert stored["timings"]["extraction"] == 4.2
+        assert stored["result"]["risk_level"] == "high"
+        assert stored["ai_probability"] == 0.9
+
+    async def test_time_range_and_stats(self, store):
+        record(store, "a@example.com", None, 0.9)
+        record(store, "b@example.com", None, 0.9)
+        record(store, "c@example.com", None, 0.1)
+        await store.flush()
+
+        now = datetime.now(timezone.utc)
+        assert len(store.query(since=now - timedelta(minutes=1))) == 3
+        assert store.query(until=now - timedelta(minutes=1)) == []
+
+        stats = store.stats(since=now - timedelta(minutes=1))
+        assert stats["total"] == 3
+        assert stats["by_risk_level"]["high"]["count"] == 2
+        assert stats["by_risk_level"]["low"]["avg_risk_score"] == pytest.approx(0.1)
+
+    async def test_records_are_buffered_and_written_in_background(self, store):
+        store.start()
+        record(store, "a@example.com", None, 0.2)
+
+        assert store.pending == 1
+        assert store.query() == []
+
+        await asyncio.sleep(0.3)
+        assert store.pending == 0
+        assert len(store.query()) == 1
+        await store.stop()
+
+    async def test_full_backlog_drops_oldest(self, tmp_path):
+        store = ResultStore(str(tmp_path / "results.db"), 10, 1.0, 2)
+        for index in range(3):
+            record(store, f"user{index}@example.com", None, 0.2)
+        await store.flush()
+
+        assert store.dropped == 1
+        assert {r["email"] for r in store.query()} == {
+            "user1@example.com",
+            "user2@example.com",
+        }
+        store.close()
+
+    async def test_batch_items_store_their_own_stage_timings(self, monkeypatch):
+        cache.clear()
+        stored = {}
+        extract = parse_pool.extract
+
+        async def probed_extract(file_content, filename):
+            record_span("probe", float(len(file_content)))
+            await asyncio.sleep(0.01)
+            return await extract(file_content, filename)
+
+        def capture(result, extraction, contacts, filename, client_ip, timings):
+            stored[filename] = timings
+
+        monkeypatch.setattr(parse_pool, "extract", probed_extract)
+        monkeypatch.setattr(result_store, "record", capture)
+        contents = {
+            f"f{index}.txt": f"Person {index}\nperson{index}@example.com\n".encode()
+            + b"x" * (index * 100)
+            for index in range(4)
+        }
+
+        def loader(content):
+            async def load():
+                return content
+
+            return load
+
+        items = iter(
+            BatchItem(index, filename, loader(content))
+            for index, (filename, content) in enumerate(contents.items())
+        )
+        request = []
+        token = request_timings.set(request)
+        try:
+            lines = [
+                line async for line in BatchProcessor.stream_results(items, None, 4)
+            ]
+        finally:
+            request_timings.reset(token)
+
+        assert len(lines) == 4
+        for filename, content in contents.items():
+            assert stored[filename]["probe"] == len(content)
+            assert "extraction" in stored[filename]
+        assert sorted(value for name, value in request if name == "probe") == sorted(
+            float(len(content)) for content in contents.values()
+        )
+
+
+class TestResultEndpoints:
+    def setup_method(self):
+        limiter.reset()
+        cache.clear()
+
+    def test_endpoints_hidden_when_store_disabled(self, monkeypatch):
+        monkeypatch.setattr(profiler, "admin_key", "secret")
+        monkeypatch.setattr(result_store, "path", "")
+
+        response = client.get("/admin/results", headers={"X-Admin-Key": "secret"})
+        assert response.status_code == 404
+
+    def test_detection_is_persisted_and_searchable(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiler, "admin_key", "secret")
+        monkeypatch.setattr(result_store, "path", str(tmp_path / "results.db"))
+        monkeypatch.setattr(result_store, "_connection", None)
+        admin = {"X-Admin-Key": "secret"}
+
+        content = b"Ada Stored\nEmail: Ada.Stored@Example.org\nPhone: (415) 555-2671"
+        response = client.post(
+            "/api/v1/detect/resume",
+            files={"file": ("ada.txt", BytesIO(content), "text/plain")},
+        )
+        assert response.status_code == 200
+        assert asyncio.run(result_store.flush()) == 1
+
+        assert client.get("/admin/results").status_code == 403
+        listed = client.get(
+            "/admin/results?email=ada.stored@example.org", headers=admin
+        ).json()
+        assert len(listed) == 1
+        assert listed[0]["filename"] == "ada.txt"
+        assert listed[0]["phone"] == "+14155552671"
+        assert listed[0]["risk_level"] == response.json()["risk_level"]
+        assert "total" in listed[0]["timings"]
+
+        by_domain = client.get("/admin/results?domain=example.org", headers=admin)
+        assert [item["id"] for item in by_domain.json()] == [listed[0]["id"]]
+
+        detail = client.get(f"/admin/results/{listed[0]['id']}", headers=admin)
+        assert detail.json()["content_hash"] == listed[0]["content_hash"]
+        assert client.get("/admin/results/999999", headers=admin).status_code == 404
+
+        stats = client.get("/admin/results/stats", headers=admin).json()
+        assert stats["total"] == 1
+        result_store.close()
+
+    def test_response_cache_hits_are_recorded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiler, "admin_key", "secret")
+        monkeypatch.setattr(result_store, "path", str(tmp_path / "results.db"))
+        monkeypatch.setattr(result_store, "_connection", None)
+        content = b"Cy Cached\nEmail: cy@example.org"
+
+        for filename in ["first.txt", "again.txt"]:
+            response = client.post(
+                "/api/v1/detect/resume",
+                files={"file": (filename, BytesIO(content), "text/plain")},
+            )
+            assert response.status_code == 200
+        assert asyncio.run(result_store.flush()) == 2
+
+        listed = client.get(
+            "/admin/results?email=cy@example.org", headers={"X-Admin-Key": "secret"}
+        ).json()
+        assert [(item["filename"], item["cached"]) for item in listed] == [
+            ("again.txt", True),
+            ("first.txt", False),
+        ]
+        assert list(listed[0]["timings"]) == ["total"]
+        assert listed[0]["content_hash"] == listed[1]["content_hash"]
+        result_store.close()
@@ -0,0 +1,173 @@
+import json
+import os
+from io import BytesIO
+import pytest
+from fastapi.testclient import TestClient
+from app.core.cache import cache
+from app.core.document_context import DocumentContext
+from app.core.profiler import profiler
+from app.core.rate_limiter import limiter
+from app.core.rules import (
+    DEFAULT_RULES_PATH,
+    Rulebook,
+    RulesError,
+    compile_rules,
+    rulebook,
+)
+from app.main import app
+from app.services.ai_detection import AIContentDetectionService
+from app.services.contact_verification import ContactVerificationService
+from app.services.document_analysis import DocumentAnalysisService
+from app.services.fraud_scorer import FraudScoringService
+
+client = TestClient(app)
+
+
+def default_rules():
+    with open(DEFAULT_RULES_PATH) as f:
+        return json.load(f)
+
+
+def document_rule(data, rule_id):
+    return next(rule for rule in data["document"]["rules"] if rule["id"] == rule_id)
+
+
+def write_rules(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+@pytest.fixture
+def rules_file(tmp_path, monkeypatch):
+    path = tmp_path / "rules.json"
+    write_rules(path, default_rules())
+    book = Rulebook(str(path), 0)
+    monkeypatch.setattr(rulebook, "path", book.path)
+    monkeypatch.setattr(rulebook, "current", book.current)
+    monkeypatch.setattr(rulebook, "_stat", book._stat)
+    yield path
+
+
+class TestCompileRules:
+    def test_default_rules_match_previous_behaviour(self):
+        rules = rulebook.current
+        service = ContactVerificationService()
+
+        assert rules.weights == {"contact": 0.45, "ai": 0.35, "document": 0.20}
+        assert rules.thresholds == (0.35, 0.60)
+        assert service._is_test_phone_number("(555) 123-4567")
+        assert service._is_test_phone_number("+1 555 000 1111")
+        assert not service._is_test_phone_number("+1 415 555 2671")
+
+    def test_invalid_rules_are_rejected(self):
+        for mutate in [
+            lambda data: data.pop("version"),
+            lambda data: data["scoring"]["weights"].update(ai="high"),
+            lambda data: data["scoring"]["thresholds"].update(medium=0.9),
+            lambda data: data["ai"]["indicator_patterns"].append("(unclosed"),
+            lambda data: document_rule(data, "title.generic").update(values="resume"),
+            lambda data: document_rule(data, "author.missing").update(check="absent"),
+            lambda data: data["document"]["rules"].append({"id": "author.missing"}),
+        ]:
+            data = default_rules()
+            mutate(data)
+            with pytest.raises(RulesError):
+                compile_rules(data, "digest")
+
+    def test_services_use_the_rules_they_are_given(self):
+        data = default_rules()
+        data["version"] = "strict"
+        document_rule(data, "creator.suspicious")["values"].append("Acme Writer")
+        data["ai"]["generic_phrase_patterns"] = []
+        data["ai"]["indicator_patterns"].append(r"\bsynergy\b")
+        data["scoring"]["thresholds"] = {"medium": 0.05, "high": 0.1}
+        rules = compile_rules(data, "digest")
+        context = DocumentContext("Team player who drives synergy.")
+
+        document = DocumentAnalysisService.analyze_document_authenticity(
+            {"format": "txt", "creator": "ACME Writer 2"}, rules
+        )
+        assert document["risk_score"] == pytest.approx(0.4)
+        assert AIContentDetectionService()._basic_ai_detection(
+            context, rules
+        ) == pytest.approx(0.3)
+        assert AIContentDetectionService()._basic_ai_detection(
+            context
+        ) == pytest.approx(0.05)
+
+        result = FraudScoringService.calculate_overall_risk(None, None, document, rules)
+        assert result["rule_version"] == "strict"
+        assert result["risk_level"] == "medium"
+
+
+class TestRulebook:
+    def test_file_change_swaps_rules(self, rules_file):
+        previous = rulebook.current
+        data = default_rules()
+        data["version"] = "tuned"
+        data["scoring"]["weights"]["ai"] = 0.5
+        write_rules(rules_file, data)
+        os.utime(rules_file, ns=(0, 1))
+
+        assert rulebook.check() is True
+        assert rulebook.current.version == "tuned"
+        assert rulebook.current.weights["ai"] == 0.5
+        assert previous.weights["ai"] == 0.35
+        assert rulebook.check() is False
+
+    def test_invalid_file_keeps_current_rules(self, rules_file):
+        previous = rulebook.current
+        rules_file.write_text("{not json")
+        os.utime(rules_file, ns=(0, 1))
+
+        assert rulebook.check() is False
+        assert rulebook.current is previous
+        assert "not valid JSON" in rulebook.last_error
+        rulebook.last_error = None
+
+
+class TestRulesEndpoints:
+    def setup_method(self):
+        limiter.reset()
+        cache.clear()
+
+    def test_reload_changes_version_and_cache_keys(self, rules_file, monkeypatch):
+        monkeypatch.setattr(profiler, "admin_key", "secret")
+        admin = {"X-Admin-Key": "secret"}
+        files = {
+            "file": (
+                "rules.txt",
+                BytesIO(
+                    b"Jo Rules\nEmail: jo@example.com\nAs an AI, I am a team player"
+                ),
+                "text/plain",
+            )
+        }
+
+        assert client.post("/admin/rules/reload").status_code == 403
+        first = client.post("/api/v1/detect/resume", files=files).json()
+        assert first["rule_version"] == default_rules()["version"]
+
+        data = default_rules()
+        data["version"] = "no-indicators"
+        data["ai"]["indicator_patterns"] = []
+        write_rules(rules_file, data)
+        status = client.post("/admin/rules/reload", headers=admin).json()
+        assert status["version"] == "no-indicators"
+
+        files["file"][1].seek(0)
+        second = client.post("/api/v1/detect/resume", files=files).json()
+        assert second["rule_version"] == "no-indicators"
+        assert (
+            second["ai_content_analysis"]["overall_ai_probability"]
+            < first["ai_content_analysis"]["overall_ai_probability"]
+        )
+
+        rules_file.write_text('{"version": "broken"}')
+        response = client.post("/admin/rules/reload", headers=admin)
+        assert response.status_code == 422
+        assert (
+            client.get("/admin/rules", headers=admin).json()["version"]
+            == "no-indicators"
+        )
+        rulebook.last_error = None
@@ -0,0 +1,83 @@
+from io import BytesIO
+from fastapi.testclient import TestClient
+from app.core.cache import cache
+from app.core.rate_limiter import limiter
+from app.core.timing import (
+    Histogram,
+    Span,
+    histograms,
+    request_timings,
+    server_timing_header,
+)
+from app.main import app
+
+
+client = TestClient(app)
+
+
+class TestHistogram:
+    def test_observations_land_in_buckets(self):
+        hist = Histogram("test", bounds=(1, 10, 100))
+        for value in [0.5, 5, 5, 50, 500]:
+            hist.observe(value)
+
+        assert hist.counts == [1, 2, 1, 1]
+        assert hist.count == 5
+        assert hist.sum == 560.5
+
+    def test_quantiles_report_bucket_upper_bound(self):
+        hist = Histogram("test", bounds=(1, 10, 100))
+        for value in [0.5] * 50 + [50] * 45 + [500] * 5:
+            hist.observe(value)
+
+        assert hist.quantile(0.5) == 1
+        assert hist.quantile(0.95) == 100
+        assert hist.quantile(0.99) is None
+        assert Histogram("empty").quantile(0.5) is None
+
+
+class TestSpans:
+    def test_span_records_into_histogram_and_request(self):
+        timings = []
+        token = request_timings.set(timings)
+        try:
+            with Span("unit.span"):
+                pass
+        finally:
+            request_timings.reset(token)
+
+        assert histograms["unit.span"].count >= 1
+        assert [name for name, _ in timings] == ["unit.span"]
+
+    def test_header_sums_repeated_stages(self):
+        header = server_timing_header(
+            [("upstream.email", 10.0), ("upstream.email", 5.5), ("scoring", 1.0)],
+            20.0,
+        )
+        assert header == ("upstream.email;dur=15.50, scoring;dur=1.00, total;dur=20.00")
+
+
+class TestServerTimingHeader:
+    def setup_method(self):
+        limiter.reset()
+
+    def test_every_response_reports_total(self):
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert "total;dur=" in response.headers["server-timing"]
+
+    def test_detection_reports_pipeline_stages(self):
+        cache.clear()
+        file_content = b"Lee Ray\nEmail: lee@example.com\nPhone: (555) 101-2020"
+
+        response = client.post(
+            "/api/v1/detect/resume",
+            files={"file": ("lee.txt", BytesIO(file_content), "text/plain")},
+        )
+
+        assert response.status_code == 200
+        stages = {
+            entry.split(";")[0].strip()
+            for entry in response.headers["server-timing"].split(",")
+        }
+        assert {"extraction", "scoring", "serialization", "total"} <= stages
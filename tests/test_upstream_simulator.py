@@ -0,0 +1,120 @@
+import random
+import statistics
+import httpx
+import pytest
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.services.ai_detection import AIContentDetectionService
+from app.services.contact_verification import ContactVerificationService
+from app.testing.upstream_simulator import (
+    LatencyModel,
+    SimulatorConfig,
+    create_app,
+)
+
+SIMULATOR_URLS = {
+    "ABSTRACT_EMAIL_API": "http://simulator/email/v1/",
+    "ABSTRACT_PHONE_API": "http://simulator/phone/v1/",
+    "ABSTRACT_IP_API": "http://simulator/ip/v1/",
+    "WINSTON_AI_API": "http://simulator/winston/v2/ai-content-detection",
+}
+
+
+def instant(**overrides):
+    services = {
+        name: {"median_ms": 0, "p99_ms": 0}
+        for name in ["email", "phone", "ip", "winston"]
+    }
+    for name, profile in overrides.items():
+        services[name].update(profile)
+    return SimulatorConfig.from_dict({"seed": 7, "services": services})
+
+
+@pytest.fixture
+def simulate(monkeypatch):
+    def install(config):
+        app = create_app(config)
+        for name, url in SIMULATOR_URLS.items():
+            monkeypatch.setattr(settings, name, url)
+        for name in [
+            "ABSTRACT_EMAIL_API_KEY",
+            "ABSTRACT_PHONE_API_KEY",
+            "ABSTRACT_IP_API_KEY",
+            "WINSTON_AI_API_KEY",
+        ]:
+            monkeypatch.setattr(settings, name, "simulator")
+        monkeypatch.setattr(http_client, "transport", httpx.ASGITransport(app=app))
+        monkeypatch.setattr(http_client, "_client", None)
+        return app.state.simulator
+
+    yield install
+    http_client._client = None
+
+
+class TestUpstreamSimulator:
+    def test_latency_model_matches_configured_percentiles(self):
+        model = LatencyModel(median_ms=100, p99_ms=400)
+        rng = random.Random(1)
+        samples = sorted(model.sample(rng) for _ in range(20000))
+
+        assert 90 < statistics.median(samples) < 110
+        assert 330 < samples[int(len(samples) * 0.99)] < 480
+        assert LatencyModel(median_ms=50, p99_ms=50).sample(rng) == 50
+
+    def test_median_only_profiles_keep_a_latency_tail(self):
+        config = SimulatorConfig.from_dict(
+            {"services": {"email": {"median_ms": 2000}, "custom": {"median_ms": 50}}}
+        )
+
+        assert config.services["email"].latency == LatencyModel(2000, 8000)
+        assert config.services["custom"].latency == LatencyModel(50, 200)
+        assert config.services["phone"].latency == LatencyModel(120, 600)
+
+    async def test_services_parse_simulated_responses(self, simulate):
+        simulator = simulate(instant())
+        contact_service = ContactVerificationService()
+
+        email, email_api = await contact_service._verify_email("jo@tempmail.com")
+        phone, phone_api = await contact_service._verify_phone("+1 415 867 5309")
+        ip, ip_api = await contact_service._verify_ip_location("10.0.0.8")
+        ai = await AIContentDetectionService().detect_ai_content(
+            "Results-driven team player."
+        )
+
+        assert email_api and phone_api and ip_api
+        assert email["disposable"] is True
+        assert phone["valid"] is True and phone["country"] == "US"
+        assert ip["is_vpn"] is True and ip["threat_level"] == "medium"
+        assert ai["detection_method"] == "winston_ai"
+        assert simulator.stats()["responses"]["winston"] == {"200": 1}
+
+    async def test_error_rates_force_fallback(self, simulate):
+        simulator = simulate(instant(email={"errors": {"429": 1.0}}))
+
+        result, used_api = await ContactVerificationService()._verify_email(
+            "jo@example.com"
+        )
+
+        assert used_api is False
+        assert result["disposable"] is False
+        assert simulator.stats()["responses"]["email"] == {"429": 1}
+
+    async def test_quota_returns_payment_required(self, simulate):
+        simulator = simulate(instant(phone={"quota": 2}))
+        service = ContactVerificationService()
+
+        outcomes = [
+            (await service._verify_phone("+1 415 867 5309"))[1] for _ in range(3)
+        ]
+
+        assert outcomes == [True, True, False]
+        assert simulator.stats()["responses"]["phone"] == {"200": 2, "402": 1}
+
+    async def test_missing_key_is_unauthorized(self):
+        transport = httpx.ASGITransport(app=create_app(instant()))
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://simulator"
+        ) as client:
+            response = await client.get("/email/v1/", params={"email": "a@b.co"})
+
+        assert response.status_code == 401
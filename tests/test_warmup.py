@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import pytest
+from fastapi.testclient import TestClient
+from app.core.parse_pool import parse_pool
+from app.core.warmup import Warmup, warmup
+from app.main import app
+
+
+class TestWarmup:
+    def test_heavy_modules_are_not_imported_eagerly(self):
+        probe = (
+            "import sys, app.main; "
+            "print(','.join(m for m in ['fitz', 'docx', 'phonenumbers', 'httpx'] "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    @pytest.mark.asyncio
+    async def test_warmup_runs_all_steps(self, monkeypatch):
+        monkeypatch.setattr(parse_pool, "max_workers", 0)
+        state = Warmup()
+
+        await state.run()
+
+        status = state.status()
+        assert status["ready"] is True
+        assert set(status["steps"]) == {
+            "phonenumbers",
+            "email_validator",
+            "patterns",
+            "parse_pool",
+            "http_pool",
+        }
+        assert status["errors"] == {}
+        assert "phonenumbers" in sys.modules
+        assert "fitz" in sys.modules
+
+    def test_readiness_reflects_warmup(self, monkeypatch):
+        client = TestClient(app)
+
+        monkeypatch.setattr(warmup, "ready", False)
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+        assert client.get("/health").status_code == 200
+
+        monkeypatch.setattr(warmup, "ready", True)
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json()["ready"] is True